@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import  Chart
+from .models import Chart, DailyPayload, NatalRecord
 
 
 
@@ -9,3 +9,20 @@ class ChartAdmin(admin.ModelAdmin):
     list_filter = ("timezone", "created_at")
     search_fields = ("name", "place", "user__username", "user__email")
 
+
+
+@admin.register(NatalRecord)
+class NatalRecordAdmin(admin.ModelAdmin):
+    list_display = ("id", "fingerprint", "birth_datetime", "latitude", "longitude", "ayanamsa", "engine_version", "updated_at")
+    list_filter = ("ayanamsa", "engine_version")
+    search_fields = ("fingerprint",)
+    readonly_fields = ("payload",)
+
+
+
+@admin.register(DailyPayload)
+class DailyPayloadAdmin(admin.ModelAdmin):
+    list_display = ("id", "chart", "day", "phase", "inputs_key", "computed_at")
+    list_filter = ("day",)
+    search_fields = ("inputs_key",)
+    readonly_fields = ("payload",)
@@ -3,8 +3,8 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
-from .services.daily_personalizer import assemble_daily, DailyError
-from .i18n import apply_i18n_daily  # ← ensure this import exists
+from .services.daily_personalizer import DailyError
+from .services.daily_cache import daily_payload
 
 class DailyRemediesView(APIView):
     permission_classes = [AllowAny]
@@ -12,11 +12,10 @@ class DailyRemediesView(APIView):
 
     def post(self, request):
         try:
-            payload = assemble_daily(request.data or {})
             # locale preference: explicit ?locale=xx first, then Accept-Language
             locale = request.query_params.get("locale") or None
             accept = request.headers.get("Accept-Language") or None
-            payload = apply_i18n_daily(payload, locale=locale, accept_language=accept)
+            payload = daily_payload(request.data or {}, locale=locale, accept_language=accept)
             return Response(payload, status=200)
         except DailyError as de:
             return Response({"error": str(de)}, status=400)
@@ -1,8 +1,8 @@
 # goastrion-backend/astro/api_views.py
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta, date
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone, date
+from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from rest_framework import status
@@ -11,28 +11,21 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .utils.config import load_config
-from .utils.time import parse_client_iso_to_aware_utc, aware_utc_to_naive
+from .utils.cache import cache_stats
+from .utils.time import parse_client_iso_to_aware_utc
 from .utils.astro import (
-    assign_planets_to_houses,
     build_summary,
     NAKSHATRAS,
     geocode_place,
 )
-from .ephem.swiss import compute_all_planets, get_sign_name, compute_angles
+from .ephem.swiss import get_sign_name
 from .charts.north_indian import render_north_indian_chart_svg
-from .dasha.vimshottari import compute_vimshottari_full, Period, DashaTimeline
+from .dasha.vimshottari import DASHA_LEVELS, Period, DashaTimeline
 from .domain.saturn_watch import saturn_overview
+from .services import shubhdin_engine
 from .services.insights_pipeline import run_insights, InsightsError
-from .shubhdin_helpers import (
-    duration_days,
-    fmt_start_end_duration,
-    best_window,
-    grow_window,
-    non_overlapping_top_windows,
-    dedupe_windows,
-    angle_diff,
-    dates_in_range,
-)
+from .services.natal_store import load_natal
+from .services.shubhdin_engine import ShubhDinInput
 from django.views.decorators.http import require_GET
 from django.http import JsonResponse
 
@@ -41,10 +34,10 @@ from django.http import JsonResponse
 # -----------------------------------------------------------------------------
 @require_GET
 def health(request):
-    return JsonResponse(
-        {"ok": True, "app": "goastrion-backend"},
-        status=200
-    )
+    payload: Dict[str, Any] = {"ok": True, "app": "goastrion-backend"}
+    if request.GET.get("caches"):
+        payload["caches"] = cache_stats()
+    return JsonResponse(payload, status=200)
 
 
 def _serialize_period(p: Period) -> Dict[str, Any]:
@@ -56,13 +49,51 @@ def _serialize_period(p: Period) -> Dict[str, Any]:
     }
 
 
-def _serialize_timeline(tl: DashaTimeline) -> Dict[str, Any]:
-    md_list: List[Dict[str, Any]] = [_serialize_period(p) for p in tl.mahadashas]
-    ad_map: Dict[str, List[Dict[str, Any]]] = {}
-    for md in tl.mahadashas:
-        key = f"{md.lord}@{md.start.replace(tzinfo=timezone.utc).isoformat()}"
-        ad_map[key] = [_serialize_period(p) for p in tl.antardashas.get(key, [])]
-    return {"mahadashas": md_list, "antardashas": ad_map}
+def _serialize_timeline(
+    tl: DashaTimeline, depth: int = 2, start: Optional[datetime] = None, end: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Default: every MD with its ADs. depth (1..4) and a [start, end) window
+    limit the levels and periods that are computed and sent.
+    """
+    levels = tl.levels(depth=depth, start=start, end=end)
+    out: Dict[str, Any] = {"mahadashas": [_serialize_period(p) for p in levels.pop("mahadashas")]}
+    out["antardashas"] = {}
+    for name, children in levels.items():
+        out[name] = {key: [_serialize_period(p) for p in periods] for key, periods in children.items()}
+    return out
+
+
+def _parse_dasha_options(raw: Any) -> Dict[str, Any]:
+    """
+    Optional /chart body field:
+      "dasha": {"depth": 1..4, "from": "YYYY-MM-DD" | ISO, "to": "YYYY-MM-DD" | ISO}
+    Dates are UTC; a bare "to" date includes that whole day. Raises ValueError.
+    """
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise ValueError("dasha must be an object")
+    opts: Dict[str, Any] = {}
+    if raw.get("depth") is not None:
+        depth = int(raw["depth"])
+        if not 1 <= depth <= len(DASHA_LEVELS):
+            raise ValueError(f"dasha.depth must be 1..{len(DASHA_LEVELS)}")
+        opts["depth"] = depth
+    for field, name in (("from", "start"), ("to", "end")):
+        val = str(raw.get(field) or "").strip()
+        if not val:
+            continue
+        if len(val) == 10:
+            day = date.fromisoformat(val)
+            if field == "to":
+                day += timedelta(days=1)
+            opts[name] = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        else:
+            opts[name] = parse_client_iso_to_aware_utc(val)
+    if "start" in opts and "end" in opts and opts["end"] <= opts["start"]:
+        raise ValueError("dasha.to must be after dasha.from")
+    return opts
 
 
 # -----------------------------------------------------------------------------
@@ -122,6 +153,11 @@ class ChartView(APIView):
 
             dt_utc_naive = dt_aw.replace(tzinfo=None)
 
+            try:
+                dasha_opts = _parse_dasha_options(data.get("dasha"))
+            except (TypeError, ValueError) as e:
+                return Response({"error": f"invalid dasha options: {e}"}, status=400)
+
             tz_off_for_chart = 0.0
             tz_off_for_dasha = 0.0
 
@@ -133,10 +169,9 @@ class ChartView(APIView):
             except Exception:
                 warnings.append("Client tz_offset_hours malformed; ignored (using 0.0).")
 
-            # compute planetary positions (sidereal)
-            lagna_deg, planets = compute_all_planets(
-                dt_utc_naive, lat, lon, tz_off_for_chart, ayanamsa="lahiri"
-            )
+            # compute planetary positions (sidereal) once for the whole request
+            natal = load_natal(dt_aw, lat, lon, ayanamsa="lahiri")
+            lagna_deg, planets = natal.asc, dict(natal.positions)
 
             # ==============================================================
             #  PRINT Planet | Sign | Degree (full working version)
@@ -172,27 +207,20 @@ class ChartView(APIView):
             # ==============================================================
 
             lagna_sign = get_sign_name(lagna_deg)
-            bins = assign_planets_to_houses(lagna_deg, planets)
+            bins = natal.houses
 
             svg = render_north_indian_chart_svg(
                 lagna_deg=lagna_deg, lagna_sign=lagna_sign, planets_in_houses=bins, size=420
             )
-            summary = build_summary(dt_utc_naive, lat, lon, tz_off_for_chart)
+            summary = build_summary(dt_utc_naive, lat, lon, tz_off_for_chart, natal=natal)
 
             # Vimshottari
-            tl = compute_vimshottari_full(dt_aw, lat, lon, tz_off_for_dasha, horizon_years=120.0)
-            vim = _serialize_timeline(tl)
+            tl = natal.dasha
+            vim = _serialize_timeline(tl, **dasha_opts)
 
             # Lahiri Moon debug
-            _, pos_dbg = compute_all_planets(
-                dt_utc_naive, lat, lon, tz_off_for_chart, ayanamsa="lahiri"
-            )
-
-            moon_lon = pos_dbg["Moon"]
-            seg = 360.0 / 27.0
-            idx = int(moon_lon // seg) % 27
-            within = moon_lon - (idx * seg)
-            frac = within / seg
+            moon_lon = natal.moon
+            idx, frac = natal.nakshatra()
             start_lords = ["Ketu","Venus","Sun","Moon","Mars","Rahu","Jupiter","Saturn","Mercury"] * 3
             start_lord = start_lords[idx]
             lord_years = {"Ketu":7,"Venus":20,"Sun":6,"Moon":10,"Mars":7,"Rahu":18,"Jupiter":16,"Saturn":19,"Mercury":17}[start_lord]
@@ -297,11 +325,10 @@ class SaturnOverviewView(APIView):
                 dt_aw = datetime.fromisoformat(dt_str).astimezone(timezone.utc)
             except Exception:
                 return Response({"error": "invalid datetime format (use ISO8601)"}, status=400)
-            dt_utc = dt_aw.replace(tzinfo=None)  # Swiss expects naive UTC
 
             # natal angles & planets (Lahiri)
-            angles = compute_angles(dt_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-            _, natal_pos = compute_all_planets(dt_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
+            natal = load_natal(dt_aw, lat, lon, ayanamsa="lahiri")
+            angles, natal_pos = natal.angles(), natal.positions
 
             # start day (anchor)
             anchor = str(data.get("anchor", "today")).lower()
@@ -392,110 +419,17 @@ class ShubhDinRunView(APIView):
       - or legacy: { "datetime": "YYYY-MM-DDTHH:MM:SSZ", "lat": <f>, "lon": <f>, "tz": "Asia/Kolkata", "horizon_months": 12 }
     """
     permission_classes = [AllowAny]
-    _GOAL_KEYS = (
-        "promotion", "job_change", "startup", "property", "marriage",
-        "business_expand", "business_start", "new_relationship"
-    )
-
-    # ---------- i18n helpers ----------
-    @staticmethod
-    def _t(key: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return {"key": key, "args": (args or {})}
-
-    @staticmethod
-    def _headline_t(windows: List[Dict[str, Any]]) -> Dict[str, Any]:
-        spans = [
-            {"start": w["start"], "end": w["end"], "days": int(w.get("duration_days") or 0)}
-            for w in (windows or [])
-        ]
-        return {"key": "sd.headline.best_windows", "args": {"spans": spans}}
-
-    @staticmethod
-    def _aspect_tag_t(p1: str, name: str, p2: str) -> Dict[str, Any]:
-        return {"key": "sd.aspect.tag", "args": {"p1": p1, "name": name, "p2": p2}}
-
-    @staticmethod
-    def _dasha_tag_t(kind: str, lord: str) -> Dict[str, Any]:
-        k = "sd.dasha.md" if kind == "MD" else "sd.dasha.ad"
-        return {"key": k, "args": {"lord": lord}}
-
-    @staticmethod
-    def _no_big_txn_t(dates_iso: List[str], more: int = 0) -> Dict[str, Any]:
-        obj = {"key": "sd.caution.no_big_txn", "args": {"dates": dates_iso}}
-        if more:
-            obj["args"]["more"] = more
-        return obj
-
-    @staticmethod
-    def _normalize_scores_wide(daylist: List[Dict[str, Any]], raw_key: str = "raw", out_key: str = "score") -> None:
-        """
-        Wider, robust normalization:
-          p50 -> ~58, p90 -> ~90, p97 -> ~97; clamp [3, 99]
-        """
-        vals = [float(d.get(raw_key, 0.0)) for d in daylist]
-        if not vals:
-            return
-        sv = sorted(vals)
-        n = len(sv)
-
-        def pct(p: float) -> float:
-            if n == 1:
-                return sv[0]
-            idx = p * (n - 1)
-            lo = int(idx)
-            hi = min(lo + 1, n - 1)
-            frac = idx - lo
-            return sv[lo] * (1 - frac) + sv[hi] * frac
-
-        p50 = pct(0.50)
-        p90 = pct(0.90)
-        p97 = pct(0.97)
-
-        for d in daylist:
-            x = float(d.get(raw_key, 0.0))
-            if x <= p50:
-                denom = max(1e-6, (p50 - sv[0]))
-                z = (x - sv[0]) / denom if denom > 1e-9 else 0.0
-                s = 3 + 55 * max(0.0, min(1.0, z))
-            elif x <= p90:
-                denom = max(1e-6, (p90 - p50))
-                z = (x - p50) / denom
-                s = 58 + 30 * max(0.0, min(1.0, z))
-            else:
-                denom = (p97 - p90) if p97 > p90 else (sv[-1] - p90 + 1e-6)
-                z = (x - p90) / max(1e-6, denom)
-                s = 88 + 11 * max(0.0, min(1.0, z))
-            d[out_key] = round(max(3.0, min(99.0, s)), 2)
-
-    @staticmethod
-    def _format_caution_line_text(iso_list: List[str]) -> str:
-        """Readable single-line dates caution text."""
-        if not iso_list:
-            return ""
-        def fmt(s: str) -> str:
-            y, m, d = [int(x) for x in s.split("-")]
-            return datetime(y, m, d).strftime("%d %b %Y")
-        shown = [fmt(s) for s in iso_list]
-        return (
-            "Please don't finalize deals or make large transactions on: "
-            + ", ".join(shown)
-            + "; use another recommended day."
-        )
 
     def post(self, request):
         try:
             data = request.data or {}
             birth = (data.get("birth") or {}) if isinstance(data.get("birth"), dict) else {}
-            goals = data.get("goals") or list(self._GOAL_KEYS)
+            goals = data.get("goals") or None  # None → every goal
 
             business = (data.get("business") or {}) if isinstance(data.get("business"), dict) else {}
             business_type = (business.get("type") or data.get("business_type") or "other").strip().lower()
 
             tz_str = (data.get("tz") or "Asia/Kolkata").strip() or "Asia/Kolkata"
-            try:
-                USER_TZ = ZoneInfo(tz_str)
-            except Exception:
-                USER_TZ = ZoneInfo("Asia/Kolkata")
 
             # horizon months clamp 1..24
             try:
@@ -503,8 +437,6 @@ class ShubhDinRunView(APIView):
             except Exception:
                 hm = 12
             hm = max(1, min(24, hm))
-            H_DEFAULT = hm * 30
-            H_MARR    = min(24 * 30, max(H_DEFAULT, 18 * 30))  # ensure ~≥18 months for marriage
 
             # ---------- parse input (legacy OR new) ----------
             if "datetime" in data and "lat" in data and "lon" in data:
@@ -518,7 +450,6 @@ class ShubhDinRunView(APIView):
                     return Response({"error": "lat/lon must be numbers"}, status=400)
                 if not (-90 <= lat <= 90 and -180 <= lon <= 180):
                     return Response({"error": "lat/lon out of range"}, status=400)
-                dt_naive_utc = aware_utc_to_naive(dt_aw)
             else:
                 b_date = str(birth.get("date", "")).strip()
                 b_time = str(birth.get("time", "")).strip()
@@ -535,7 +466,6 @@ class ShubhDinRunView(APIView):
                     dt_aw = datetime.fromisoformat(f"{b_date}T{b_time}:00+00:00").astimezone(timezone.utc)
                 except Exception as e:
                     return Response({"error": f"invalid birth date/time: {e}"}, status=400)
-                dt_naive_utc = dt_aw.replace(tzinfo=None)
 
             # ---------- load configs ----------
             try:
@@ -543,659 +473,13 @@ class ShubhDinRunView(APIView):
             except Exception as e:
                 return Response({"error": f"config: {e}"}, status=500)
 
-            # ---------- natal points ----------
-            angles = compute_angles(dt_naive_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-            _, natal_pos = compute_all_planets(dt_naive_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-
-            natal_points: Dict[str, float] = {}
-            if angles.get("Asc") is not None:
-                natal_points["Asc"] = float(angles["Asc"])
-            if angles.get("MC") is not None:
-                natal_points["MC"] = float(angles["MC"])
-            for k, v in natal_pos.items():
-                natal_points[str(k)] = float(v)
-
-            # ---------- Vimshottari timeline (MD/AD) ----------
-            try:
-                tl = compute_vimshottari_full(dt_aw, lat, lon, 0.0, horizon_years=120.0)
-                md_periods: List[Tuple[date, date, str]] = []
-                ad_periods: List[Tuple[date, date, str]] = []
-                for p in getattr(tl, "mahadashas", []):
-                    s = p.start.date(); e = p.end.date()
-                    md_periods.append((s, e, p.lord))
-                    key = f"{p.lord}@{p.start.replace(tzinfo=timezone.utc).isoformat()}"
-                    for ad in getattr(tl, "antardashas", {}).get(key, []):
-                        ad_periods.append((ad.start.date(), ad.end.date(), ad.lord))
-            except Exception:
-                md_periods, ad_periods = [], []
-
-            today_local = datetime.now(USER_TZ).date()
-
-            def local_date_to_naive_utc(d: date, hour_local: int = 9) -> datetime:
-                dt_local = datetime(d.year, d.month, d.day, hour_local, 0, 0, tzinfo=USER_TZ)
-                dt_aw_utc = dt_local.astimezone(timezone.utc)
-                return dt_aw_utc.replace(tzinfo=None)
-
-            def dasha_lords_for_date(d: date) -> Tuple[Optional[str], Optional[str]]:
-                md = None; ad = None
-                for s, e, lord in md_periods:
-                    if s <= d <= e:
-                        md = lord
-                        break
-                if md:
-                    for s, e, lord in ad_periods:
-                        if s <= d <= e:
-                            ad = lord
-                            break
-                return md, ad
-
-            ASPECTS = [
-                ("Conjunction", 0.0,   4.0, 1.00),
-                ("Sextile",     60.0,  2.0, 0.85),
-                ("Square",      90.0,  2.0, 0.65),
-                ("Trine",       120.0, 3.0, 1.00),
-                ("Opposition",  180.0, 3.0, 0.85),
-            ]
-            benefics = set(aspect_cfg.get("benefics", []))
-            malefics = set(aspect_cfg.get("malefics", []))
-
-            def aspect_hit(delta: float) -> Optional[Tuple[str, float]]:
-                best: Optional[Tuple[str, float]] = None
-                for name, ang, orb, base in ASPECTS:
-                    diff = abs(delta - ang)
-                    if diff <= orb or abs(diff - 360.0) <= orb:
-                        taper = max(0.0, 1.0 - (min(diff, 360.0 - diff) / orb))
-                        strength = base * (0.6 + 0.4 * taper)
-                        if best is None or strength > best[1]:
-                            best = (name, strength)
-                return best
-
-            def day_score_base(d: date) -> Tuple[float, Dict[str, Any]]:
-                dt = local_date_to_naive_utc(d, hour_local=9)
-                _, tpos = compute_all_planets(dt, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-
-                sun = float(tpos.get("Sun", 0.0))
-                merc = float(tpos.get("Mercury", 0.0))
-                combust = angle_diff(sun, merc) <= 8.0
-
-                transiting_planets = [
-                    p for p in ("Sun","Moon","Mercury","Venus","Mars","Jupiter","Saturn","Rahu","Ketu") if p in tpos
-                ]
-
-                raw = 0.0
-                tag_buf: List[str] = []
-                tag_t_buf: List[Dict[str, Any]] = []
-
-                for p in transiting_planets:
-                    p_deg = float(tpos[p])
-                    for tgt, natal_deg in natal_points.items():
-                        delta = angle_diff(p_deg, float(natal_deg))
-                        hit = aspect_hit(delta)
-                        if not hit:
-                            continue
-                        a_name, a_strength = hit
-                        if p in benefics:
-                            w = 1.00
-                        elif p in malefics:
-                            w = 0.70
-                        else:
-                            w = 0.85
-                        contrib = a_strength * w
-                        raw += contrib
-                        if a_name in ("Trine", "Sextile") and contrib >= 0.60:
-                            tag_buf.append(f"{p} {a_name} -> {tgt}")
-                            tag_t_buf.append(self._aspect_tag_t(p, a_name, tgt))
-
-                md_lord, ad_lord = dasha_lords_for_date(d)
-                tags = list(dict.fromkeys(tag_buf))[:4]
-                tags_t = tag_t_buf[:4]
-
-                meta = {
-                    "tags": tags,
-                    "tags_t": tags_t,
-                    "hits": {"_source": "t->n local"},
-                    "flags": {"combust": combust},
-                    "dasha": {"md": md_lord, "ad": ad_lord}
-                }
-                return (raw, meta)
-
-            # horizons per goal
-            H_PROMO   = H_DEFAULT
-            H_JOB     = H_DEFAULT
-            H_PROP    = H_DEFAULT
-            H_STARTUP = H_DEFAULT
-            H_EXPAND  = H_DEFAULT
-            H_REL     = H_DEFAULT
-
-            # Saturn context for multipliers
-            H_MAX = max(H_PROMO, H_JOB, H_PROP, H_STARTUP, H_EXPAND, H_REL, H_MARR)
-
-            try:
-                sat_cap_days = int(data.get("saturn_cap_days", 365))
-            except Exception:
-                sat_cap_days = 365
-            SATURN_RANGE_DAYS = min(H_MAX, max(30, sat_cap_days))  # noqa: F841 (kept for clarity)
-
-            try:
-                sat_ctx = saturn_overview(
-                    today_local=today_local,
-                    horizon_days=H_MAX,
-                    moon_natal_deg=float(natal_pos["Moon"]),
-                    asc_natal_deg=float(natal_points.get("Asc")) if "Asc" in natal_points else None,
-                    mc_natal_deg=float(natal_points.get("MC")) if "MC" in natal_points else None,
-                    lat=lat, lon=lon, user_tz_str=tz_str, ayanamsa="lahiri",
-                ) or {}
-            except Exception:
-                sat_ctx = {}
-
-            def _collect_windows(section: str) -> List[Tuple[str, str]]:
-                wins: List[Tuple[str, str]] = []
-                sec = sat_ctx.get(section)
-                if isinstance(sec, dict):
-                    for w in (sec.get("windows") or []):
-                        a = w.get("start"); b = w.get("end")
-                        if a and b: wins.append((a, b))
-                return wins
-
-            def _collect_days_in_windows(wins: List[Tuple[str, str]]) -> set[str]:
-                if not wins:
-                    return set()
-                out: set[str] = set()
-                cur = today_local
-                end = today_local + timedelta(days=H_MAX)
-                while cur <= end:
-                    iso = cur.isoformat()
-                    for a, b in wins:
-                        if a <= iso <= b:
-                            out.add(iso); break
-                    cur += timedelta(days=1)
-                return out
-
-            def _collect_station_days_from_ss() -> set[str]:
-                out: set[str] = set()
-                ss = (sat_ctx.get("sade_sati") or {})
-                for w in ss.get("windows", []):
-                    for d in (w.get("stations") or []):
-                        if isinstance(d, str): out.add(d)
-                return out
-
-            SS_WINS        = _collect_windows("sade_sati")
-            RETRO_WINS_RAW = (sat_ctx.get("retrograde") or [])
-            RETRO_WINS     = [(w.get("start"), w.get("end")) for w in RETRO_WINS_RAW if w.get("start") and w.get("end")]
-            ASHTAMA_WINS   = _collect_windows("ashtama")
-            KANTAKA_WINS   = _collect_windows("kantaka")
-
-            SS_STATION_DAYS = _collect_station_days_from_ss()
-            SS_DAYS         = _collect_days_in_windows(SS_WINS)
-            RETRO_DAYS      = _collect_days_in_windows(RETRO_WINS)
-            ASHTAMA_DAYS    = _collect_days_in_windows(ASHTAMA_WINS)
-            KANTAKA_DAYS    = _collect_days_in_windows(KANTAKA_WINS)
-
-            def _collect_hit_days(key: str) -> set[str]:
-                out: set[str] = set()
-                for it in (sat_ctx.get(key) or []):
-                    d = it.get("date")
-                    if isinstance(d, str): out.add(d)
-                return out
-
-            SAT_SUPPORT_DAYS = _collect_hit_days("support_hits")
-            SAT_STRESS_DAYS  = _collect_hit_days("stress_hits")
-
-            def saturn_multiplier_for(goal: str, d_iso: str) -> Tuple[float, List[str]]:
-                m = 1.0
-                tags: List[str] = []
-                if d_iso in SS_STATION_DAYS:
-                    m *= 0.95; tags.append("Saturn Station")
-                if d_iso in SS_DAYS:
-                    tags.append("Sade Sati")
-                    goal_penalty = {
-                        "promotion":0.96,"job_change":0.96,"marriage":0.97,"new_relationship":0.97
-                    }.get(goal, 0.98)
-                    m *= goal_penalty
-                if d_iso in RETRO_DAYS:
-                    m *= 0.98; tags.append("Saturn Retro")
-                if d_iso in ASHTAMA_DAYS or d_iso in KANTAKA_DAYS:
-                    m *= 0.97
-                    if d_iso in ASHTAMA_DAYS: tags.append("Ashtama (Saturn)")
-                    if d_iso in KANTAKA_DAYS: tags.append("Kantaka (Saturn)")
-                if d_iso in SAT_SUPPORT_DAYS:
-                    m *= 1.04; tags.append("Saturn Support")
-                if d_iso in SAT_STRESS_DAYS:
-                    m *= 0.96; tags.append("Saturn Stress")
-                return m, tags
-
-            def best_day_within(days: List[Dict[str, Any]], start_iso: str, end_iso: str) -> Optional[Dict[str, Any]]:
-                slice_days = [d for d in days if start_iso <= d["date"] <= end_iso]
-                if not slice_days:
-                    return None
-                bd = max(slice_days, key=lambda x: x["score"])
-                md = bd.get("meta", {}).get("dasha", {}).get("md")
-                ad = bd.get("meta", {}).get("dasha", {}).get("ad")
-                tags = bd.get("meta", {}).get("tags", [])
-                tags_t = bd.get("meta", {}).get("tags_t", [])
-                if md:
-                    tags.append(f"MD:{md}")
-                    tags_t.append(self._dasha_tag_t("MD", md))
-                if ad:
-                    tags.append(f"AD:{ad}")
-                    tags_t.append(self._dasha_tag_t("AD", ad))
-                return {
-                    "date": bd["date"],
-                    "score": bd["score"],
-                    "tags": tags[:5],
-                    "tags_t": tags_t[:5],
-                }
-
-            def _cap_dates(dates_list: List[str], n: int = 10) -> Tuple[List[str], int]:
-                return (dates_list[:n], max(0, len(dates_list) - n))
-
-            # Sweep with Dasha + Saturn multipliers
-            def dasha_multiplier(goal: str, md: Optional[str], ad: Optional[str]) -> float:
-                support = {
-                    "promotion":        {"Sun","Saturn","Mercury","Jupiter"},
-                    "job_change":       {"Mercury","Jupiter","Mars","Sun"},
-                    "startup":          {"Jupiter","Mercury","Sun","Venus"},
-                    "property":         {"Venus","Saturn","Jupiter","Moon"},
-                    "marriage":         {"Venus","Moon","Jupiter"},
-                    "business_expand":  {"Jupiter","Mercury","Venus","Sun"},
-                    "business_start":   {"Jupiter","Mercury","Venus","Sun"},
-                    "new_relationship": {"Venus","Moon","Jupiter"},
-                }
-                contra = {
-                    "promotion":        {"Rahu","Ketu"},
-                    "job_change":       {"Rahu","Ketu"},
-                    "startup":          {"Saturn","Rahu","Ketu"},
-                    "property":         {"Mars","Rahu","Ketu"},
-                    "marriage":         {"Saturn","Mars","Rahu","Ketu"},
-                    "business_expand":  {"Rahu","Ketu","Saturn"},
-                    "business_start":   {"Rahu","Ketu","Saturn"},
-                    "new_relationship": {"Saturn","Mars","Rahu","Ketu"},
-                }
-                sup = support.get(goal, set()); con = contra.get(goal, set())
-                m = 1.0
-                if md in sup: m *= 1.20
-                if ad in sup: m *= 1.10
-                if md in con: m *= 0.90
-                if ad in con: m *= 0.95
-                return m
-
-            def sweep_goal(goal: str, days_count: int) -> List[Dict[str, Any]]:
-                out: List[Dict[str, Any]] = []
-                for i in range(days_count):
-                    d_local = today_local + timedelta(days=i)
-                    raw, meta = day_score_base(d_local)
-
-                    # mild downweight if no personal benefic tag
-                    def has_personal_benefic(tags: List[str]) -> bool:
-                        return any((t.split(" ")[0] in {"Jupiter","Venus","Moon"}) for t in tags)
-                    if not has_personal_benefic(meta.get("tags", [])):
-                        raw *= 0.8
-
-                    md_lord = meta.get("dasha", {}).get("md")
-                    ad_lord = meta.get("dasha", {}).get("ad")
-                    dasha_mult = dasha_multiplier(goal, md_lord, ad_lord)
-
-                    d_iso = d_local.isoformat()
-                    sat_mult, sat_tags = saturn_multiplier_for(goal, d_iso)
-
-                    meta_tags = (meta.get("tags") or []) + sat_tags
-                    meta["tags"] = list(dict.fromkeys(meta_tags))[:5]
-
-                    out.append({"date": d_iso, "raw": raw * dasha_mult * sat_mult, "meta": meta})
-                self._normalize_scores_wide(out, raw_key="raw", out_key="score")
-                return out
-
-            results: List[Dict[str, Any]] = []
-
-            # ---------------- Promotion ----------------
-            if "promotion" in goals:
-                promo_days = sweep_goal("promotion", H_PROMO)
-                promo_win: List[Dict[str, Any]] = []
-                seed = best_window(promo_days, span=7)
-                if seed:
-                    si, ei = grow_window(promo_days, seed["si"], seed["ei"], cutoff=60.0, patience=3)
-                    a_iso, b_iso = promo_days[si]["date"], promo_days[ei]["date"]
-                    promo_win = [{"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)}]
-                promo_win = dedupe_windows(promo_win, limit=1)
-                headline_t = self._headline_t(promo_win)
-
-                top_date_line: List[Dict[str, Any]] = []
-                if promo_win:
-                    bd = best_day_within(promo_days, promo_win[0]["start"], promo_win[0]["end"])
-                    if bd: top_date_line = [bd]
-
-                # Saturn station cautions (capped)
-                caution_days: List[str] = []
-                for w in promo_win:
-                    for d in dates_in_range(promo_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = [self._t("sd.caution.rahukaal", {"start": "16:30", "end": "17:15"})]
-                if shown:
-                    cautions_t.append(self._no_big_txn_t(shown, more))
-
-                results.append({
-                    "goal": "promotion",
-                    "headline_t": headline_t,
-                    "score": int(top_date_line[0]["score"]) if top_date_line else int(max((d["score"] for d in promo_days), default=0)),
-                    "confidence": "medium" if promo_win else "low",
-                    "dates": top_date_line,
-                    "windows": promo_win,
-                    "explain_t": [self._t("sd.explain.career_houses")] + (
-                        [self._t("sd.explain.leverage_date", {"date": top_date_line[0]["date"]})] if top_date_line else []
-                    ),
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- Job change ----------------
-            if "job_change" in goals:
-                job_days = sweep_goal("job_change", H_JOB)
-                picked = non_overlapping_top_windows(job_days, span=7, k=2)
-                job_wins: List[Dict[str, Any]] = []
-                for w in picked:
-                    si, ei = grow_window(job_days, w["si_orig"], w["ei_orig"], cutoff=60.0, patience=3)
-                    a_iso, b_iso = job_days[si]["date"], job_days[ei]["date"]
-                    job_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                job_wins = dedupe_windows(job_wins, limit=2)
-                headline_t = self._headline_t(job_wins)
-
-                top_date_line = []
-                if job_wins:
-                    bd = best_day_within(job_days, job_wins[0]["start"], job_wins[0]["end"])
-                    if bd: top_date_line = [bd]
-
-                caution_days = []
-                for w in job_wins:
-                    for d in dates_in_range(job_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = [self._t("sd.caution.watch_combust")]
-                if shown:
-                    cautions_t.append(self._no_big_txn_t(shown, more))
-
-                results.append({
-                    "goal": "job_change",
-                    "headline_t": headline_t,
-                    "score": int(top_date_line[0]["score"]) if top_date_line else int(max((d["score"] for d in job_days), default=0)),
-                    "confidence": "medium" if job_wins else "low",
-                    "dates": top_date_line,
-                    "windows": job_wins,
-                    "explain_t": [self._t("sd.explain.jobchange_core")],
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- Startup ----------------
-            if "startup" in goals:
-                startup_days = sweep_goal("startup", H_STARTUP)
-                startup_wins: List[Dict[str, Any]] = []
-                best_line: List[Dict[str, Any]] = []
-                if startup_days:
-                    span = min(45, len(startup_days))
-                    seed = best_window(startup_days, span=span)
-                    if seed:
-                        si, ei = grow_window(startup_days, seed["si"], seed["ei"], cutoff=62.0, patience=4)
-                        a_iso, b_iso = startup_days[si]["date"], startup_days[ei]["date"]
-                        startup_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                startup_wins = dedupe_windows(startup_wins, limit=1)
-                headline_t = self._headline_t(startup_wins)
-
-                if startup_wins:
-                    bd = best_day_within(startup_days, startup_wins[0]["start"], startup_wins[0]["end"])
-                    if bd: best_line = [bd]
-
-                results.append({
-                    "goal": "startup",
-                    "headline_t": headline_t,
-                    "score": int(best_line[0]["score"]) if best_line else int(max((d["score"] for d in startup_days), default=0)),
-                    "confidence": "medium" if startup_wins else "low",
-                    "dates": best_line,
-                    "windows": startup_wins,
-                    "explain_t": [
-                        self._t("sd.explain.startup_green"),
-                    ] + (
-                        [self._t("sd.explain.incop_near", {"date": best_line[0]["date"]})] if best_line else []
-                    ),
-                    "cautions_t": [],
-                    "caution_days": []
-                })
-
-            # ---------------- Property ----------------
-            if "property" in goals:
-                prop_days = sweep_goal("property", H_PROP)
-                picked_prop = non_overlapping_top_windows(prop_days, span=3, k=3)
-                prop_wins: List[Dict[str, Any]] = []
-                for w in picked_prop:
-                    si, ei = grow_window(prop_days, w["si_orig"], w["ei_orig"], cutoff=60.0, patience=2)
-                    a_iso, b_iso = prop_days[si]["date"], prop_days[ei]["date"]
-                    prop_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                prop_wins = dedupe_windows(prop_wins, limit=3)
-                headline_t = self._headline_t(prop_wins)
-
-                top_date_line: List[Dict[str, Any]] = []
-                if prop_wins:
-                    bd = best_day_within(prop_days, prop_wins[0]["start"], prop_wins[0]["end"])
-                    if bd: top_date_line = [bd]
-
-                caution_days = []
-                for w in prop_wins:
-                    for d in dates_in_range(prop_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = [self._t("sd.caution.skip_rahukaal_gulika")]
-                if shown:
-                    cautions_t.append(self._no_big_txn_t(shown, more))
-
-                results.append({
-                    "goal": "property",
-                    "headline_t": headline_t,
-                    "score": int(top_date_line[0]["score"]) if top_date_line else int(max((d["score"] for d in prop_days), default=0)),
-                    "confidence": "high" if prop_wins else "low",
-                    "dates": top_date_line,
-                    "windows": prop_wins,
-                    "explain_t": [self._t("sd.explain.property_core")],
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- Marriage ----------------
-            if "marriage" in goals:
-                marr_days = sweep_goal("marriage", H_MARR)
-                marr_wins: List[Dict[str, Any]] = []
-                if marr_days:
-                    seed = best_window(marr_days, span=24)
-                    if seed:
-                        si, ei = grow_window(marr_days, seed["si"], seed["ei"], cutoff=60.0, patience=4)
-                        a_iso, b_iso = marr_days[si]["date"], marr_days[ei]["date"]
-                        marr_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                marr_wins = dedupe_windows(marr_wins, limit=1)
-                headline_t = self._headline_t(marr_wins)
-
-                best_line: List[Dict[str, Any]] = []
-                if marr_wins:
-                    bd = best_day_within(marr_days, marr_wins[0]["start"], marr_wins[0]["end"])
-                    if bd: best_line = [bd]
-
-                caution_days = []
-                for w in marr_wins:
-                    for d in dates_in_range(marr_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = ([self._no_big_txn_t(shown, more)] if shown else [])
-
-                explain_t = [self._t("sd.explain.marriage_core")]
-                if best_line:
-                    explain_t.append(self._t("sd.explain.particularly_good", {"date": best_line[0]["date"]}))
-
-                results.append({
-                    "goal": "marriage",
-                    "headline_t": headline_t,
-                    "score": int(best_line[0]["score"]) if best_line else int(max((d["score"] for d in marr_days), default=0)),
-                    "confidence": "medium" if marr_wins else "low",
-                    "dates": best_line,
-                    "windows": marr_wins,
-                    "explain_t": explain_t,
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- Business: Expand ----------------
-            if "business_expand" in goals:
-                expand_days = sweep_goal("business_expand", H_EXPAND)
-                picked_exp = non_overlapping_top_windows(expand_days, span=21, k=2)
-                expand_wins: List[Dict[str, Any]] = []
-                for w in picked_exp:
-                    si, ei = grow_window(expand_days, w["si_orig"], w["ei_orig"], cutoff=62.0, patience=4)
-                    a_iso, b_iso = expand_days[si]["date"], expand_days[ei]["date"]
-                    expand_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                expand_wins = dedupe_windows(expand_wins, limit=2)
-                headline_t = self._headline_t(expand_wins)
-
-                top_date_line: List[Dict[str, Any]] = []
-                if expand_wins:
-                    bd = best_day_within(expand_days, expand_wins[0]["start"], expand_wins[0]["end"])
-                    if bd: top_date_line = [bd]
-
-                caution_days = []
-                for w in expand_wins:
-                    for d in dates_in_range(expand_days, w["start"], w["end"]):
-                        if d.get("meta", {}).get("flags", {}).get("combust"):
-                            caution_days.append(d["date"])
-                for w in expand_wins:
-                    for d in dates_in_range(expand_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = ([self._no_big_txn_t(shown, more)] if shown else [])
-
-                results.append({
-                    "goal": "business_expand",
-                    "headline_t": headline_t,
-                    "score": int(top_date_line[0]["score"]) if top_date_line else int(max((d["score"] for d in expand_days), default=0)),
-                    "confidence": "medium" if expand_wins else "low",
-                    "dates": top_date_line,
-                    "windows": expand_wins,
-                    "explain_t": [
-                        self._t("sd.explain.expand_core"),
-                        self._t("sd.explain.use_spans_launches"),
-                    ],
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- Business: Start ----------------
-            if "business_start" in goals:
-                start_days = sweep_goal("business_start", H_STARTUP)
-                span_by_type = {
-                    "tech": 45, "ecom": 40, "retail": 28, "services": 40,
-                    "manufacturing": 60, "real_estate": 50, "other": 40
-                }
-                base_span = span_by_type.get(business_type, 40)
-                span = min(base_span, len(start_days)) if start_days else 0
-
-                start_wins: List[Dict[str, Any]] = []
-                if span >= 1:
-                    seeds = non_overlapping_top_windows(start_days, span=span, k=2)
-                    for s in seeds:
-                        si, ei = grow_window(start_days, s["si_orig"], s["ei_orig"], cutoff=62.0, patience=4)
-                        a_iso, b_iso = start_days[si]["date"], start_days[ei]["date"]
-                        start_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                start_wins = dedupe_windows(start_wins, limit=2)
-                headline_t = self._headline_t(start_wins)
-
-                best_line: List[Dict[str, Any]] = []
-                if start_wins:
-                    bd = best_day_within(start_days, start_wins[0]["start"], start_wins[0]["end"])
-                    if bd: best_line = [bd]
-
-                type_nice = {
-                    "tech": "Tech / SaaS",
-                    "ecom": "E-commerce",
-                    "retail": "Retail",
-                    "services": "Services",
-                    "manufacturing": "Manufacturing",
-                    "real_estate": "Real Estate"
-                }.get(business_type, "Business")
-
-                expl_t = [self._t("sd.explain.start_core_typed", {"type": business_type})]
-                if best_line:
-                    expl_t.append(self._t("sd.explain.incop_commence_near", {"date": best_line[0]["date"]}))
-
-                caution_days = []
-                for w in start_wins:
-                    for d in dates_in_range(start_days, w["start"], w["end"]):
-                        if d.get("meta", {}).get("flags", {}).get("combust"):
-                            caution_days.append(d["date"])
-                for w in start_wins:
-                    for d in dates_in_range(start_days, w["start"], w["end"]):
-                        if d["date"] in SS_STATION_DAYS:
-                            caution_days.append(d["date"])
-                caution_days = sorted(set(caution_days))
-                shown, more = _cap_dates(caution_days, n=10)
-                cautions_t = ([self._no_big_txn_t(shown, more)] if shown else [])
-
-                results.append({
-                    "goal": "business_start",
-                    "headline_t": headline_t,
-                    "score": int(best_line[0]["score"]) if best_line else int(max((d["score"] for d in start_days), default=0)),
-                    "confidence": "medium" if start_wins else "low",
-                    "dates": best_line,
-                    "windows": start_wins,
-                    "explain_t": expl_t,
-                    "cautions_t": cautions_t,
-                    "caution_days": caution_days
-                })
-
-            # ---------------- New Relationship ----------------
-            if "new_relationship" in goals:
-                rel_days = sweep_goal("new_relationship", H_REL)
-                seeds = non_overlapping_top_windows(rel_days, span=10, k=2)
-                rel_wins: List[Dict[str, Any]] = []
-                for s in seeds:
-                    si, ei = grow_window(rel_days, s["si_orig"], s["ei_orig"], cutoff=58.0, patience=4)
-                    a_iso, b_iso = rel_days[si]["date"], rel_days[ei]["date"]
-                    rel_wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
-                rel_wins = dedupe_windows(rel_wins, limit=2)
-                headline_t = self._headline_t(rel_wins)
-
-                best_line: List[Dict[str, Any]] = []
-                if rel_wins:
-                    bd = best_day_within(rel_days, rel_wins[0]["start"], rel_wins[0]["end"])
-                    if bd: best_line = [bd]
-
-                results.append({
-                    "goal": "new_relationship",
-                    "headline_t": headline_t,
-                    "score": int(best_line[0]["score"]) if best_line else int(max((d["score"] for d in rel_days), default=0)),
-                    "confidence": "medium" if rel_wins else "low",
-                    "dates": best_line,
-                    "windows": rel_wins,
-                    "explain_t": [
-                        self._t("sd.explain.relationship_core"),
-                        self._t("sd.explain.use_spans_social"),
-                    ],
-                    "cautions_t": [],
-                    "caution_days": []
-                })
-
-            return Response({
-                "query_id": "qd_shubhdin_v1",
-                "generated_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-                "tz": tz_str,
-                "horizon_months": hm,
-                "confidence_overall": "medium",
-                "results": results
-            }, status=200)
+            if isinstance(goals, str):
+                goals = goals.split(",")
+            inp = ShubhDinInput(
+                dt_aw=dt_aw, lat=lat, lon=lon, tz_str=tz_str, horizon_months=hm,
+                goals=[str(g).strip() for g in goals] if goals else None, business_type=business_type,
+            )
+            return Response(shubhdin_engine.run(inp, aspect_cfg=aspect_cfg), status=200)
 
         except Exception as e:
             return Response({"error": str(e)}, status=500)
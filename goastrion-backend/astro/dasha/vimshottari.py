@@ -1,8 +1,11 @@
 #goastrion-backend/astro/dasha/vimshottari.py
 from __future__ import annotations
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Tuple, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, List, Dict, Mapping, Tuple, Optional
+
+import numpy as np
 
 # Reuse your existing helpers
 from ..ephem.swiss import compute_all_planets
@@ -28,19 +31,235 @@ NAKSHATRA_LORDS: List[str] = [
 # Sidereal year length (commonly used for Vimshottari timing)
 VIMSOTTARI_YEAR_DAYS: float = 365.258756
 
+DASHA_INDEX: Dict[str, int] = {lord: i for i, lord in enumerate(DASHA_ORDER)}
+
+# Nesting levels, outermost first (depth = how many of these to expand)
+DASHA_LEVELS: Tuple[str, ...] = ("mahadashas", "antardashas", "pratyantardashas", "sookshmas")
+
 # --- Data models -------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Period:
     lord: str
     start: datetime
     end: datetime
     years: float  # duration in years (float)
+    # derived once, for lookups: DASHA_ORDER index and boundaries as epoch seconds (naive = UTC)
+    lord_idx: int = field(init=False, repr=False, compare=False)
+    t_start: float = field(init=False, repr=False, compare=False)
+    t_end: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "lord_idx", DASHA_INDEX.get(self.lord, -1))
+        object.__setattr__(self, "t_start", _epoch(self.start))
+        object.__setattr__(self, "t_end", _epoch(self.end))
 
 @dataclass
 class DashaTimeline:
     mahadashas: List[Period]
-    antardashas: Dict[str, List[Period]]  # key = "<MD_lord>@<start_iso>"
+    antardashas: Mapping[str, List[Period]]  # key = "<MD_lord>@<start_iso>"
+    _index: Optional["DashaIndex"] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def index(self) -> "DashaIndex":
+        """Bisect index over the periods, built on first use."""
+        if self._index is None:
+            self._index = DashaIndex(self)
+        return self._index
+
+    def at(self, when: datetime) -> Tuple[Optional[Period], Optional[Period], Optional[Period]]:
+        """(MD, AD, PD) periods running at an instant (naive = UTC)."""
+        return self.index.at(when)
+
+    def on(self, day: date) -> Tuple[Optional[Period], Optional[Period], Optional[Period]]:
+        """(MD, AD, PD) periods for a calendar day (inclusive; a boundary day goes to the earlier period)."""
+        return self.index.on(day)
+
+    def lords_on(self, day: date) -> Tuple[Optional[str], Optional[str]]:
+        """(MD lord, AD lord) for a calendar day."""
+        md, ad, _ = self.index.on(day, depth=2)
+        return (md.lord if md else None), (ad.lord if ad else None)
+
+    def antardashas_of(self, md_index: int) -> List[Period]:
+        """ADs of the md_index-th MD (no string key needed)."""
+        ads = self.antardashas
+        if isinstance(ads, LazyAntardashas):
+            return ads.by_index(md_index)
+        return ads.get(_fmt_key(self.mahadashas[md_index]), [])
+
+    def levels(
+        self, depth: int = 2, start: Optional[datetime] = None, end: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Periods overlapping [start, end) down to `depth` levels (1..4):
+          {"mahadashas": [MD...], "antardashas": {md_key: [AD...]}, "pratyantardashas": {ad_key: [PD...]}, ...}
+        Only the sub-periods of periods inside the window are computed.
+        """
+        t0 = _epoch(start) if start is not None else None
+        t1 = _epoch(end) if end is not None else None
+
+        def inside(periods: List[Period]) -> List[Period]:
+            return [p for p in periods if (t1 is None or p.t_start < t1) and (t0 is None or p.t_end > t0)]
+
+        mds = [(i, md) for i, md in enumerate(self.mahadashas)
+               if (t1 is None or md.t_start < t1) and (t0 is None or md.t_end > t0)]
+        out: Dict[str, Any] = {DASHA_LEVELS[0]: [md for _, md in mds]}
+        parents: List[Period] = []
+        if depth >= 2:
+            out[DASHA_LEVELS[1]] = {_fmt_key(md): inside(self.antardashas_of(i)) for i, md in mds}
+            parents = [ad for ads in out[DASHA_LEVELS[1]].values() for ad in ads]
+        for level in DASHA_LEVELS[2:max(2, min(depth, len(DASHA_LEVELS)))]:
+            out[level] = {_fmt_key(p): inside(compute_sub_periods(p)) for p in parents}
+            parents = [c for subs in out[level].values() for c in subs]
+        return out
+
+
+class LazyAntardashas(Mapping):
+    """
+    The antardashas mapping ("<MD_lord>@<start_iso>" -> [AD...]) held as a list
+    per MD index; lists are computed on first access unless seeded (e.g. from a
+    stored payload). The string keys are only built for the Mapping view.
+    """
+    __slots__ = ("_mds", "_ads", "_keys")
+
+    def __init__(self, mahadashas: List[Period], seeded: Optional[List[List[Period]]] = None):
+        self._mds = mahadashas
+        self._ads: List[Optional[List[Period]]] = list(seeded) if seeded is not None else [None] * len(mahadashas)
+        self._keys: Optional[Dict[str, int]] = None
+
+    def by_index(self, i: int) -> List[Period]:
+        ads = self._ads[i]
+        if ads is None:
+            ads = self._ads[i] = compute_antardashas_for_mahadasha(self._mds[i])
+        return ads
+
+    def __getitem__(self, key: str) -> List[Period]:
+        if self._keys is None:
+            self._keys = {_fmt_key(md): i for i, md in enumerate(self._mds)}
+        return self.by_index(self._keys[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return (_fmt_key(md) for md in self._mds)
+
+    def __len__(self) -> int:
+        return len(self._mds)
+
+
+class DashaIndex:
+    """
+    Sorted boundary arrays over a DashaTimeline. Each level is a bisect inside
+    its parent's children: MDs are indexed up front, the ADs of an MD and the
+    PDs of an AD when first reached. lord_indices_on() resolves a whole day
+    array with np.searchsorted, one parent at a time.
+    """
+    __slots__ = ("tl", "mds", "_md", "_ads", "_pds")
+
+    def __init__(self, tl: DashaTimeline):
+        self.tl = tl
+        self.mds: List[Period] = list(tl.mahadashas)
+        self._md = _Table(self.mds)
+        self._ads: Dict[int, _Table] = {}                 # MD index -> its ADs
+        self._pds: Dict[Tuple[int, int], _Table] = {}     # (MD, AD) index -> its PDs
+
+    def _ad_table(self, i: int) -> "_Table":
+        if i not in self._ads:
+            self._ads[i] = _Table(self.tl.antardashas_of(i))
+        return self._ads[i]
+
+    def _pd_table(self, i: int, j: int) -> "_Table":
+        if (i, j) not in self._pds:
+            self._pds[(i, j)] = _Table(compute_sub_periods(self._ad_table(i).periods[j]))
+        return self._pds[(i, j)]
+
+    # ---- single lookups ----
+
+    def at(self, when: datetime, depth: int = 3):
+        t = _epoch(when)
+        return self._walk(depth, lambda tab: tab.find_instant(t))
+
+    def on(self, day: date, depth: int = 3):
+        d = day.toordinal()
+        return self._walk(depth, lambda tab: tab.find_day(d))
+
+    def _walk(self, depth: int, find) -> Tuple[Optional[Period], Optional[Period], Optional[Period]]:
+        out: List[Optional[Period]] = [None, None, None]
+        i = find(self._md)
+        if i < 0:
+            return tuple(out)
+        out[0] = self.mds[i]
+        if depth >= 2:
+            j = find(self._ad_table(i))
+            if j >= 0:
+                out[1] = self._ad_table(i).periods[j]
+                if depth >= 3:
+                    k = find(self._pd_table(i, j))
+                    out[2] = self._pd_table(i, j).periods[k] if k >= 0 else None
+        return tuple(out)
+
+    # ---- vectorized ----
+
+    def lord_indices_on(self, days: Iterable[date], depth: int = 2) -> np.ndarray:
+        """
+        DASHA_ORDER index of the MD/AD/PD lord for each day, shape (n, depth);
+        -1 where the timeline does not cover the day.
+        """
+        ords = np.array([d.toordinal() for d in days], dtype=np.int64)
+        out = np.full((ords.size, depth), -1, dtype=np.int64)
+        md_i = self._md.find_days(ords)
+        ok = md_i >= 0
+        out[ok, 0] = self._md.lords[md_i[ok]]
+        if depth < 2:
+            return out
+        ad_i = np.full_like(md_i, -1)
+        for i in np.unique(md_i[ok]).tolist():
+            sel = np.flatnonzero(md_i == i)
+            tab = self._ad_table(i)
+            k = tab.find_days(ords[sel])
+            ad_i[sel] = k
+            out[sel[k >= 0], 1] = tab.lords[k[k >= 0]]
+        if depth < 3:
+            return out
+        for i, j in {(a, b) for a, b in zip(md_i.tolist(), ad_i.tolist()) if b >= 0}:
+            sel = np.flatnonzero((md_i == i) & (ad_i == j))
+            tab = self._pd_table(i, j)
+            k = tab.find_days(ords[sel])
+            out[sel[k >= 0], 2] = tab.lords[k[k >= 0]]
+        return out
+
+
+class _Table:
+    """One level's periods with their boundaries as epoch seconds and day ordinals."""
+    __slots__ = ("periods", "t_start", "t_end", "d_start", "d_end", "lords")
+
+    def __init__(self, periods: List[Period]):
+        self.periods = periods
+        self.t_start = [p.t_start for p in periods]
+        self.t_end = [p.t_end for p in periods]
+        self.d_start = np.array([p.start.date().toordinal() for p in periods], dtype=np.int64)
+        self.d_end = np.array([p.end.date().toordinal() for p in periods], dtype=np.int64)
+        self.lords = np.array([p.lord_idx for p in periods], dtype=np.int64)
+
+    def find_instant(self, t: float) -> int:
+        """Period with start <= t < end, else -1."""
+        k = bisect_right(self.t_start, t) - 1
+        return k if k >= 0 and t < self.t_end[k] else -1
+
+    def find_day(self, d: int) -> int:
+        """First period whose day range contains ordinal d (so a boundary day goes to the earlier one), else -1."""
+        k = int(np.searchsorted(self.d_end, d, side="left"))
+        return k if k < len(self.periods) and self.d_start[k] <= d else -1
+
+    def find_days(self, ords: np.ndarray) -> np.ndarray:
+        k = np.searchsorted(self.d_end, ords, side="left")
+        inside = k < len(self.periods)
+        k_safe = np.where(inside, k, 0)
+        ok = inside & (self.d_start[k_safe] <= ords) if self.periods else inside
+        return np.where(ok, k, -1)
+
+
+def _epoch(dt: datetime) -> float:
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
 
 # --- Core helpers ------------------------------------------------------------
 
@@ -70,18 +289,21 @@ def _fmt_key(period: Period) -> str:
 
 def compute_vimshottari_mahadasha(
     dt_utc: datetime, lat: float, lon: float, tz_offset_hours: float = 0.0,
-    horizon_years: float = 120.0
+    horizon_years: float = 120.0, moon_lon: Optional[float] = None,
 ) -> List[Period]:
     """
     Compute Mahadasha chain from birth instant, including balance of first MD.
     IMPORTANT: dt_utc must truly be UTC if tz_offset_hours=0.0.
+    Pass moon_lon (sidereal Lahiri) when the caller already has it to skip the
+    ephemeris call.
     Returns list of Periods (lord, start, end, years) in UTC.
     """
     # 1) Get sidereal Moon longitude at birth.
     #    We pass tz_offset_hours straight through. If dt_utc is truly UTC,
     #    set tz_offset_hours=0.0 to avoid double-adjustment.
-    _, positions = compute_all_planets(dt_utc, lat, lon, tz_offset_hours, ayanamsa="lahiri")
-    moon_lon = positions["Moon"]
+    if moon_lon is None:
+        _, positions = compute_all_planets(dt_utc, lat, lon, tz_offset_hours, ayanamsa="lahiri")
+        moon_lon = positions["Moon"]
 
     # 2) Nakshatra & starting MD lord
     nak_idx, frac_elapsed = _nakshatra_index_and_fraction(moon_lon)
@@ -137,20 +359,28 @@ def compute_antardashas_for_mahadasha(md: Period) -> List[Period]:
             break
     return ads
 
+def compute_sub_periods(period: Period) -> List[Period]:
+    """
+    Next level down from any period (AD in MD, PD in AD, sookshma in PD): the
+    same proportional rule, starting from the period's own lord.
+    """
+    return compute_antardashas_for_mahadasha(period)
+
+def compute_pratyantardashas_for_antardasha(ad: Period) -> List[Period]:
+    """Pratyantardasha list within an Antardasha."""
+    return compute_sub_periods(ad)
+
 def compute_vimshottari_full(
     dt_utc: datetime, lat: float, lon: float, tz_offset_hours: float = 0.0,
-    horizon_years: float = 120.0
+    horizon_years: float = 120.0, moon_lon: Optional[float] = None,
 ) -> DashaTimeline:
     """
     Convenience: Mahadashas + Antardashas for each MD within horizon.
+    Antardashas are computed per MD on first access (LazyAntardashas).
     IMPORTANT: If dt_utc is true UTC, pass tz_offset_hours=0.0.
     """
-    mds = compute_vimshottari_mahadasha(dt_utc, lat, lon, tz_offset_hours, horizon_years)
-    ad_map: Dict[str, List[Period]] = {}
-    for md in mds:
-        key = _fmt_key(md)
-        ad_map[key] = compute_antardashas_for_mahadasha(md)
-    return DashaTimeline(mahadashas=mds, antardashas=ad_map)
+    mds = compute_vimshottari_mahadasha(dt_utc, lat, lon, tz_offset_hours, horizon_years, moon_lon=moon_lon)
+    return DashaTimeline(mahadashas=mds, antardashas=LazyAntardashas(mds))
 
 # --- Pretty printing (terminal) ---------------------------------------------
 
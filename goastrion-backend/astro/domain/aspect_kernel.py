@@ -0,0 +1,112 @@
+# astro/domain/aspect_kernel.py
+"""
+Vectorized aspect kernel.
+
+Transit longitudes (T, P) against natal points (N,) for every instant at once:
+
+  sep   = separation(transit[:, :, None], natal[None, None, :])    # (T, P, N), 0..180
+  delta = orb_deltas(sep, rules.angle)                              # (T, P, N, R)
+
+then either every rule inside its orb with a linear falloff (linear_hits, the
+AspectConfig.json semantics of compute_aspects / compute_transit_hits_now) or
+the single strongest rule with a tapered strength (best_aspect, ShubhDin).
+
+Element-wise this is the same float arithmetic as the scalar loops, so results
+are bit-identical; callers turn hits back into dicts only at the edges.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RuleArrays:
+    """Aspect rules as parallel arrays (R,)."""
+    names: Tuple[str, ...]
+    angle: np.ndarray
+    orb: np.ndarray
+    weight: np.ndarray
+    apply_to: Tuple[Optional[frozenset], ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def rule_arrays(aspect_cfg: Dict[str, Any], weight_keys: Tuple[str, str] = ("weight", "baseWeight")) -> RuleArrays:
+    """
+    AspectConfig.json rules (orb/maxOrb, optional apply_to). weight_keys is the
+    lookup order for the weight, default "weight" then "baseWeight".
+    """
+    items = aspect_cfg.get("aspects", [])
+    first, second = weight_keys
+    return RuleArrays(
+        names=tuple(a["name"] for a in items),
+        angle=np.array([float(a["angle"]) for a in items], dtype=float),
+        orb=np.array([float(a.get("orb", a.get("maxOrb", 6))) for a in items], dtype=float),
+        weight=np.array([float(a.get(first, a.get(second, 1.0))) for a in items], dtype=float),
+        apply_to=tuple(frozenset(a["apply_to"]) if a.get("apply_to") else None for a in items),
+    )
+
+
+def separation(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Shortest arc between longitudes, 0..180 (broadcasts)."""
+    d = np.abs(np.mod(np.subtract(a, b), 360.0))
+    return np.minimum(d, 360.0 - d)
+
+
+def orb_deltas(sep: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Distance from each separation to each exact aspect angle: sep.shape + (R,)."""
+    return separation(sep[..., None], angles)
+
+
+def linear_hits(delta: np.ndarray, orb: np.ndarray, weight: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every rule inside its orb: (mask, score) with score = weight * (1 - delta/orb),
+    both delta.shape.
+    """
+    mask = delta <= orb
+    score = weight * np.maximum(0.0, 1.0 - (delta / np.maximum(1e-6, orb)))
+    return mask, np.where(mask, score, 0.0)
+
+
+def best_aspect(
+    sep: np.ndarray, angle: np.ndarray, orb: np.ndarray, base: np.ndarray,
+    floor: float = 0.6, gain: float = 0.4,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Strongest matching rule per separation: (rule index or -1, strength), sep.shape.
+    strength = base * (floor + gain * taper), taper = 1 - |sep - angle| / orb;
+    on equal strength the earlier rule wins.
+    """
+    diff = np.abs(sep[..., None] - angle)
+    hit = (diff <= orb) | (np.abs(diff - 360.0) <= orb)
+    taper = np.maximum(0.0, 1.0 - (np.minimum(diff, 360.0 - diff) / orb))
+    strength = np.where(hit, base * (floor + gain * taper), -np.inf)
+    idx = np.argmax(strength, axis=-1)
+    best = np.take_along_axis(strength, idx[..., None], axis=-1)[..., 0]
+    found = np.isfinite(best)
+    return np.where(found, idx, -1), np.where(found, best, 0.0)
+
+
+def sequential_sum(values: np.ndarray) -> np.ndarray:
+    """Left-to-right sum over the last axes after the first, like a `+=` loop (np.sum is pairwise)."""
+    flat = values.reshape(values.shape[0], -1)
+    if flat.shape[1] == 0:
+        return np.zeros(flat.shape[0])
+    return np.cumsum(flat, axis=1)[:, -1]
+
+
+def as_matrix(positions: Sequence[Dict[str, float]], names: Sequence[str]) -> np.ndarray:
+    """[{planet: deg}, ...] → (T, P) in `names` order."""
+    return np.array([[float(p[n]) for n in names] for p in positions], dtype=float).reshape(len(positions), len(names))
+
+
+def hit_rows(mask: np.ndarray) -> List[np.ndarray]:
+    """Per leading index, the flat indices of True cells in row-major (loop) order."""
+    flat = mask.reshape(mask.shape[0], -1)
+    t, k = np.nonzero(flat)
+    bounds = np.searchsorted(t, np.arange(flat.shape[0] + 1))
+    return [k[bounds[i]:bounds[i + 1]] for i in range(flat.shape[0])]
@@ -1,54 +1,38 @@
 from __future__ import annotations
 from typing import Dict, List
-from .types import AspectRule, AspectHit, PlanetName
 
-def _angle_diff(a: float, b: float) -> float:
-    d = abs((a - b) % 360.0)
-    return min(d, 360.0 - d)
+import numpy as np
 
-def _load_rules(aspect_cfg: dict) -> List[AspectRule]:
-    rules: List[AspectRule] = []
-    for item in aspect_cfg.get("aspects", []):
-        rules.append(
-            AspectRule(
-                name=item["name"],
-                angle=float(item["angle"]),
-                orb=float(item.get("orb", item.get("maxOrb", 6))),
-                # IMPORTANT: support both "weight" and "baseWeight"
-                weight=float(item.get("weight", item.get("baseWeight", 1.0))),
-                apply_to=item.get("apply_to") or None,
-            )
-        )
-    return rules
+from .aspect_kernel import linear_hits, orb_deltas, rule_arrays, separation
+from .types import AspectHit, PlanetName
 
 def compute_aspects(planets_deg: Dict[PlanetName, float], aspect_cfg: dict) -> List[AspectHit]:
     """
     planets_deg: ecliptic longitudes (sidereal) in [0, 360)
     aspect_cfg: loaded JSON (AspectConfig.json)
+    Every pair i < j against every rule at once (aspect_kernel); hits keep the
+    pair-then-rule order of the nested loops.
     """
-    rules = _load_rules(aspect_cfg)
+    rules = rule_arrays(aspect_cfg)
     names: List[PlanetName] = list(planets_deg.keys())
-    hits: List[AspectHit] = []
+    if len(names) < 2 or not len(rules):
+        return []
 
-    for i in range(len(names)):
-        for j in range(i + 1, len(names)):
-            p1, p2 = names[i], names[j]
-            a1 = planets_deg[p1] % 360.0
-            a2 = planets_deg[p2] % 360.0
-            actual = _angle_diff(a1, a2)
+    deg = np.mod(np.array([float(planets_deg[n]) for n in names], dtype=float), 360.0)
+    i_idx, j_idx = np.triu_indices(len(names), k=1)
+    actual = separation(deg[i_idx], deg[j_idx])                          # (M,)
+    delta = orb_deltas(actual, rules.angle)                              # (M, R)
+    mask, score = linear_hits(delta, rules.orb, rules.weight)
+    for r, only in enumerate(rules.apply_to):
+        if only:
+            mask[:, r] &= np.array([names[i] in only or names[j] in only for i, j in zip(i_idx, j_idx)], dtype=bool)
 
-            for r in rules:
-                if r.apply_to and (p1 not in r.apply_to and p2 not in r.apply_to):
-                    continue
-                delta_to_exact = _angle_diff(actual, r.angle)
-                if delta_to_exact <= r.orb:
-                    # simple linear falloff inside orb
-                    frac = 1.0 - (delta_to_exact / max(1e-6, r.orb))
-                    score = r.weight * max(0.0, frac)
-                    hits.append(
-                        AspectHit(
-                            p1=p1, p2=p2, name=r.name, exact=actual,
-                            delta=delta_to_exact, score=score, applying=None
-                        )
-                    )
+    hits: List[AspectHit] = []
+    for m, r in zip(*np.nonzero(mask)):
+        hits.append(
+            AspectHit(
+                p1=names[i_idx[m]], p2=names[j_idx[m]], name=rules.names[r], exact=float(actual[m]),
+                delta=float(delta[m, r]), score=float(score[m, r]), applying=None
+            )
+        )
     return hits
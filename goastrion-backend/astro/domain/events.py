@@ -0,0 +1,295 @@
+# astro/domain/events.py
+"""
+Planet-agnostic transit event engine.
+
+For any graha this finds, over [start_jd, end_jd] (Julian days, UT):
+  - sign ingresses and nakshatra changes
+  - stations (speed sign flips) → retrograde spans
+  - combustion windows (within the classical orb of the Sun)
+
+Events are global facts, so `manage.py build_event_catalog` writes them once for
+1900–2100 and requests only bisect sorted lists; ranges a catalog doesn't cover
+are scanned live with the same code.
+
+Scan: sample at a per-planet step (small enough that the body can't cross two
+boundaries or station twice between samples), find stations by bisecting on the
+sign of the calc_ut speed, then split the motion at stations so every boundary
+bisection runs over monotonic motion.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..ephem.swiss import GRAHAS, compute_body_batch
+from ..ephem.table import ephem_dir
+
+EVENT_CATALOG_VERSION = 1
+
+SIGN_SPAN = 30.0
+NAKSHATRA_SPAN = 360.0 / 27.0
+
+_REFINE_TOL_DAYS = 60.0 / 86400.0     # refine events to a minute
+_MAX_STEP_DAYS = 5.0
+
+# Generous bounds from a survey of 1900–2100:
+#   planet → (max |speed| deg/day, min days between stations or None)
+# Rahu/Ketu use the true node, which wobbles (stations hours apart), so they get
+# no station/retro series; traditionally the nodes are always retrograde anyway.
+_MOTION: Dict[str, Tuple[float, Optional[float]]] = {
+    "Sun": (1.02, None), "Moon": (15.4, None),
+    "Mercury": (2.21, 18.0), "Venus": (1.26, 40.0), "Mars": (0.80, 70.0),
+    "Jupiter": (0.25, 115.0), "Saturn": (0.14, 130.0),
+    "Rahu": (0.26, None), "Ketu": (0.26, None),
+}
+# the true node's wobble can cross a boundary and back within days; sample it daily
+_STEP_CAP_DAYS: Dict[str, float] = {"Rahu": 1.0, "Ketu": 1.0}
+
+# Combustion orbs (deg from the Sun), (direct, retrograde) — BPHS
+COMBUSTION_ORBS: Dict[str, Tuple[float, float]] = {
+    "Moon": (12.0, 12.0), "Mars": (17.0, 17.0), "Mercury": (14.0, 12.0),
+    "Jupiter": (11.0, 11.0), "Venus": (10.0, 8.0), "Saturn": (15.0, 15.0),
+}
+
+
+def scan_step_days(planet: str) -> float:
+    """Sampling step: < 40% of a nakshatra of travel and < 1/4 of the station spacing."""
+    max_speed, station_gap = _MOTION[planet]
+    step = min(_STEP_CAP_DAYS.get(planet, _MAX_STEP_DAYS), 0.4 * NAKSHATRA_SPAN / max_speed)
+    if station_gap is not None:
+        step = min(step, station_gap / 4.0)
+    return step
+
+
+@dataclass
+class EventSeries:
+    """
+    Piecewise-constant state over time: `initial` at the scan start, then
+    sorted `changes` [(jd, new_state)].
+    """
+    initial: Any
+    changes: List[Tuple[float, Any]]
+    _jd: List[float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._jd = [jd for jd, _ in self.changes]
+
+    def at(self, jd: float) -> Any:
+        i = bisect_right(self._jd, jd)
+        return self.changes[i - 1][1] if i else self.initial
+
+    def between(self, jd0: float, jd1: float) -> List[Tuple[float, Any]]:
+        """Changes with jd0 < t <= jd1."""
+        return self.changes[bisect_right(self._jd, jd0):bisect_right(self._jd, jd1)]
+
+    def spans(self, state: Any, jd0: float, jd1: float) -> List[Tuple[float, float]]:
+        """Intervals where the state equals `state`, clipped to [jd0, jd1]."""
+        out: List[Tuple[float, float]] = []
+        start = jd0 if self.at(jd0) == state else None
+        for jd, new in self.between(jd0, jd1):
+            if new == state and start is None:
+                start = jd
+            elif new != state and start is not None:
+                out.append((start, jd))
+                start = None
+        if start is not None:
+            out.append((start, jd1))
+        return out
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"initial": self.initial, "changes": self.changes}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "EventSeries":
+        return cls(initial=data["initial"], changes=[(float(jd), s) for jd, s in data["changes"]])
+
+
+@dataclass
+class PlanetEvents:
+    """
+    Events of one planet over [start_jd, end_jd].
+      sign       : sign index 0..11
+      nakshatra  : nakshatra index 0..26
+      motion     : "D" / "R" (None for the nodes)
+      combust    : True / False (None for Sun and nodes)
+    """
+    planet: str
+    start_jd: float
+    end_jd: float
+    sign: EventSeries
+    nakshatra: EventSeries
+    motion: Optional[EventSeries] = None
+    combust: Optional[EventSeries] = None
+
+    def covers(self, jd0: float, jd1: float) -> bool:
+        return self.start_jd <= jd0 and jd1 <= self.end_jd
+
+    def stations(self, jd0: float, jd1: float) -> List[Tuple[float, str]]:
+        """[(jd, "R" | "D")] — R = turns retrograde, D = turns direct."""
+        return self.motion.between(jd0, jd1) if self.motion else []
+
+    def retro_intervals(self, jd0: float, jd1: float) -> List[Tuple[float, float]]:
+        return self.motion.spans("R", jd0, jd1) if self.motion else []
+
+    def combustion_windows(self, jd0: float, jd1: float) -> List[Tuple[float, float]]:
+        return self.combust.spans(True, jd0, jd1) if self.combust else []
+
+    def to_json(self, ayanamsa: str) -> Dict[str, Any]:
+        return {
+            "version": EVENT_CATALOG_VERSION, "planet": self.planet, "ayanamsa": ayanamsa,
+            "start_jd": self.start_jd, "end_jd": self.end_jd,
+            "sign": self.sign.to_json(), "nakshatra": self.nakshatra.to_json(),
+            "motion": self.motion.to_json() if self.motion else None,
+            "combust": self.combust.to_json() if self.combust else None,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PlanetEvents":
+        opt = lambda d: EventSeries.from_json(d) if d else None
+        return cls(
+            planet=data["planet"], start_jd=float(data["start_jd"]), end_jd=float(data["end_jd"]),
+            sign=EventSeries.from_json(data["sign"]), nakshatra=EventSeries.from_json(data["nakshatra"]),
+            motion=opt(data.get("motion")), combust=opt(data.get("combust")),
+        )
+
+
+# -------------------------
+# Scanning + refinement
+# -------------------------
+def _body_at(planet: str, jd: float, ayanamsa: str) -> Tuple[float, float]:
+    lon, spd = compute_body_batch([jd], planet, ayanamsa)
+    return float(lon[0]), float(spd[0])
+
+
+def _bisect(jd0: float, jd1: float, still_left) -> float:
+    """Smallest t in (jd0, jd1] (to tolerance) where still_left(t) turns False."""
+    while jd1 - jd0 > _REFINE_TOL_DAYS:
+        mid = (jd0 + jd1) / 2
+        if still_left(mid):
+            jd0 = mid
+        else:
+            jd1 = mid
+    return jd1
+
+
+def _is_combust(planet: str, lon: np.ndarray, spd: np.ndarray, sun: np.ndarray) -> np.ndarray:
+    orb_direct, orb_retro = COMBUSTION_ORBS[planet]
+    d = np.abs((lon - sun) % 360.0)
+    sep = np.minimum(d, 360.0 - d)
+    return sep < np.where(spd < 0, orb_retro, orb_direct)
+
+
+def scan_planet_events(planet: str, start_jd: float, end_jd: float, ayanamsa: str = "lahiri") -> PlanetEvents:
+    """Scan [start_jd, end_jd] for one planet's events (exact to ~1 minute)."""
+    if planet not in GRAHAS:
+        raise ValueError(f"unknown planet: {planet}")
+    step = scan_step_days(planet)
+    grid = np.append(np.arange(start_jd, end_jd, step), end_jd)
+    lon, spd = compute_body_batch(grid, planet, ayanamsa)
+
+    # stations (not for the wobbling true node, nor Sun/Moon which never station)
+    motion: Optional[EventSeries] = None
+    st_jd: List[float] = []
+    if _MOTION[planet][1] is not None:
+        direct = spd >= 0
+        changes: List[Tuple[float, str]] = []
+        for i in np.flatnonzero(direct[:-1] != direct[1:]).tolist():
+            d0 = bool(direct[i])
+            jd = _bisect(float(grid[i]), float(grid[i + 1]),
+                         lambda t: (_body_at(planet, t, ayanamsa)[1] >= 0) == d0)
+            changes.append((jd, "R" if d0 else "D"))
+        motion = EventSeries(initial="D" if direct[0] else "R", changes=changes)
+        st_jd = [jd for jd, _ in changes]
+
+    # knots = grid + stations → motion is monotonic between consecutive knots
+    knots, k_lon = grid.tolist(), lon.tolist()
+    if st_jd:
+        s_lon, _ = compute_body_batch(st_jd, planet, ayanamsa)
+        merged = sorted(zip(knots + st_jd, k_lon + s_lon.tolist()))
+        knots, k_lon = [k for k, _ in merged], [x for _, x in merged]
+
+    def boundary_series(span: float) -> EventSeries:
+        idx = [int(x // span) for x in k_lon]
+        changes: List[Tuple[float, int]] = []
+        for i in range(len(knots) - 1):
+            if idx[i] != idx[i + 1]:
+                left = idx[i]
+                jd = _bisect(knots[i], knots[i + 1],
+                             lambda t: int(_body_at(planet, t, ayanamsa)[0] // span) == left)
+                changes.append((jd, idx[i + 1]))
+        return EventSeries(initial=idx[0], changes=changes)
+
+    sign = boundary_series(SIGN_SPAN)
+    nakshatra = boundary_series(NAKSHATRA_SPAN)
+
+    combust: Optional[EventSeries] = None
+    if planet in COMBUSTION_ORBS:
+        sun, _ = compute_body_batch(grid, "Sun", ayanamsa)
+        flags = _is_combust(planet, lon, spd, sun)
+
+        def combust_at(t: float) -> bool:
+            p_lon, p_spd = compute_body_batch([t], planet, ayanamsa)
+            s_lon, _ = compute_body_batch([t], "Sun", ayanamsa)
+            return bool(_is_combust(planet, p_lon, p_spd, s_lon)[0])
+
+        changes_c: List[Tuple[float, bool]] = []
+        for i in np.flatnonzero(flags[:-1] != flags[1:]).tolist():
+            left = bool(flags[i])
+            jd = _bisect(float(grid[i]), float(grid[i + 1]), lambda t: combust_at(t) == left)
+            changes_c.append((jd, not left))
+        combust = EventSeries(initial=bool(flags[0]), changes=changes_c)
+
+    return PlanetEvents(
+        planet=planet, start_jd=float(start_jd), end_jd=float(end_jd),
+        sign=sign, nakshatra=nakshatra, motion=motion, combust=combust,
+    )
+
+
+# -------------------------
+# On-disk catalogs (process cache)
+# -------------------------
+def catalog_path(planet: str, ayanamsa: str) -> Path:
+    return ephem_dir() / f"events_{planet.lower()}_{ayanamsa.lower()}.json"
+
+
+_CATALOGS: Dict[Tuple[str, str], Optional[PlanetEvents]] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def _load_catalog(planet: str, ayanamsa: str) -> Optional[PlanetEvents]:
+    key = (planet, ayanamsa.lower())
+    if key in _CATALOGS:
+        return _CATALOGS[key]
+    with _CATALOGS_LOCK:
+        if key not in _CATALOGS:
+            cat: Optional[PlanetEvents] = None
+            path = catalog_path(*key)
+            if path.is_file():
+                try:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                    if data.get("version") == EVENT_CATALOG_VERSION:
+                        cat = PlanetEvents.from_json(data)
+                except Exception:
+                    cat = None  # unreadable catalog → live scan
+            _CATALOGS[key] = cat
+    return _CATALOGS[key]
+
+
+def reset_event_catalogs() -> None:
+    """Forget loaded catalogs (after a rebuild, or in tests)."""
+    with _CATALOGS_LOCK:
+        _CATALOGS.clear()
+
+
+def planet_events(planet: str, start_jd: float, end_jd: float, ayanamsa: str = "lahiri") -> PlanetEvents:
+    """Events for [start_jd, end_jd]: from the on-disk catalog when it covers the range."""
+    cat = _load_catalog(planet, ayanamsa) if ayanamsa else None
+    if cat is not None and cat.covers(start_jd, end_jd):
+        return cat
+    return scan_planet_events(planet, start_jd, end_jd, ayanamsa)
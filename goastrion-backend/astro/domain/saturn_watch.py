@@ -5,22 +5,13 @@ from typing import Dict, List, Optional, Tuple, Any
 from zoneinfo import ZoneInfo
 
 # IMPORTANT: keep same ephemeris wrappers as before
-from ..ephem.swiss import compute_all_planets, deg_to_sign_index
-
-# -------------------------
-# Global caches (process lifetime)
-# -------------------------
-# Keyed by (date_iso, ayanamsa) -> float longitude degrees
-_SAT_LON_CACHE: Dict[Tuple[str, str], float] = {}
-# Keyed by (date_iso, ayanamsa) -> float speed deg/day (approx)
-_SAT_SPD_CACHE: Dict[Tuple[str, str], float] = {}
+from ..ephem.swiss import deg_to_sign_index, julday_utc, jd_to_datetime_utc
+from ..ephem.table import transit_body_batch
+from .events import planet_events
 
 # -------------------------
 # Lightweight helpers
 # -------------------------
-def _mid(dt0: datetime, dt1: datetime) -> datetime:
-    return dt0 + (dt1 - dt0) / 2
-
 def _to_local_date_iso(dt_utc: datetime, user_tz_str: str) -> str:
     if dt_utc.tzinfo is None:
         dt_utc = dt_utc.replace(tzinfo=timezone.utc)
@@ -31,189 +22,9 @@ def _angle_diff(a: float, b: float) -> float:
     d = abs((a - b) % 360.0)
     return min(d, 360.0 - d)
 
-def _forward_delta(a: float, b: float) -> float:
-    return (b - a + 540.0) % 360.0 - 180.0
-
 def _sign_idx_from_lon(lon_deg: float) -> int:
     return deg_to_sign_index(lon_deg)
 
-# -------------------------
-# Cached ephemeris accessors (daily noon target)
-# -------------------------
-def _saturn_lon_at_midday(dt_utc_naive: datetime, ayanamsa: str = "lahiri") -> float:
-    """
-    Compute/return geocentric Saturn longitude at midday UTC of the date of dt_utc_naive.
-    Cache by date_iso + ayanamsa.
-    """
-    d = dt_utc_naive.date()
-    key = (d.isoformat(), ayanamsa)
-    if key in _SAT_LON_CACHE:
-        return _SAT_LON_CACHE[key]
-    # use 12:00 UTC midday to be robust
-    midday = datetime(d.year, d.month, d.day, 12, 0, 0)
-    # compute_all_planets returns (lagna, positions)
-    _, pos = compute_all_planets(midday, 0.0, 0.0, tz_offset_hours=0.0, ayanamsa=ayanamsa)
-    lon = float(pos["Saturn"])
-    _SAT_LON_CACHE[key] = lon
-    return lon
-
-def _saturn_speed_approx_for_date(dt_utc_naive: datetime, ayanamsa: str = "lahiri") -> float:
-    """
-    Approx speed deg/day using cached midday longitudes for date and next date.
-    """
-    d = dt_utc_naive.date()
-    key = (d.isoformat(), ayanamsa)
-    if key in _SAT_SPD_CACHE:
-        return _SAT_SPD_CACHE[key]
-    lon0 = _saturn_lon_at_midday(datetime(d.year, d.month, d.day, 12, 0, 0), ayanamsa)
-    d1 = d + timedelta(days=1)
-    lon1 = _saturn_lon_at_midday(datetime(d1.year, d1.month, d1.day, 12, 0, 0), ayanamsa)
-    spd = _forward_delta(lon0, lon1)
-    _SAT_SPD_CACHE[key] = spd
-    return spd
-
-# -------------------------
-# Binary search helpers (refine events)
-# -------------------------
-def _bsearch_ingress(t0: datetime, t1: datetime, target_sign: int, ayanamsa: str, tol_seconds: int = 60) -> datetime:
-    """
-    Binary search time when Saturn crosses into target_sign within [t0, t1].
-    Uses cached daily lon when possible; falls back to compute_all_planets.
-    """
-    # Ensure naive UTC inputs
-    while (t1 - t0).total_seconds() > tol_seconds:
-        mid = _mid(t0, t1)
-        # use compute_all_planets at mid for better accuracy
-        _, pos = compute_all_planets(mid, 0.0, 0.0, tz_offset_hours=0.0, ayanamsa=ayanamsa)
-        s = _sign_idx_from_lon(float(pos["Saturn"]))
-        if s >= target_sign:
-            t1 = mid
-        else:
-            t0 = mid
-    return t1
-
-def _bsearch_station(t0: datetime, t1: datetime, ayanamsa: str, tol_seconds: int = 60) -> datetime:
-    """
-    Binary search for approx transit speed zero (station) inside [t0, t1].
-    Uses cached daily speeds as seed but uses compute_all_planets for midpoints.
-    """
-    # compute sign of speed at endpoints
-    def speed_at(dt: datetime) -> float:
-        # use 0:00 & 24:00 approach if necessary
-        _, p0 = compute_all_planets(dt, 0.0, 0.0, tz_offset_hours=0.0, ayanamsa=ayanamsa)
-        _, p1 = compute_all_planets(dt + timedelta(days=1), 0.0, 0.0, tz_offset_hours=0.0, ayanamsa=ayanamsa)
-        return _forward_delta(float(p0["Saturn"]), float(p1["Saturn"]))
-
-    v0 = speed_at(t0)
-    v1 = speed_at(t1)
-    # if either endpoint already zero-ish, return it
-    if abs(v0) < 1e-6:
-        return t0
-    if abs(v1) < 1e-6:
-        return t1
-
-    while (t1 - t0).total_seconds() > tol_seconds:
-        mid = _mid(t0, t1)
-        vm = speed_at(mid)
-        if (v0 <= 0 and vm <= 0) or (v0 >= 0 and vm >= 0):
-            t0, v0 = mid, vm
-        else:
-            t1, v1 = mid, vm
-    return t1
-
-# -------------------------
-# Event detectors (sampling + refine)
-# -------------------------
-def _saturn_ingresses(start_utc: datetime, end_utc: datetime, ayanamsa: str) -> List[Tuple[datetime, int]]:
-    """
-    Detect sign ingresses using adaptive sampling + refine around transitions.
-    Returns list of (ingress_time_utc, new_sign_idx)
-    """
-    out: List[Tuple[datetime, int]] = []
-    horizon_days = max(1, (end_utc.date() - start_utc.date()).days)
-    # choose coarse step adaptively: larger horizon -> larger step
-    if horizon_days <= 365:
-        step_days = 1
-    elif horizon_days <= 365 * 5:
-        step_days = 2
-    elif horizon_days <= 365 * 20:
-        step_days = 4
-    else:
-        # for very large horizons sample every ~10-14 days (Saturn moves ~1 deg / 12-14 days)
-        step_days = 14
-
-    t = start_utc
-    curr_sign = _sign_idx_from_lon(_saturn_lon_at_midday(t, ayanamsa))
-    while t < end_utc:
-        t_next = min(t + timedelta(days=step_days), end_utc)
-        s_next = _sign_idx_from_lon(_saturn_lon_at_midday(t_next, ayanamsa))
-        if s_next != curr_sign:
-            # refine ingress between t and t_next
-            ingress = _bsearch_ingress(t, t_next + timedelta(days=1), s_next, ayanamsa)
-            out.append((ingress, s_next))
-            curr_sign = s_next
-            # jump slightly forward to avoid re-detecting same crossing
-            t = ingress + timedelta(hours=1)
-        else:
-            t = t_next
-    return out
-
-def _saturn_retro_intervals(start_utc: datetime, end_utc: datetime, ayanamsa: str) -> Tuple[List[Dict[str, datetime]], List[datetime]]:
-    """
-    Detect retrograde intervals & station times.
-    Uses coarse sampling for speed sign changes and binary search to refine stations.
-    """
-    intervals: List[Dict[str, datetime]] = []
-    stations: List[datetime] = []
-
-    horizon_days = max(1, (end_utc.date() - start_utc.date()).days)
-    # pick step for speed sampling — Saturn speed changes slowly, sample coarsely for long horizons
-    if horizon_days <= 365:
-        step_days = 1
-    elif horizon_days <= 365 * 5:
-        step_days = 2
-    elif horizon_days <= 365 * 20:
-        step_days = 4
-    else:
-        step_days = 10
-
-    t = start_utc
-    # compute initial speed sign using approximate cached daily speeds
-    v_prev = _saturn_speed_approx_for_date(t, ayanamsa)
-    retro = False
-    retro_start: Optional[datetime] = None
-
-    while t < end_utc:
-        t_next = min(t + timedelta(days=step_days), end_utc)
-        v_next = _saturn_speed_approx_for_date(t_next, ayanamsa)
-        # detect sign change or zero
-        if (v_prev > 0 and v_next < 0) or (v_prev < 0 and v_next > 0) or abs(v_prev) < 1e-9 or abs(v_next) < 1e-9:
-            # find station precisely
-            t_station = _bsearch_station(max(start_utc, t - timedelta(days=1)), min(end_utc, t_next + timedelta(days=1)), ayanamsa)
-            stations.append(t_station)
-            v_mid = _saturn_speed_approx_for_date(t_station, ayanamsa)
-            # re-evaluate using precise speed_at (binary search used compute_all_planets)
-            # But we can classify based on sign of v_mid (approx)
-            if v_mid < 0 and not retro:
-                retro = True
-                retro_start = t_station
-            elif v_mid > 0 and retro:
-                intervals.append({"start": retro_start or t, "end": t_station})
-                retro = False
-                retro_start = None
-            # advance after station
-            t = t_station + timedelta(days=1)
-            v_prev = _saturn_speed_approx_for_date(t, ayanamsa)
-            continue
-        # advance
-        t, v_prev = t_next, v_next
-
-    if retro and retro_start is not None:
-        intervals.append({"start": retro_start, "end": end_utc})
-    # sort stations
-    stations_sorted = sorted(stations)
-    return intervals, stations_sorted
-
 # -------------------------
 # window helpers (mostly unchanged)
 # -------------------------
@@ -281,8 +92,8 @@ def saturn_overview(
     lat: float, lon: float, user_tz_str: str, ayanamsa: str = "lahiri",
 ) -> Dict[str, Any]:
     """
-    Optimized saturn_overview: uses cached daily longitudes + adaptive sampling.
-    Signature preserved.
+    Optimized saturn_overview: events come from the event engine (catalog, or a live
+    scan outside it), aspects from batched transit positions. Signature preserved.
     """
     SIGN_NAMES = [
         "Aries","Taurus","Gemini","Cancer","Leo","Virgo",
@@ -293,11 +104,13 @@ def saturn_overview(
     start_utc = datetime(today_local.year, today_local.month, today_local.day, 12, 0, 0, tzinfo=timezone.utc).replace(tzinfo=None)
     end_utc = start_utc + timedelta(days=horizon_days)
 
-    # ---------- detect ingresses and timeline ----------
-    ingresses = _saturn_ingresses(start_utc, end_utc, ayanamsa)
+    # ---------- ingresses and timeline (catalog lookups) ----------
+    start_jd, end_jd = julday_utc(start_utc), julday_utc(end_utc)
+    events = planet_events("Saturn", start_jd, end_jd, ayanamsa)
+    ingresses = [(jd_to_datetime_utc(jd), s) for jd, s in events.sign.between(start_jd, end_jd)]
     timeline: List[Tuple[datetime, datetime, int]] = []
     # build timeline from ingresses
-    sign0 = _sign_idx_from_lon(_saturn_lon_at_midday(start_utc, ayanamsa))
+    sign0 = events.sign.at(start_jd)
     t0 = start_utc
     s0 = sign0
     for t_in, s_in in ingresses:
@@ -310,7 +123,11 @@ def saturn_overview(
         timeline.append((t0, end_utc, s0))
 
     # ---------- retrograde intervals & stations ----------
-    retro_intervals_dt, stations_dt = _saturn_retro_intervals(start_utc, end_utc, ayanamsa)
+    retro_intervals_dt = [
+        {"start": jd_to_datetime_utc(a), "end": jd_to_datetime_utc(b)}
+        for a, b in events.retro_intervals(start_jd, end_jd)
+    ]
+    stations_dt = [jd_to_datetime_utc(jd) for jd, _ in events.stations(start_jd, end_jd)]
 
     retrograde = [{"start": _to_local_date_iso(r["start"], user_tz_str), "end": _to_local_date_iso(r["end"], user_tz_str)} for r in retro_intervals_dt]
     stations = [{"date": _to_local_date_iso(s, user_tz_str), "type": "station"} for s in sorted(stations_dt)]
@@ -443,18 +260,25 @@ def saturn_overview(
     if mc_natal_deg is not None:
         natal_targets["MC"] = float(mc_natal_deg)
 
+    sample_times: List[datetime] = []
     t = start_utc
     while t <= end_utc:
-        # use compute_all_planets at sample instants (midday)
-        _, pos = compute_all_planets(t, 0.0, 0.0, tz_offset_hours=0.0, ayanamsa=ayanamsa)
-        sat = float(pos["Saturn"])
+        sample_times.append(t)
+        t += timedelta(days=ASPECT_SAMPLE_DAYS)
+
+    # Saturn at every sample instant (midday) in one batch pass
+    sat_lons: List[float] = []
+    if sample_times:
+        sat_lon, _ = transit_body_batch([julday_utc(x) for x in sample_times], "Saturn", ayanamsa=ayanamsa)
+        sat_lons = sat_lon.tolist()
+
+    for t, sat in zip(sample_times, sat_lons):
         for name, angle, orb in _ASPECTS:
             for tgt, tdeg in natal_targets.items():
                 delta = _angle_diff((sat - tdeg) % 360.0, angle)
                 if delta <= orb:
                     hit = {"date": _to_local_date_iso(t, user_tz_str), "aspect": name, "target": tgt}
                     (support_hits if name in ("Trine", "Sextile") else stress_hits).append(hit)
-        t += timedelta(days=ASPECT_SAMPLE_DAYS)
 
     ss_caution_days = sorted({d for w in ss_windows for d in w["stations"]})
 
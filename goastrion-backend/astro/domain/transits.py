@@ -1,9 +1,13 @@
 # astro/domain/transits.py
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from ..ephem.swiss import compute_all_planets, get_sign_name
+import numpy as np
+
+from ..ephem.swiss import GRAHAS, get_sign_name, julday_utc
+from ..ephem.table import transit_positions_batch
 from ..ephem.swiss import _HAS_SWE  # best-effort feature flag
+from .aspect_kernel import hit_rows, linear_hits, orb_deltas, rule_arrays, separation
 
 def compute_transit_hits_now(
     *,
@@ -19,45 +23,52 @@ def compute_transit_hits_now(
     We keep it minimal: it evaluates transiting *planets* against natal key points
     using the same aspect rules (orb, baseWeight) in AspectConfig.json.
     """
-    # 1) Get transiting positions (sidereal, Lahiri if your default is Lahiri elsewhere)
-    tz0 = 0.0
-    _, tpos = compute_all_planets(dt_naive_utc, lat, lon, tz0, ayanamsa="lahiri")
-
-    # 2) Build aspect rule list (like domain/aspects.py does)
-    rules = []
-    for a in aspect_cfg.get("aspects", []):
-        rules.append({
-            "name": a["name"],
-            "angle": float(a["angle"]),
-            "orb": float(a["orb"]),
-            "weight": float(a.get("baseWeight", a.get("weight", 1.0))),
-        })
+    return compute_transit_hits_batch(
+        dts_naive_utc=[dt_naive_utc], lat=lat, lon=lon, natal_points=natal_points, aspect_cfg=aspect_cfg,
+    )[0]
 
-    def angle_diff(a: float, b: float) -> float:
-        d = abs((a - b) % 360.0)
-        return min(d, 360.0 - d)
 
-    hits_aspect: List[Dict[str, Any]] = []
-    for p, pdeg in tpos.items():
-        for tgt, tdeg in natal_points.items():
-            actual = angle_diff(pdeg, tdeg)
-            for r in rules:
-                delta = angle_diff(actual, r["angle"])
-                if delta <= r["orb"]:
-                    score = r["weight"] * max(0.0, 1.0 - (delta / max(1e-6, r["orb"])))
-                    hits_aspect.append({
-                        "type": "aspect",
-                        "planet": p,
-                        "target": tgt,
-                        "aspect": r["name"],
-                        "exact": actual,
-                        "delta": delta,
-                        "score": score,
-                    })
+def compute_transit_hits_batch(
+    *,
+    dts_naive_utc: Sequence,          # naive UTC datetimes
+    lat: float, lon: float,
+    natal_points: Dict[str, float],
+    aspect_cfg: Dict[str, Any],
+    transit_lon: Optional[np.ndarray] = None,
+) -> List[Dict[str, List[Dict[str, Any]]]]:
+    """
+    compute_transit_hits_now() for many instants in one ephemeris + aspect-kernel
+    pass. transit_lon (T, 9) skips the ephemeris when the caller already has the
+    positions (e.g. from the day snapshot).
+    """
+    # 1) Transiting positions (sidereal Lahiri), geocentric so no houses needed;
+    #    served from the precomputed table when built.
+    if transit_lon is None:
+        batch = transit_positions_batch([julday_utc(dt) for dt in dts_naive_utc], ayanamsa="lahiri")
+        transit_lon = batch.lon
+    tlon = np.asarray(transit_lon, dtype=float)                        # (T, P) in GRAHAS order
 
-    # 3) House occupancy (very simple): which natal houses would the transiting planet fall into?
-    #    We DON’T recompute houses for transit; we use natal lagna-based houses as a frame.
-    #    If you want true transit houses, compute another houses_ex for now-time; phase 2.
-    hits_house: List[Dict[str, Any]] = []
+    # 2) Aspect rules (baseWeight wins over weight here) and the (T, P, N, R) kernel
+    rules = rule_arrays(aspect_cfg, weight_keys=("baseWeight", "weight"))
+    targets = list(natal_points)
+    natal = np.array([float(natal_points[t]) for t in targets], dtype=float)
+    sep = separation(tlon[:, :, None], natal)                          # (T, P, N)
+    delta = orb_deltas(sep, rules.angle)                               # (T, P, N, R)
+    mask, score = linear_hits(delta, rules.orb, rules.weight)
 
-    return {"aspect": hits_aspect, "house": hits_house}
+    out: List[Dict[str, List[Dict[str, Any]]]] = []
+    for t, flat in enumerate(hit_rows(mask)):
+        hits_aspect: List[Dict[str, Any]] = []
+        for p, n, r in zip(*np.unravel_index(flat, mask.shape[1:])):
+            hits_aspect.append({
+                "type": "aspect",
+                "planet": GRAHAS[p],
+                "target": targets[n],
+                "aspect": rules.names[r],
+                "exact": float(sep[t, p, n]),
+                "delta": float(delta[t, p, n, r]),
+                "score": float(score[t, p, n, r]),
+            })
+        # 3) House occupancy: not computed yet (would need transit houses_ex; phase 2).
+        out.append({"aspect": hits_aspect, "house": []})
+    return out
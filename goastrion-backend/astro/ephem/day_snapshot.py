@@ -0,0 +1,109 @@
+# goastrion-backend/astro/ephem/day_snapshot.py
+"""
+Per-UTC-day transit snapshot.
+
+Every /daily request for a day needs the same transiting positions; only the
+local 06:00–21:00 window (time zone shift) and the natal targets differ. A day
+snapshot is the geocentric sidereal (lon, speed) of all grahas on a 15-minute
+UTC grid, both midnights included (97 rows), computed once via
+transit_positions_batch and then shared:
+
+  in process : BoundedCache, one entry per (ayanamsa, UTC day)
+  on disk    : optional, GOASTRION_DAY_SNAPSHOT_DIR/day_<ayanamsa>_<YYYYMMDD>.npy,
+               so every worker on the host builds a day only once
+
+Instants on the grid (any whole quarter hour, i.e. every standard tz offset)
+are served from their row; anything else is Hermite-interpolated like the
+ephemeris table. Per-request work is then only aspect matching.
+"""
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..utils.cache import BoundedCache
+from .swiss import GRAHAS, ArrayLike, BatchPositions, julday_utc
+from .table import hermite, transit_positions_batch
+
+_ENV_DIR = "GOASTRION_DAY_SNAPSHOT_DIR"
+
+STEP_MIN = 15
+ROWS = 24 * 60 // STEP_MIN + 1
+_STEP_DAYS = STEP_MIN / 1440.0
+_ON_GRID = 1e-4            # fraction of a step (~0.1 s) treated as exactly on a row
+_JD_UNIX_EPOCH = 2440587.5
+
+_SNAPSHOTS = BoundedCache("ephem.day_snapshots", maxsize=64)
+
+
+def snapshot_path(day: date, ayanamsa: str) -> Optional[Path]:
+    env = os.environ.get(_ENV_DIR)
+    if not env:
+        return None
+    return Path(env).expanduser() / f"day_{ayanamsa.lower()}_{day:%Y%m%d}.npy"
+
+
+def _build(day: date, ayanamsa: str) -> np.ndarray:
+    midnight = datetime(day.year, day.month, day.day)
+    jds = [julday_utc(midnight + timedelta(minutes=STEP_MIN * k)) for k in range(ROWS)]
+    batch = transit_positions_batch(jds, ayanamsa=ayanamsa)
+    return np.stack([np.asarray(batch.lon, dtype=float), np.asarray(batch.speed, dtype=float)], axis=-1)
+
+
+def _load_or_build(day: date, ayanamsa: str) -> np.ndarray:
+    path = snapshot_path(day, ayanamsa)
+    if path is not None and path.is_file():
+        try:
+            data = np.load(path)
+            if data.shape == (ROWS, len(GRAHAS), 2):
+                return data
+        except Exception:
+            pass  # partial / old file → rebuild
+    data = _build(day, ayanamsa)
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp, data)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # read-only / full disk: in-process only
+    return data
+
+
+def day_snapshot(day: date, ayanamsa: str = "lahiri") -> np.ndarray:
+    """(ROWS, 9, 2) [lon, speed deg/day] for one UTC day, row k at 00:00 + k*STEP_MIN."""
+    ayan = ayanamsa.lower()
+    return _SNAPSHOTS.get_or_set((ayan, day.toordinal()), lambda: _load_or_build(day, ayan))
+
+
+def snapshot_positions(jds: ArrayLike, ayanamsa: str = "lahiri") -> BatchPositions:
+    """transit_positions_batch() served from the day snapshots."""
+    jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+    lon = np.empty((jd_arr.size, len(GRAHAS)), dtype=float)
+    spd = np.empty_like(lon)
+
+    day_num = np.floor(jd_arr - _JD_UNIX_EPOCH).astype(np.int64)
+    for d in np.unique(day_num):
+        sel = day_num == d
+        day = date(1970, 1, 1) + timedelta(days=int(d))
+        snap = day_snapshot(day, ayanamsa)
+        x = (jd_arr[sel] - (_JD_UNIX_EPOCH + float(d))) / _STEP_DAYS
+        k = np.clip(np.rint(x).astype(np.int64), 0, ROWS - 1)
+        exact = np.abs(x - k) < _ON_GRID
+
+        d_lon, d_spd = snap[k, :, 0], snap[k, :, 1]
+        if not exact.all():
+            i0 = np.clip(np.floor(x[~exact]).astype(np.int64), 0, ROWS - 2)
+            u = (x[~exact] - i0)[:, None]
+            d_lon[~exact], d_spd[~exact] = hermite(snap[i0], snap[i0 + 1], u, _STEP_DAYS)
+        lon[sel], spd[sel] = d_lon, d_spd
+    return BatchPositions(jd=jd_arr, lon=lon, speed=spd)
+
+
+def reset_day_snapshots() -> None:
+    _SNAPSHOTS.clear()
@@ -1,11 +1,14 @@
 #goastrion-backend/astro/ephem/swiss.py
 from __future__ import annotations
-from datetime import datetime
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional
 
-from typing import Any, Dict, List, Optional, Tuple
-
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 
 try:
     import swisseph as swe
@@ -29,18 +32,80 @@ if _HAS_SWE:
         "deval": getattr(swe, "SIDM_DELUCE", None),  # example
     }
 
-def _maybe_set_sid_mode(name: Optional[str]) -> None:
-    """Set sidereal mode if name is provided; otherwise leave library default as-is (legacy)."""
-    if not (_HAS_SWE and name):
-        return
-    mode = _SIDM.get(name.lower())
-    if mode is not None:
+# -------------------------
+# Ayanamsa context (thread-safe)
+# -------------------------
+# Swiss keeps the sidereal mode in thread-local C state (pyswisseph is built with
+# TLS) and get_ayanamsa_ut() reads it. We remember the mode per thread and per
+# process, so set_sid_mode() only runs when the ayanamsa actually switches, and a
+# context always activates its own mode right before reading the ayanamsa. The lock
+# covers builds without TLS, where "set mode, then read" must be atomic.
+# Tropical calc_ut/houses_ex don't depend on the mode and stay outside the lock.
+_SWE_LOCK = threading.Lock()
+_SID_STATE = threading.local()   # .mode = last mode pushed into Swiss by this thread
+_SID_LAST: List[Optional[int]] = [None]   # last mode pushed by any thread
+
+class EphemerisContext:
+    """
+    Ayanamsa-bound view of Swiss Ephemeris; safe to share between threads.
+    An unknown/None ayanamsa keeps the legacy behaviour: whatever mode Swiss
+    was last set to in this thread.
+    """
+    __slots__ = ("ayanamsa", "mode")
+
+    def __init__(self, ayanamsa: Optional[str] = None):
+        self.ayanamsa = ayanamsa.lower() if ayanamsa else None
+        self.mode: Optional[int] = _SIDM.get(self.ayanamsa) if self.ayanamsa else None
+
+    def _activate(self) -> None:
+        # caller holds _SWE_LOCK; only touch Swiss when the mode actually changes
+        if self.mode is None:
+            return
+        if self.mode == getattr(_SID_STATE, "mode", None) and self.mode == _SID_LAST[0]:
+            return
         try:
             # zero t0 & ayan_t0 to use Swiss internal constants for that mode
-            swe.set_sid_mode(mode, 0, 0)
+            swe.set_sid_mode(self.mode, 0, 0)
+            _SID_STATE.mode = _SID_LAST[0] = self.mode
         except Exception:
             pass  # ignore if environment lacks this mode
 
+    def ayanamsa_ut(self, jd: float) -> float:
+        with _SWE_LOCK:
+            self._activate()
+            return swe.get_ayanamsa_ut(jd)
+
+    def ayanamsa_ut_many(self, jds: Sequence[float]) -> np.ndarray:
+        """Ayanamsa for many Julian days under a single lock acquisition."""
+        with _SWE_LOCK:
+            self._activate()
+            get = swe.get_ayanamsa_ut
+            return np.array([get(jd) for jd in jds], dtype=float)
+
+@lru_cache(maxsize=None)
+def ephemeris_context(ayanamsa: Optional[str] = None) -> EphemerisContext:
+    """Shared context per ayanamsa name."""
+    return EphemerisContext(ayanamsa)
+
+# Julian day of 2000-01-01 12:00 UT (J2000); used when Swiss is unavailable
+_J2000_JD = 2451545.0
+_J2000_DT = datetime(2000, 1, 1, 12, 0, 0)
+
+def julday_utc(dt_utc: datetime, tz_offset_hours: float = 0.0) -> float:
+    """
+    Julian day (UT) for a naive datetime, derived exactly the way compute_all_planets does it.
+    Sub-second precision is dropped on purpose (legacy behaviour).
+    """
+    ut_hour = dt_utc.hour + dt_utc.minute/60 + dt_utc.second/3600 - tz_offset_hours
+    if _HAS_SWE:
+        return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, ut_hour, swe.GREG_CAL)
+    day0 = datetime(dt_utc.year, dt_utc.month, dt_utc.day)
+    return _J2000_JD + (day0 - _J2000_DT).total_seconds() / 86400.0 + ut_hour / 24.0
+
+def jd_to_datetime_utc(jd: float) -> datetime:
+    """Inverse of julday_utc() → naive UTC datetime (whole seconds)."""
+    return _J2000_DT + timedelta(seconds=round((float(jd) - _J2000_JD) * 86400.0))
+
 def compute_all_planets(
     dt_utc: datetime, lat: float, lon: float,
     tz_offset_hours: float = 0.0,
@@ -48,7 +113,8 @@ def compute_all_planets(
 ) -> Tuple[float, Dict[str,float]]:
     """
     Returns sidereal longitudes (relative to whichever ayanamsa Swiss is set to).
-    If ayanamsa is provided, we set it before computing (affects global Swiss state).
+    If ayanamsa is provided it is applied atomically via EphemerisContext, so
+    concurrent calls with different ayanamsas don't race.
     IMPORTANT:
       - If dt_utc is true UTC, pass tz_offset_hours=0.0
       - If dt_utc is local civil time, pass its offset in tz_offset_hours
@@ -63,18 +129,14 @@ def compute_all_planets(
         }
         return asc, planets
 
-    # Optionally set sidereal mode (keeps previous behavior if None)
-    _maybe_set_sid_mode(ayanamsa)
-
     PLANET = {
         "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
         "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
         "Rahu": swe.TRUE_NODE, "Ketu": swe.TRUE_NODE
     }
 
-    ut_hour = dt_utc.hour + dt_utc.minute/60 + dt_utc.second/3600 - tz_offset_hours
-    jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, ut_hour, swe.GREG_CAL)
-    ayan = swe.get_ayanamsa_ut(jd)
+    jd = julday_utc(dt_utc, tz_offset_hours)
+    ayan = ephemeris_context(ayanamsa).ayanamsa_ut(jd)
 
     houses, ascmc = swe.houses_ex(jd, lat, lon, b"A")
     asc = (ascmc[0] - ayan) % 360
@@ -89,6 +151,143 @@ def compute_all_planets(
 
     return asc, positions
 
+# -------------------------
+# Batch ephemeris (many instants, one pass)
+# -------------------------
+# Column order of the batch arrays; matches the key order of compute_all_planets()
+GRAHAS: Tuple[str, ...] = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu")
+GRAHA_INDEX: Dict[str, int] = {name: i for i, name in enumerate(GRAHAS)}
+
+# Fallback offsets used by compute_all_planets() when Swiss is missing
+_FALLBACK_OFFSETS = np.array([10, 42, 80, 25, 300, 210, 150, 5, 185], dtype=float)
+# Julian day at 0001-01-01 00:00 minus one day → date.toordinal() == floor(jd - this)
+_JD_ORDINAL_ZERO = 1721424.5
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+@dataclass(frozen=True)
+class BatchPositions:
+    """
+    Sidereal positions for T instants.
+      lon, speed : (T, 9) arrays in GRAHAS order (deg, deg/day)
+      asc, mc    : (T,) arrays, or None when no lat/lon was given
+    """
+    jd: np.ndarray
+    lon: np.ndarray
+    speed: np.ndarray
+    asc: Optional[np.ndarray] = None
+    mc: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.jd.shape[0])
+
+    def column(self, name: str) -> np.ndarray:
+        return self.lon[:, GRAHA_INDEX[name]]
+
+    def positions(self, i: int) -> Dict[str, float]:
+        """Row i as the same {planet: deg} dict compute_all_planets() returns."""
+        row = self.lon[i]
+        return {name: float(row[k]) for k, name in enumerate(GRAHAS)}
+
+def _per_row(val: ArrayLike, n: int) -> np.ndarray:
+    arr = np.asarray(val, dtype=float).reshape(-1)
+    if arr.size == 1:
+        return np.full(n, float(arr[0]))
+    if arr.size != n:
+        raise ValueError(f"expected 1 or {n} values, got {arr.size}")
+    return arr
+
+def compute_all_planets_batch(
+    jds: ArrayLike,
+    lat: Optional[ArrayLike] = None,
+    lon: Optional[ArrayLike] = None,
+    ayanamsa: Optional[str] = None,
+) -> BatchPositions:
+    """
+    Vectorized counterpart of compute_all_planets() for an array of Julian days (UT).
+    lat/lon may be scalars or per-row arrays; when omitted the (location-dependent)
+    Asc/MC are skipped, which is all transit sweeps need.
+    Longitudes are identical to calling compute_all_planets() row by row; speeds come
+    for free from calc_ut (FLG_SPEED is part of the default flags), minus the
+    ayanamsa drift so they are sidereal like the longitudes.
+    """
+    jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+    n = jd_arr.size
+    with_angles = lat is not None and lon is not None
+    lats = _per_row(lat, n) if with_angles else None
+    lons = _per_row(lon, n) if with_angles else None
+
+    if not _HAS_SWE:
+        base = np.floor(jd_arr - _JD_ORDINAL_ZERO) % 360
+        lon_out = (base[:, None] + _FALLBACK_OFFSETS[None, :]) % 360
+        asc = (base + 123.45) % 360 if with_angles else None
+        return BatchPositions(jd=jd_arr, lon=lon_out, speed=np.zeros_like(lon_out), asc=asc, mc=None)
+
+    codes = [swe.SUN, swe.MOON, swe.MARS, swe.MERCURY, swe.JUPITER, swe.VENUS, swe.SATURN, swe.TRUE_NODE]
+    raw = np.empty((n, len(GRAHAS)), dtype=float)
+    spd = np.empty((n, len(GRAHAS)), dtype=float)
+    ctx = ephemeris_context(ayanamsa)
+    ayan = ctx.ayanamsa_ut_many(jd_arr.tolist())
+    ayan_rate = ctx.ayanamsa_ut_many((jd_arr + 1.0).tolist()) - ayan
+    asc = np.empty(n, dtype=float) if with_angles else None
+    mc = np.empty(n, dtype=float) if with_angles else None
+
+    calc_ut = swe.calc_ut
+    for t, jd in enumerate(jd_arr.tolist()):
+        for col, code in enumerate(codes):
+            xx = calc_ut(jd, code)[0]
+            raw[t, col] = xx[0]
+            spd[t, col] = xx[3]
+        if with_angles:
+            _, ascmc = swe.houses_ex(jd, float(lats[t]), float(lons[t]), b"A")
+            asc[t] = ascmc[0]
+            mc[t] = ascmc[1]
+
+    lon_out = (raw - ayan[:, None]) % 360
+    rahu, ketu = GRAHA_INDEX["Rahu"], GRAHA_INDEX["Ketu"]
+    lon_out[:, ketu] = (lon_out[:, rahu] + 180) % 360
+    spd -= ayan_rate[:, None]
+    spd[:, ketu] = spd[:, rahu]
+    if with_angles:
+        asc = (asc - ayan) % 360
+        mc = (mc - ayan) % 360
+    return BatchPositions(jd=jd_arr, lon=lon_out, speed=spd, asc=asc, mc=mc)
+
+_BODY_CODES: Dict[str, int] = {}
+if _HAS_SWE:
+    _BODY_CODES = {
+        "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
+        "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
+        "Rahu": swe.TRUE_NODE, "Ketu": swe.TRUE_NODE,
+    }
+
+def compute_body_batch(jds: ArrayLike, name: str, ayanamsa: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sidereal (lon, speed) arrays for a single graha at many instants; same numbers
+    as the matching column of compute_all_planets_batch() at 1/8 of the cost.
+    Event searches (ingress/station refinement) only ever need one body.
+    """
+    jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+    if not _HAS_SWE:
+        batch = compute_all_planets_batch(jd_arr, ayanamsa=ayanamsa)
+        return batch.column(name).copy(), batch.speed[:, GRAHA_INDEX[name]].copy()
+
+    ctx = ephemeris_context(ayanamsa)
+    ayan = ctx.ayanamsa_ut_many(jd_arr.tolist())
+    ayan_rate = ctx.ayanamsa_ut_many((jd_arr + 1.0).tolist()) - ayan
+    code = _BODY_CODES[name]
+    raw = np.empty(jd_arr.size, dtype=float)
+    spd = np.empty(jd_arr.size, dtype=float)
+    calc_ut = swe.calc_ut
+    for t, jd in enumerate(jd_arr.tolist()):
+        xx = calc_ut(jd, code)[0]
+        raw[t] = xx[0]
+        spd[t] = xx[3]
+    lon_out = (raw - ayan) % 360
+    if name == "Ketu":
+        lon_out = (lon_out + 180) % 360
+    return lon_out, spd - ayan_rate
+
 # astro/domain/transits.py
 
 
@@ -107,8 +306,8 @@ def compute_transit_hits_now(
     using the same aspect rules (orb, baseWeight) in AspectConfig.json.
     """
     # 1) Get transiting positions (sidereal, Lahiri if your default is Lahiri elsewhere)
-    tz0 = 0.0
-    _, tpos = compute_all_planets(dt_naive_utc, lat, lon, tz0, ayanamsa="lahiri")
+    from .table import transit_positions  # local: table.py imports this module
+    tpos = transit_positions(dt_naive_utc, ayanamsa="lahiri")
 
     # 2) Build aspect rule list (like domain/aspects.py does)
     rules = []
@@ -163,10 +362,8 @@ def compute_angles(
         asc, _ = compute_all_planets(dt_utc, lat, lon, tz_offset_hours, ayanamsa=ayanamsa)
         return {"Asc": asc}
 
-    _maybe_set_sid_mode(ayanamsa)
-    ut_hour = dt_utc.hour + dt_utc.minute/60 + dt_utc.second/3600 - tz_offset_hours
-    jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, ut_hour, swe.GREG_CAL)
-    ayan = swe.get_ayanamsa_ut(jd)
+    jd = julday_utc(dt_utc, tz_offset_hours)
+    ayan = ephemeris_context(ayanamsa).ayanamsa_ut(jd)
     houses, ascmc = swe.houses_ex(jd, lat, lon, b"A")
     asc = (ascmc[0] - ayan) % 360
     mc  = (ascmc[1] - ayan) % 360
@@ -0,0 +1,216 @@
+# goastrion-backend/astro/ephem/table.py
+"""
+Precomputed transit ephemeris table.
+
+Transit longitudes are global facts (they don't depend on the user), so we can
+build them once (`manage.py build_ephemeris_table`) and memory-map the file in
+every worker: the OS page cache then holds a single shared copy.
+
+File layout (little endian):
+  header  (64 bytes)  : magic, version, n_rows, n_bodies, jd0, step_days, ayanamsa
+  payload (float32)   : (n_rows, n_bodies, 2) → [sidereal lon, speed deg/day]
+
+Bodies are Sun..Rahu in GRAHAS order; Ketu is derived from Rahu like in swiss.py.
+Lookups use cubic Hermite interpolation (positions + speeds), which keeps the
+Moon well under an arcsecond at 1-hour steps. Anything outside the table range
+falls back to Swiss.
+"""
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .swiss import (
+    GRAHAS, GRAHA_INDEX, BatchPositions, ArrayLike,
+    compute_all_planets_batch, compute_body_batch, julday_utc,
+)
+
+_ENV_DIR = "GOASTRION_EPHEM_DIR"
+
+MAGIC = b"GAEPHTB1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIIddd16s")   # magic, version, n_rows, n_bodies, jd0, step, reserved, ayanamsa
+HEADER_SIZE = 64
+
+# Stored bodies (Ketu is derived)
+TABLE_BODIES = GRAHAS[:GRAHA_INDEX["Rahu"] + 1]
+
+
+def ephem_dir() -> Path:
+    """Directory holding generated ephemeris files (env var → repo fallback)."""
+    env = os.environ.get(_ENV_DIR)
+    if env:
+        return Path(env).expanduser().resolve()
+    here = Path(__file__).resolve().parent
+    return (here / "../../data/ephem").resolve()
+
+
+def table_path(ayanamsa: str, base: Optional[Path] = None) -> Path:
+    return (base or ephem_dir()) / f"transits_{ayanamsa.lower()}.bin"
+
+
+def write_header(fh, *, n_rows: int, jd0: float, step_days: float, ayanamsa: str) -> None:
+    head = _HEADER.pack(MAGIC, VERSION, n_rows, len(TABLE_BODIES), jd0, step_days, 0.0,
+                        ayanamsa.lower().encode("ascii")[:16])
+    fh.write(head.ljust(HEADER_SIZE, b"\0"))
+
+
+class EphemerisTable:
+    """Read-only, memory-mapped transit table for one ayanamsa."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as fh:
+            raw = fh.read(HEADER_SIZE)
+        magic, version, n_rows, n_bodies, jd0, step, _, ayan = _HEADER.unpack(raw[:_HEADER.size])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not an ephemeris table (v{VERSION})")
+        if n_bodies != len(TABLE_BODIES):
+            raise ValueError(f"{path}: expected {len(TABLE_BODIES)} bodies, got {n_bodies}")
+        self.path = Path(path)
+        self.ayanamsa = ayan.rstrip(b"\0").decode("ascii")
+        self.jd0 = float(jd0)
+        self.step = float(step)
+        self.n_rows = int(n_rows)
+        self.data = np.memmap(path, dtype="<f4", mode="r", offset=HEADER_SIZE,
+                              shape=(self.n_rows, n_bodies, 2))
+
+    @property
+    def jd_end(self) -> float:
+        return self.jd0 + (self.n_rows - 1) * self.step
+
+    def covers(self, jds: ArrayLike) -> np.ndarray:
+        jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+        return (jd_arr >= self.jd0) & (jd_arr <= self.jd_end)
+
+    def lookup(self, jds: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolated (lon, speed) arrays of shape (T, 9) for in-range Julian days.
+        Callers must check covers() first.
+        """
+        jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+        x = (jd_arr - self.jd0) / self.step
+        i0 = np.clip(np.floor(x).astype(np.int64), 0, self.n_rows - 2)
+        u = (x - i0)[:, None]
+
+        a = np.asarray(self.data[i0], dtype=float)        # (T, B, 2)
+        b = np.asarray(self.data[i0 + 1], dtype=float)
+        lon, spd = hermite(a, b, u, self.step)
+
+        rahu, ketu = GRAHA_INDEX["Rahu"], GRAHA_INDEX["Ketu"]
+        lon_out = np.empty((jd_arr.size, len(GRAHAS)), dtype=float)
+        spd_out = np.empty_like(lon_out)
+        lon_out[:, :ketu] = lon
+        spd_out[:, :ketu] = spd
+        lon_out[:, ketu] = (lon[:, rahu] + 180.0) % 360.0
+        spd_out[:, ketu] = spd[:, rahu]
+        return lon_out, spd_out
+
+
+def hermite(a: np.ndarray, b: np.ndarray, u: np.ndarray, step: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cubic Hermite (lon, speed) between rows a and b ([..., 0] lon, [..., 1]
+    speed per day) at fractions u of a step of `step` days.
+    """
+    p0, v0 = a[..., 0], a[..., 1]
+    v1 = b[..., 1]
+    # unwrap the far end so 359° → 1° is a +2° step (and retro steps stay negative)
+    p1 = p0 + ((b[..., 0] - p0 + 540.0) % 360.0 - 180.0)
+
+    u2 = u * u
+    u3 = u2 * u
+    h00 = 2 * u3 - 3 * u2 + 1
+    h10 = u3 - 2 * u2 + u
+    h01 = -2 * u3 + 3 * u2
+    h11 = u3 - u2
+    lon = (h00 * p0 + h10 * v0 * step + h01 * p1 + h11 * v1 * step) % 360.0
+    spd = v0 + (v1 - v0) * u
+    return lon, spd
+
+
+# -------------------------
+# Process-wide loader
+# -------------------------
+_TABLES: Dict[str, Optional[EphemerisTable]] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def get_table(ayanamsa: Optional[str]) -> Optional[EphemerisTable]:
+    """Open (once per process) the table for this ayanamsa, or None if not built."""
+    if not ayanamsa:
+        return None  # legacy "whatever Swiss is set to" can't be served from a table
+    key = ayanamsa.lower()
+    if key in _TABLES:
+        return _TABLES[key]
+    with _TABLES_LOCK:
+        if key not in _TABLES:
+            path = table_path(key)
+            tbl: Optional[EphemerisTable] = None
+            if path.is_file():
+                try:
+                    tbl = EphemerisTable(path)
+                except Exception:
+                    tbl = None  # corrupt/old file → Swiss
+            _TABLES[key] = tbl
+    return _TABLES[key]
+
+
+def reset_tables() -> None:
+    """Forget opened tables (after a rebuild, or in tests)."""
+    with _TABLES_LOCK:
+        _TABLES.clear()
+
+
+# -------------------------
+# Transit lookups (table first, Swiss fallback)
+# -------------------------
+def transit_positions_batch(jds: ArrayLike, ayanamsa: Optional[str] = "lahiri") -> BatchPositions:
+    """
+    Geocentric sidereal positions/speeds for many instants. Uses the memory-mapped
+    table where it covers the request and Swiss for everything else.
+    """
+    jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+    tbl = get_table(ayanamsa)
+    if tbl is None or jd_arr.size == 0:
+        return compute_all_planets_batch(jd_arr, ayanamsa=ayanamsa)
+
+    inside = tbl.covers(jd_arr)
+    if inside.all():
+        lon, spd = tbl.lookup(jd_arr)
+        return BatchPositions(jd=jd_arr, lon=lon, speed=spd)
+
+    lon = np.empty((jd_arr.size, len(GRAHAS)), dtype=float)
+    spd = np.empty_like(lon)
+    if inside.any():
+        lon[inside], spd[inside] = tbl.lookup(jd_arr[inside])
+    rest = compute_all_planets_batch(jd_arr[~inside], ayanamsa=ayanamsa)
+    lon[~inside], spd[~inside] = rest.lon, rest.speed
+    return BatchPositions(jd=jd_arr, lon=lon, speed=spd)
+
+
+def transit_body_batch(jds: ArrayLike, name: str, ayanamsa: Optional[str] = "lahiri") -> Tuple[np.ndarray, np.ndarray]:
+    """(lon, speed) of one graha for many instants; table where covered, Swiss otherwise."""
+    jd_arr = np.asarray(jds, dtype=float).reshape(-1)
+    tbl = get_table(ayanamsa)
+    if tbl is None or jd_arr.size == 0:
+        return compute_body_batch(jd_arr, name, ayanamsa)
+
+    col = GRAHA_INDEX[name]
+    inside = tbl.covers(jd_arr)
+    lon = np.empty(jd_arr.size, dtype=float)
+    spd = np.empty_like(lon)
+    if inside.any():
+        t_lon, t_spd = tbl.lookup(jd_arr[inside])
+        lon[inside], spd[inside] = t_lon[:, col], t_spd[:, col]
+    if not inside.all():
+        lon[~inside], spd[~inside] = compute_body_batch(jd_arr[~inside], name, ayanamsa)
+    return lon, spd
+
+
+def transit_positions(dt_naive_utc, ayanamsa: Optional[str] = "lahiri") -> Dict[str, float]:
+    """Single-instant convenience wrapper → {planet: deg} like compute_all_planets()."""
+    return transit_positions_batch([julday_utc(dt_naive_utc)], ayanamsa=ayanamsa).positions(0)
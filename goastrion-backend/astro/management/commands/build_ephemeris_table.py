@@ -0,0 +1,63 @@
+from __future__ import annotations
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from astro.ephem.swiss import compute_all_planets_batch, julday_utc
+from astro.ephem.table import (
+    HEADER_SIZE, TABLE_BODIES, reset_tables, table_path, write_header,
+)
+
+# rows per Swiss batch; keeps memory flat for 200-year tables
+CHUNK_ROWS = 24 * 366
+
+
+class Command(BaseCommand):
+    help = "Build the memory-mapped sidereal transit table used for transit lookups."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start-year", type=int, default=1900)
+        parser.add_argument("--end-year", type=int, default=2100, help="inclusive")
+        parser.add_argument("--step-minutes", type=int, default=60)
+        parser.add_argument("--ayanamsa", default="lahiri")
+        parser.add_argument("--out", default=None, help="output file (default: GOASTRION_EPHEM_DIR)")
+
+    def handle(self, *args, **opts):
+        start_y, end_y = int(opts["start_year"]), int(opts["end_year"])
+        step_min = int(opts["step_minutes"])
+        ayan = str(opts["ayanamsa"]).lower()
+        if end_y < start_y or step_min <= 0:
+            raise CommandError("Invalid year range or step.")
+
+        out = Path(opts["out"]) if opts.get("out") else table_path(ayan)
+        out.parent.mkdir(parents=True, exist_ok=True)
+
+        jd0 = julday_utc(datetime(start_y, 1, 1))
+        jd1 = julday_utc(datetime(end_y + 1, 1, 1))
+        step = step_min / 1440.0
+        n_rows = int(np.floor((jd1 - jd0) / step)) + 1
+        n_bodies = len(TABLE_BODIES)
+
+        t0 = time.perf_counter()
+        tmp = out.with_suffix(out.suffix + ".tmp")
+        with open(tmp, "wb") as fh:
+            write_header(fh, n_rows=n_rows, jd0=jd0, step_days=step, ayanamsa=ayan)
+            for lo in range(0, n_rows, CHUNK_ROWS):
+                hi = min(lo + CHUNK_ROWS, n_rows)
+                bp = compute_all_planets_batch(jd0 + np.arange(lo, hi) * step, ayanamsa=ayan)
+                block = np.empty((hi - lo, n_bodies, 2), dtype="<f4")
+                block[..., 0] = bp.lon[:, :n_bodies]
+                block[..., 1] = bp.speed[:, :n_bodies]
+                fh.write(block.tobytes())
+        os.replace(tmp, out)
+        reset_tables()
+
+        size_mb = (HEADER_SIZE + n_rows * n_bodies * 2 * 4) / 1e6
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {n_rows} rows ({start_y}-{end_y}, {step_min} min, {ayan}) "
+            f"to {out} [{size_mb:.1f} MB] in {time.perf_counter() - t0:.1f}s."
+        ))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from astro.domain.events import catalog_path, reset_event_catalogs, scan_planet_events
+from astro.ephem.swiss import GRAHAS, julday_utc
+
+# the Moon's catalog is ~100k events for 200 years; build it explicitly if wanted
+DEFAULT_PLANETS = "Sun,Mercury,Venus,Mars,Jupiter,Saturn,Rahu,Ketu"
+
+
+class Command(BaseCommand):
+    help = "Build planet event catalogs (ingress, nakshatra, station, combustion) for transit lookups."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--planets", default=DEFAULT_PLANETS, help="comma separated, e.g. Saturn,Jupiter")
+        parser.add_argument("--start-year", type=int, default=1900)
+        parser.add_argument("--end-year", type=int, default=2100, help="inclusive")
+        parser.add_argument("--ayanamsa", default="lahiri")
+        parser.add_argument("--out-dir", default=None, help="output directory (default: GOASTRION_EPHEM_DIR)")
+
+    def handle(self, *args, **opts):
+        start_y, end_y = int(opts["start_year"]), int(opts["end_year"])
+        ayan = str(opts["ayanamsa"]).lower()
+        planets = [p.strip().capitalize() for p in str(opts["planets"]).split(",") if p.strip()]
+        if end_y < start_y:
+            raise CommandError("Invalid year range.")
+        unknown = [p for p in planets if p not in GRAHAS]
+        if unknown:
+            raise CommandError(f"Unknown planet(s): {', '.join(unknown)}")
+
+        jd0 = julday_utc(datetime(start_y, 1, 1))
+        jd1 = julday_utc(datetime(end_y + 1, 1, 1))
+        for planet in planets:
+            out = catalog_path(planet, ayan)
+            if opts.get("out_dir"):
+                out = Path(opts["out_dir"]) / out.name
+            out.parent.mkdir(parents=True, exist_ok=True)
+
+            t0 = time.perf_counter()
+            events = scan_planet_events(planet, jd0, jd1, ayan)
+            tmp = out.with_suffix(out.suffix + ".tmp")
+            tmp.write_text(json.dumps(events.to_json(ayan)), encoding="utf-8")
+            os.replace(tmp, out)
+
+            n_st = len(events.motion.changes) if events.motion else 0
+            n_cb = len(events.combust.changes) if events.combust else 0
+            self.stdout.write(
+                f"{planet}: {len(events.sign.changes)} ingresses, {len(events.nakshatra.changes)} nakshatra, "
+                f"{n_st} stations, {n_cb} combustion edges in {time.perf_counter() - t0:.1f}s"
+            )
+        reset_event_catalogs()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(planets)} catalog(s) ({start_y}-{end_y}, {ayan})."))
@@ -0,0 +1,38 @@
+from __future__ import annotations
+import os
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from astro.services.daily_precompute import precompute_daily, prune_before
+
+
+class Command(BaseCommand):
+    help = "Precompute tomorrow's /daily payload for every saved chart (run nightly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--date", default=None, help="YYYY-MM-DD (default: tomorrow in each chart's time zone)")
+        parser.add_argument("--chunk-size", type=int, default=200, help="charts per query / pool task")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes; 1 runs in-process")
+        parser.add_argument("--keep-days", type=int, default=2, help="drop rows older than this many days")
+
+    def handle(self, *args, **opts):
+        day = None
+        if opts.get("date"):
+            try:
+                day = date.fromisoformat(opts["date"])
+            except ValueError:
+                raise CommandError("Invalid --date, expected YYYY-MM-DD.")
+        chunk_size, workers = int(opts["chunk_size"]), int(opts["workers"])
+        if chunk_size <= 0 or workers <= 0:
+            raise CommandError("--chunk-size and --workers must be positive.")
+
+        def progress(chunk_no, stored, failed, seconds):
+            self.stdout.write(f"chunk {chunk_no}: {stored} stored, {failed} failed in {seconds:.1f}s")
+
+        totals = precompute_daily(day=day, chunk_size=chunk_size, workers=workers, progress=progress)
+        pruned = prune_before(date.today() - timedelta(days=int(opts["keep_days"])))
+        self.stdout.write(self.style.SUCCESS(
+            f"Precomputed {totals['stored']}/{totals['charts']} chart(s) in {totals['chunks']} chunk(s), "
+            f"{totals['seconds']:.1f}s with {workers} worker(s); pruned {pruned} old row(s)."
+        ))
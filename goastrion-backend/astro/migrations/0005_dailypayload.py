@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 19:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('astro', '0004_natalrecord'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPayload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('inputs_key', models.CharField(db_index=True, max_length=40)),
+                ('phase', models.CharField(max_length=16)),
+                ('payload', models.JSONField(default=dict)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('chart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_payloads', to='astro.chart')),
+            ],
+            options={
+                'unique_together': {('chart', 'day')},
+            },
+        ),
+    ]
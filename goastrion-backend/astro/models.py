@@ -3,6 +3,22 @@ from django.db import models
 from django.conf import settings
 
 
+class NatalRecord(models.Model):
+    """Precomputed natal chart (positions, houses, dasha, insights) shared by every request for the same birth."""
+    fingerprint = models.CharField(max_length=40, unique=True)  # birth instant + rounded lat/lon + ayanamsa + engine
+    engine_version = models.CharField(max_length=16)
+    birth_datetime = models.DateTimeField()
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    ayanamsa = models.CharField(max_length=16, default="lahiri")
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.birth_datetime:%Y-%m-%d %H:%M} ({self.latitude:.4f}, {self.longitude:.4f}) [{self.fingerprint}]"
+
+
 class Chart(models.Model):
     """Stores user's birth details (used for chart generation)."""
     user = models.ForeignKey(
@@ -17,6 +33,13 @@ class Chart(models.Model):
     longitude = models.FloatField()
     timezone = models.CharField(max_length=64)
     place = models.CharField(max_length=150, blank=True, null=True)
+    natal = models.ForeignKey(
+        NatalRecord,
+        on_delete=models.SET_NULL,
+        related_name="charts",
+        blank=True,
+        null=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -30,3 +53,19 @@ class Chart(models.Model):
 
     def __str__(self):
         return f"{self.name or 'Unnamed Chart'} ({self.user.username})"
+
+
+class DailyPayload(models.Model):
+    """Precomputed /daily payload (pre-i18n) for a saved chart and local day, see precompute_daily."""
+    chart = models.ForeignKey(Chart, on_delete=models.CASCADE, related_name="daily_payloads")
+    day = models.DateField()
+    inputs_key = models.CharField(max_length=40, db_index=True)  # daily_cache.daily_inputs_key
+    phase = models.CharField(max_length=16)  # day_phase at compute time, e.g. "0.0"
+    payload = models.JSONField(default=dict)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("chart", "day")
+
+    def __str__(self):
+        return f"{self.chart_id} {self.day} [{self.inputs_key}]"
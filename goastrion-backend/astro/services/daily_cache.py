@@ -0,0 +1,84 @@
+# astro/services/daily_cache.py
+"""
+Payload cache for /daily.
+
+assemble_daily() + apply_i18n_daily() are deterministic for a chart, local
+day, time zone, request options and language, except for the "future-aware"
+choice of best/green windows. That choice only changes when `now` passes a
+green window's end or comes within 20 minutes of its start (day_phase), so the
+localized payload is cached per phase:
+
+  key = daily:v1:<inputs key, lang>:<phase>
+  inputs key = <natal fingerprint, day, tz, options>
+
+The day's window scan itself is cached in daily_core (scan_day_ranges), which
+is what makes the phase cheap to compute on a hit. On a miss, a row written by
+precompute_daily (DailyPayload, pre-i18n) with the same inputs key and phase
+is localized instead of assembling. Cache/DB errors only cost a recomputation.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from django.core.cache import cache
+
+from ..i18n import _pick_lang, apply_i18n_daily
+from ..utils.cache import fingerprint
+from .daily_core import day_phase, scan_day_ranges
+from .daily_personalizer import assemble_daily, daily_inputs
+from .natal_store import load_natal
+
+DAILY_CACHE_TTL = 6 * 3600
+_KEY_PREFIX = "daily:v1:"
+# not options: the birth itself is in the natal fingerprint, for_date is the day
+_INPUT_FIELDS = ("birth", "datetime", "lat", "lon", "for_date")
+
+
+def daily_inputs_key(data: Dict[str, Any]) -> Tuple[str, ZoneInfo, date, List[Tuple[datetime, datetime]]]:
+    """(inputs key, tz, local day, green ranges) for a /daily request body."""
+    dt_aw, lat, lon, tz, day_override = daily_inputs(data)
+    day = day_override or datetime.now(tz).date()
+    natal = load_natal(dt_aw, lat, lon, ayanamsa="lahiri")
+    greens, _ = scan_day_ranges(tz, natal.points(), None, day)
+
+    options = {k: v for k, v in data.items() if k not in _INPUT_FIELDS}
+    return fingerprint([natal.fingerprint, day.isoformat(), str(tz), options]), tz, day, greens
+
+
+def phase_label(phase: Tuple[int, int]) -> str:
+    return f"{phase[0]}.{phase[1]}"
+
+
+def _precomputed(inputs_key: str, phase: str) -> Optional[Dict[str, Any]]:
+    from ..models import DailyPayload
+    try:
+        row = DailyPayload.objects.filter(inputs_key=inputs_key, phase=phase).only("payload").first()
+    except Exception:
+        return None  # no DB / table not migrated yet
+    return row.payload if row else None
+
+
+def daily_payload(data: Dict[str, Any], locale: Optional[str] = None, accept_language: Optional[str] = None) -> Dict[str, Any]:
+    """Localized /daily payload, served from the cache when nothing relevant changed."""
+    inputs_key, tz, _, greens = daily_inputs_key(data)
+    phase = phase_label(day_phase(greens, datetime.now(tz)))
+    key = f"{_KEY_PREFIX}{fingerprint([inputs_key, _pick_lang(locale, accept_language)])}:{phase}"
+
+    try:
+        payload = cache.get(key)
+    except Exception:
+        payload = None
+    if payload is not None:
+        return payload
+
+    raw = _precomputed(inputs_key, phase)
+    payload = apply_i18n_daily(raw if raw is not None else assemble_daily(data), locale=locale, accept_language=accept_language)
+    # only store if we did not cross a phase boundary while assembling
+    if phase_label(day_phase(greens, datetime.now(tz))) == phase:
+        try:
+            cache.set(key, payload, DAILY_CACHE_TTL)
+        except Exception:
+            pass
+    return payload
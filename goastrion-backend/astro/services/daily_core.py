@@ -1,18 +1,26 @@
 # goastrion-backend/astro/services/daily_core.py
 from __future__ import annotations
 
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone, date
 from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 import re
 
+import numpy as np
+
 # --- project deps ---
 from ..utils.time import parse_client_iso_to_aware_utc
 from ..utils.config import load_config
-from ..ephem.swiss import compute_all_planets, compute_angles
-from ..dasha.vimshottari import compute_vimshottari_full, DashaTimeline
-from ..domain.transits import compute_transit_hits_now
+from ..utils.cache import BoundedCache, fingerprint
+from .natal import natal_fingerprint
+from .natal_store import load_natal
+from ..dasha.vimshottari import DashaTimeline
+from ..domain.aspect_kernel import linear_hits, orb_deltas, rule_arrays, separation
+from ..domain.transits import compute_transit_hits_batch
+from ..ephem.swiss import GRAHA_INDEX, GRAHAS, julday_utc
+from ..ephem.day_snapshot import snapshot_positions
 
 # --- optional Panchang (if your util exists) ---
 try:
@@ -74,8 +82,9 @@ def _tz(tz_str: str) -> ZoneInfo:
         return ZoneInfo("Asia/Kolkata")
 
 
-# we keep last birth context so split modules can fetch MD/AD without re-threading args
-_LAST_BIRTH_CONTEXT: Dict[str, Any] = {}
+# we keep last birth context so split modules can fetch MD/AD without re-threading args;
+# a ContextVar keeps it per request (thread / async task) instead of process-wide
+_LAST_BIRTH_CONTEXT: ContextVar[Dict[str, Any]] = ContextVar("daily_birth_context", default={})
 
 def parse_birth_or_legacy(data: Dict[str, Any]) -> Tuple[datetime, float, float]:
     """
@@ -86,50 +95,43 @@ def parse_birth_or_legacy(data: Dict[str, Any]) -> Tuple[datetime, float, float]
     if "datetime" in data and "lat" in data and "lon" in data:
         dt_aw = parse_client_iso_to_aware_utc(str(data.get("datetime")).strip())
         lat = float(data.get("lat")); lon = float(data.get("lon"))
-        _LAST_BIRTH_CONTEXT.update({"dt_aw": dt_aw, "lat": lat, "lon": lon})
+        _LAST_BIRTH_CONTEXT.set({"dt_aw": dt_aw, "lat": lat, "lon": lon})
         return dt_aw, lat, lon
     b = data.get("birth") or {}
     if not all(k in b for k in ("date", "time", "lat", "lon")):
         raise DailyError("Missing birth fields (need date, time, lat, lon) or legacy datetime/lat/lon.")
     dt_aw = parse_client_iso_to_aware_utc(f"{b['date']}T{b['time']}:00Z")
     lat = float(b["lat"]); lon = float(b["lon"])
-    _LAST_BIRTH_CONTEXT.update({"dt_aw": dt_aw, "lat": lat, "lon": lon})
+    _LAST_BIRTH_CONTEXT.set({"dt_aw": dt_aw, "lat": lat, "lon": lon})
     return dt_aw, lat, lon
 
 
 def natal_points(dt_naive_utc: datetime, lat: float, lon: float) -> Dict[str, float]:
-    angles = compute_angles(dt_naive_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-    _, natal = compute_all_planets(dt_naive_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri")
-    pts: Dict[str, float] = {}
-    if angles.get("Asc") is not None: pts["Asc"] = float(angles["Asc"])
-    if angles.get("MC")  is not None: pts["MC"]  = float(angles["MC"])
-    for k, v in natal.items(): pts[k] = float(v)
-    return pts
+    """
+    Asc/MC + planets (Lahiri) from the natal store. The NatalContext is kept in
+    the birth context so current_md_ad() can reuse its dasha timeline.
+    """
+    natal = load_natal(dt_naive_utc, lat, lon, ayanamsa="lahiri")
+    ctx = _LAST_BIRTH_CONTEXT.get()
+    if ctx.get("dt_aw") is not None and natal_fingerprint(ctx["dt_aw"], ctx["lat"], ctx["lon"]) == natal.fingerprint:
+        _LAST_BIRTH_CONTEXT.set({**ctx, "natal": natal})
+    return natal.points()
 
 
 def current_md_ad(tl: Optional[DashaTimeline], day: date) -> Tuple[Optional[str], Optional[str]]:
     """
     Return (MD, AD) for given day.
-    If timeline is None, we rebuild from the last seen birth context.
+    If timeline is None, we use the natal of the last seen birth context
+    (already in the natal store, so nothing is rebuilt).
     """
     if tl is None:
-        ctx = _LAST_BIRTH_CONTEXT
+        ctx = _LAST_BIRTH_CONTEXT.get()
         dt_aw = ctx.get("dt_aw"); lat = ctx.get("lat"); lon = ctx.get("lon")
         if dt_aw is None or lat is None or lon is None:
             return None, None
-        tl = compute_vimshottari_full(dt_aw, float(lat), float(lon), 0.0, horizon_years=120.0)
-
-    md = ad = None
-    for mdp in tl.mahadashas:
-        if mdp.start.date() <= day <= mdp.end.date():
-            md = mdp.lord
-            key = f"{mdp.lord}@{mdp.start.replace(tzinfo=timezone.utc).isoformat()}"
-            for adp in tl.antardashas.get(key, []):
-                if adp.start.date() <= day <= adp.end.date():
-                    ad = adp.lord
-                    break
-            break
-    return md, ad
+        natal = ctx.get("natal") or load_natal(dt_aw, float(lat), float(lon), ayanamsa="lahiri")
+        tl = natal.dasha
+    return tl.lords_on(day)
 
 
 # ---------------------- ASCII and romanize ---------------------- #
@@ -179,9 +181,7 @@ def support_stress_scores(
     Returns per-planet Support & Stress (0..100), plus 'why' tags.
     """
     aspect_cfg = _get_aspect_cfg(aspect_cfg)
-    hits = compute_transit_hits_now(
-        dt_naive_utc=sample_dt, lat=lat, lon=lon, natal_points=natal_pts, aspect_cfg=aspect_cfg
-    )
+    hits = _hits_cached(sample_dt, lat, lon, natal_pts, aspect_cfg)
     support: Dict[str, float] = {p: 0.0 for p in COLOR.keys()}
     stress:  Dict[str, float] = {p: 0.0 for p in COLOR.keys()}
     tags_support: List[str] = []
@@ -238,66 +238,209 @@ def _merge_ranges(ranges: List[Tuple[datetime, datetime]], min_len_min=25, max_m
 
 
 # ---- small perf cache for transit hits during sampling ----
-_HITS_CACHE: Dict[str, Dict[str, Any]] = {}
-
-def _hits_cached(dt_utc_naive: datetime, lat: float, lon: float, natal_pts: Dict[str, float], aspect_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    key = f"{dt_utc_naive.isoformat()}@{round(lat,4)}:{round(lon,4)}"
-    if key not in _HITS_CACHE:
-        _HITS_CACHE[key] = compute_transit_hits_now(
-            dt_naive_utc=dt_utc_naive, lat=lat, lon=lon, natal_points=natal_pts, aspect_cfg=aspect_cfg
+# Hits depend on the natal points and the aspect rules, not just time + place,
+# so both are part of the key (transits are Lahiri, see compute_transit_hits_now).
+# The transit positions themselves come from the shared day snapshot.
+_HITS_CACHE = BoundedCache("daily.transit_hits", maxsize=4096, ttl=6 * 3600)
+_HITS_MISSING = object()
+
+def hits_context_key(natal_pts: Dict[str, float], aspect_cfg: Dict[str, Any]) -> Tuple[str, str, str]:
+    return fingerprint(natal_pts, ndigits=6), "lahiri", fingerprint(aspect_cfg)
+
+def _hits_cached(
+    dt_utc_naive: datetime, lat: float, lon: float, natal_pts: Dict[str, float],
+    aspect_cfg: Dict[str, Any], ctx_key: Optional[Tuple[str, str, str]] = None,
+) -> Dict[str, Any]:
+    return _hits_cached_many([dt_utc_naive], lat, lon, natal_pts, aspect_cfg, ctx_key)[0]
+
+def _hits_cached_many(
+    dts_utc_naive: List[datetime], lat: float, lon: float, natal_pts: Dict[str, float],
+    aspect_cfg: Dict[str, Any], ctx_key: Optional[Tuple[str, str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Cached hits per instant; the misses are computed together in one kernel pass."""
+    ctx_key = ctx_key or hits_context_key(natal_pts, aspect_cfg)
+    keys = [(dt.isoformat(), round(lat, 4), round(lon, 4)) + ctx_key for dt in dts_utc_naive]
+    out = [_HITS_CACHE.get(k, _HITS_MISSING) for k in keys]
+    todo = [i for i, v in enumerate(out) if v is _HITS_MISSING]
+    if todo:
+        dts = [dts_utc_naive[i] for i in todo]
+        fresh = compute_transit_hits_batch(
+            dts_naive_utc=dts, lat=lat, lon=lon, natal_points=natal_pts, aspect_cfg=aspect_cfg,
+            transit_lon=snapshot_positions([julday_utc(dt) for dt in dts]).lon,
         )
-    return _HITS_CACHE[key]
+        for i, hits in zip(todo, fresh):
+            _HITS_CACHE.set(keys[i], hits)
+            out[i] = hits
+    return out
 
 
-def sample_day_windows(
-    tz: ZoneInfo, lat: float, lon: float, natal_pts: Dict[str, float],
-    aspect_cfg: Optional[Dict[str, Any]] = None, day: Optional[date] = None
-) -> Tuple[Dict[str, str], List[Dict[str, str]], List[Dict[str, str]], str]:
+# ---- adaptive intraday scan ----
+# Within a day only the Moon moves far enough to change which aspects are in
+# orb. Slow planets come from one mid-day position + speed; the Moon is Hermite-
+# interpolated from 3-hourly positions. The score is then cheap at any minute,
+# so green/caution boundaries are refined by bisection instead of a fixed grid.
+_SCAN_STEP_MIN = 30        # coarse grid; its samples also set the percentile cuts
+_SCAN_TOL_MIN = 1.0        # boundary precision
+_MOON_NODE_MIN = 180
+_BENE_ASPECTS = {"Trine", "Sextile", "Conjunction"}
+_MALE_ASPECTS = {"Square", "Opposition", "Conjunction"}
+
+
+class _IntradayScore:
+    """score(t) = benefic - 0.9 * malefic aspect hits, t in minutes from start_utc."""
+
+    def __init__(self, start_utc: datetime, span_min: float, natal_pts: Dict[str, float], aspect_cfg: Dict[str, Any]):
+        n_nodes = int(np.ceil(span_min / _MOON_NODE_MIN)) + 1
+        self.nodes = np.arange(n_nodes, dtype=float) * _MOON_NODE_MIN
+        jd0 = julday_utc(start_utc)
+        batch = snapshot_positions(jd0 + self.nodes / 1440.0)
+        lon = np.asarray(batch.lon, dtype=float)
+        spd = np.asarray(batch.speed, dtype=float) / 1440.0            # deg/min
+
+        ref = n_nodes // 2                                             # slow planets: one mid-day row
+        self.t_ref = self.nodes[ref]
+        self.slow_lon, self.slow_spd = lon[ref], spd[ref]
+        moon = GRAHA_INDEX["Moon"]
+        self.moon_lon = np.unwrap(lon[:, moon], period=360.0)
+        self.moon_spd = spd[:, moon]
+
+        rules = rule_arrays(aspect_cfg, weight_keys=("baseWeight", "weight"))
+        self.rules = rules
+        self.natal = np.array([float(v) for v in natal_pts.values()], dtype=float)
+        # +1 benefic support, -0.9 malefic stress, per (planet, rule)
+        self.coef = np.array([
+            [(1.0 if p in BENEFIC and r in _BENE_ASPECTS else 0.0)
+             - (0.9 if p in MALEFIC and r in _MALE_ASPECTS else 0.0) for r in rules.names]
+            for p in GRAHAS
+        ], dtype=float)
+
+    def positions(self, t: np.ndarray) -> np.ndarray:
+        """(T, 9) sidereal longitudes at minutes t."""
+        t = np.asarray(t, dtype=float)
+        lon = self.slow_lon[None, :] + self.slow_spd[None, :] * (t - self.t_ref)[:, None]
+        lon[:, GRAHA_INDEX["Moon"]] = self._moon(t)
+        return np.mod(lon, 360.0)
+
+    def _moon(self, t: np.ndarray) -> np.ndarray:
+        k = np.clip(np.searchsorted(self.nodes, t, side="right") - 1, 0, len(self.nodes) - 2)
+        h = self.nodes[k + 1] - self.nodes[k]
+        u = (t - self.nodes[k]) / h
+        y0, y1 = self.moon_lon[k], self.moon_lon[k + 1]
+        m0, m1 = self.moon_spd[k] * h, self.moon_spd[k + 1] * h
+        u2, u3 = u * u, u * u * u
+        return ((2 * u3 - 3 * u2 + 1) * y0 + (u3 - 2 * u2 + u) * m0
+                + (-2 * u3 + 3 * u2) * y1 + (u3 - u2) * m1)
+
+    def __call__(self, t: np.ndarray) -> np.ndarray:
+        sep = separation(self.positions(t)[:, :, None], self.natal)   # (T, P, N)
+        _, score = linear_hits(orb_deltas(sep, self.rules.angle), self.rules.orb, self.rules.weight)
+        return np.einsum("tpnr,pr->t", score, self.coef)
+
+
+def _threshold_runs(f: _IntradayScore, grid: np.ndarray, inside: np.ndarray, cut: float, above: bool) -> List[Tuple[float, float]]:
     """
-    Practical day scan:
-      • Samples 06:00–21:00 local every 30m for the given day
-      • score = benefic - 0.9*malefic
-      • Merges greens/cautions; picks longest future green for "best"
+    [start, end] minute ranges where f is above (or below) cut. Every grid
+    step whose ends disagree holds a crossing; all of them are bisected together.
     """
-    aspect_cfg = _get_aspect_cfg(aspect_cfg)
+    if not inside.any():
+        return []
+    flips = np.flatnonzero(inside[1:] != inside[:-1])
+    lo, hi = grid[flips].copy(), grid[flips + 1].copy()
+    lo_in = inside[flips]
+    while len(lo) and np.max(hi - lo) > _SCAN_TOL_MIN:
+        mid = (lo + hi) / 2
+        v = f(mid)
+        mid_in = v >= cut if above else v <= cut
+        go_hi = mid_in == lo_in                                      # crossing is in the upper half
+        lo = np.where(go_hi, mid, lo)
+        hi = np.where(go_hi, hi, mid)
+    cross = np.round((lo + hi) / 2)
+
+    runs: List[Tuple[float, float]] = []
+    start = grid[0] if inside[0] else None
+    for c, was_in in zip(cross, lo_in):
+        if was_in:
+            runs.append((start, c))
+            start = None
+        else:
+            start = c
+    if start is not None:
+        runs.append((start, grid[-1]))
+    return runs
 
-    now_l = datetime.now(tz)
+
+_SCAN_CACHE = BoundedCache("daily.day_scan", maxsize=2048, ttl=24 * 3600)
+
+
+def scan_day_ranges(
+    tz: ZoneInfo, natal_pts: Dict[str, float], aspect_cfg: Optional[Dict[str, Any]] = None, day: Optional[date] = None,
+) -> Tuple[List[Tuple[datetime, datetime]], List[Tuple[datetime, datetime]]]:
+    """
+    Merged (greens, cautions) ranges for one local day, 06:00–21:00; score =
+    benefic - 0.9*malefic. Thresholds come from a 30m grid (top 25% = green,
+    bottom 15% = caution) and edges are refined to the minute. Independent of
+    the time of day, so cached per natal points / rules / tz / day.
+    """
+    aspect_cfg = _get_aspect_cfg(aspect_cfg)
     if day is None:
-        day = now_l.date()
+        day = datetime.now(tz).date()
+    key = hits_context_key(natal_pts, aspect_cfg) + (str(tz), day.isoformat())
+    return _SCAN_CACHE.get_or_set(key, lambda: _scan_day_ranges(tz, natal_pts, aspect_cfg, day))
+
+
+def _scan_day_ranges(tz: ZoneInfo, natal_pts: Dict[str, float], aspect_cfg: Dict[str, Any], day: date):
     start_l = datetime(day.year, day.month, day.day, 6, 0, 0, tzinfo=tz)
     end_l   = datetime(day.year, day.month, day.day, 21, 0, 0, tzinfo=tz)
+    span_min = (end_l - start_l).total_seconds() / 60.0
+    if span_min < 0:
+        return [], []
 
-    cursor = start_l
-    samples: List[Tuple[datetime, float]] = []
-    while cursor <= end_l:
-        dt_utc = cursor.astimezone(timezone.utc).replace(tzinfo=None)
-        hits = _hits_cached(dt_utc, lat, lon, natal_pts, aspect_cfg)
-        bene = sum(h["score"] for h in hits.get("aspect", [])
-                   if h["planet"] in BENEFIC and h["aspect"] in {"Trine", "Sextile", "Conjunction"})
-        male = sum(h["score"] for h in hits.get("aspect", [])
-                   if h["planet"] in MALEFIC and h["aspect"] in {"Square", "Opposition", "Conjunction"})
-        score = bene - 0.9 * male
-        samples.append((cursor, score))
-        cursor += timedelta(minutes=30)
-
-    if not samples:
-        return {}, [], [], "supportive timing"
-
-    # Thresholds: top 25% = green, bottom 15% = caution
-    values = [s for _, s in samples]
-    v_sorted = sorted(values)
+    score = _IntradayScore(start_l.astimezone(timezone.utc).replace(tzinfo=None), span_min, natal_pts, aspect_cfg)
+    grid = np.arange(0.0, span_min + 1e-9, _SCAN_STEP_MIN)
+    values = score(grid)
+
+    v_sorted = np.sort(values)
     def pct(p: float) -> float:
         idx = max(0, min(len(v_sorted) - 1, int(round((len(v_sorted) - 1) * p))))
-        return v_sorted[idx]
+        return float(v_sorted[idx])
 
     green_cut = pct(0.75)
     caution_cut = pct(0.15)
 
-    greens_slots = [(t - timedelta(minutes=15), t + timedelta(minutes=15)) for (t, s) in samples if s >= green_cut]
-    caut_slots   = [(t - timedelta(minutes=20), t + timedelta(minutes=20)) for (t, s) in samples if s <= caution_cut]
+    def to_ranges(runs: List[Tuple[float, float]]) -> List[Tuple[datetime, datetime]]:
+        return [(start_l + timedelta(minutes=float(a)), start_l + timedelta(minutes=float(b))) for a, b in runs]
+
+    greens = _merge_ranges(to_ranges(_threshold_runs(score, grid, values >= green_cut, green_cut, True)),
+                           min_len_min=25, max_merge_gap_min=5)
+    cauts  = _merge_ranges(to_ranges(_threshold_runs(score, grid, values <= caution_cut, caution_cut, False)),
+                           min_len_min=25, max_merge_gap_min=5)
+    return greens, cauts
+
 
-    greens = _merge_ranges(greens_slots, min_len_min=25, max_merge_gap_min=5)
-    cauts  = _merge_ranges(caut_slots,   min_len_min=25, max_merge_gap_min=5)
+def day_phase(greens: List[Tuple[datetime, datetime]], now: datetime) -> Tuple[int, int]:
+    """
+    Where `now` sits among the green windows: (# already over, # starting within
+    20 min or earlier). Everything time-of-day dependent in the daily payload
+    (future-aware best / greens) is constant while this is.
+    """
+    return (sum(1 for _, e in greens if e < now),
+            sum(1 for s, _ in greens if s - timedelta(minutes=20) <= now))
+
+
+def sample_day_windows(
+    tz: ZoneInfo, lat: float, lon: float, natal_pts: Dict[str, float],
+    aspect_cfg: Optional[Dict[str, Any]] = None, day: Optional[date] = None
+) -> Tuple[Dict[str, str], List[Dict[str, str]], List[Dict[str, str]], str]:
+    """
+    Practical day scan (see scan_day_ranges); picks the longest future green for "best".
+    """
+    aspect_cfg = _get_aspect_cfg(aspect_cfg)
+    ctx_key = hits_context_key(natal_pts, aspect_cfg)
+
+    now_l = datetime.now(tz)
+    if day is None:
+        day = now_l.date()
+    greens, cauts = scan_day_ranges(tz, natal_pts, aspect_cfg, day)
 
     # Future-aware: prefer windows starting >= now
     greens_future = [r for r in greens if r[1] >= now_l]
@@ -314,7 +457,7 @@ def sample_day_windows(
     if best_block:
         mid = best_block[0] + (best_block[1] - best_block[0]) / 2
         dt_utc_mid = mid.astimezone(timezone.utc).replace(tzinfo=None)
-        hmid = _hits_cached(dt_utc_mid, lat, lon, natal_pts, aspect_cfg)
+        hmid = _hits_cached(dt_utc_mid, lat, lon, natal_pts, aspect_cfg, ctx_key)
         bene_hits = [h for h in hmid.get("aspect", [])
                      if h["planet"] in BENEFIC and h["aspect"] in {"Trine", "Sextile", "Conjunction"}]
         if bene_hits:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone, timedelta, date
 from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 import re
 
 # ---- shared helpers/constants live in daily_core.py (same package) ----
@@ -298,6 +299,36 @@ def _force_humanize_actions_do(actions: Dict[str, List[Dict[str, Any]]]) -> None
 
 
 # ---------------------- main assembly ---------------------- #
+def daily_inputs(data: Dict[str, Any]) -> Tuple[datetime, float, float, ZoneInfo, Optional[date]]:
+    """
+    Birth (aware UTC) + site, the local time zone and the optional for_date
+    preview day; shared by assemble_daily and the daily payload cache.
+    """
+    # Optional preview date (YYYY-MM-DD) for Today/Tomorrow UI
+    day_override: Optional[date] = None
+    if isinstance(data.get("for_date"), str) and data["for_date"]:
+        try:
+            day_override = date.fromisoformat(data["for_date"])
+        except Exception:
+            day_override = None
+
+    # Inputs → UTC birth/legacy + site
+    dt_aw, lat, lon = parse_birth_or_legacy(data)
+    if not (-90 <= float(lat) <= 90 and -180 <= float(lon) <= 180):
+        raise DailyError("lat/lon out of range")
+
+    # Resolve time zone: use provided tz, else auto-guess from lat/lon, else default
+    tz_str_in = str(data.get("tz") or "").strip()
+    tz_guess: Optional[str] = None
+    if not tz_str_in and _TF:
+        try:
+            tz_guess = _TF.timezone_at(lat=float(lat), lng=float(lon))
+        except Exception:
+            tz_guess = None
+    tz = _tz(tz_str_in or tz_guess or "Asia/Kolkata")
+    return dt_aw, lat, lon, tz, day_override
+
+
 def assemble_daily(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Builds the daily payload from inputs. Phrasing kept simple & clear for all users.
@@ -325,28 +356,7 @@ def assemble_daily(data: Dict[str, Any]) -> Dict[str, Any]:
     ascii_fallback = bool(data.get("ascii_fallback", False))
     force_disclaimer = bool(data.get("include_disclaimer", False))
 
-    # Optional preview date (YYYY-MM-DD) for Today/Tomorrow UI
-    day_override: Optional[date] = None
-    if isinstance(data.get("for_date"), str) and data["for_date"]:
-        try:
-            day_override = date.fromisoformat(data["for_date"])
-        except Exception:
-            day_override = None
-
-    # Inputs → UTC birth/legacy + site
-    dt_aw, lat, lon = parse_birth_or_legacy(data)
-    if not (-90 <= float(lat) <= 90 and -180 <= float(lon) <= 180):
-        raise DailyError("lat/lon out of range")
-
-    # Resolve time zone: use provided tz, else auto-guess from lat/lon, else default
-    tz_str_in = str(data.get("tz") or "").strip()
-    tz_guess: Optional[str] = None
-    if not tz_str_in and _TF:
-        try:
-            tz_guess = _TF.timezone_at(lat=float(lat), lng=float(lon))
-        except Exception:
-            tz_guess = None
-    tz = _tz(tz_str_in or tz_guess or "Asia/Kolkata")
+    dt_aw, lat, lon, tz, day_override = daily_inputs(data)
 
     # Natal + dasha context
     dt_naive_utc = dt_aw.replace(tzinfo=None)
@@ -0,0 +1,123 @@
+# astro/services/daily_precompute.py
+"""
+Nightly precompute of /daily for every saved chart.
+
+For each Chart we build the body the web client sends for "today", with
+for_date set to tomorrow in the chart's time zone, and store the pre-i18n
+assemble_daily() output in DailyPayload under the same inputs key the live
+path computes (daily_cache.daily_inputs_key). In the morning daily_payload()
+finds the row and only localizes it.
+
+Computed for tomorrow, `now` is before every window, so rows carry phase
+"0.0": they answer requests until 20 minutes before the first green window;
+later phases are assembled live (and then cached) as before.
+
+Charts are read in id-ordered chunks; each chunk is one pool task
+(utils.pool; ephemeris work is CPU bound).
+"""
+from __future__ import annotations
+
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+
+from ..utils.pool import run_pool
+from .daily_cache import daily_inputs_key, phase_label
+from .daily_core import _tz, day_phase
+from .daily_personalizer import assemble_daily
+
+# what the web client (DailyClient) sends besides birth + tz
+PRECOMPUTE_OPTIONS: Dict[str, Any] = {"persona": "manager"}
+_CHART_FIELDS = ("id", "birth_datetime", "latitude", "longitude", "timezone")
+
+Row = Tuple[int, date, str, str, Dict[str, Any]]  # chart_id, day, inputs_key, phase, payload
+
+
+def chart_request(chart: Dict[str, Any], day: Optional[date] = None) -> Dict[str, Any]:
+    """/daily body for a Chart row (values() dict); day defaults to tomorrow in the chart's tz."""
+    if day is None:
+        day = datetime.now(_tz(chart["timezone"])).date() + timedelta(days=1)
+    return {
+        "datetime": chart["birth_datetime"].isoformat(),
+        "lat": chart["latitude"], "lon": chart["longitude"],
+        "tz": chart["timezone"],
+        **PRECOMPUTE_OPTIONS,
+        "for_date": day.isoformat(),
+    }
+
+
+def compute_chunk(charts: List[Dict[str, Any]], day: Optional[date] = None) -> Tuple[List[Row], int]:
+    """(rows, #failed) for one chunk; runs in a pool worker."""
+    rows: List[Row] = []
+    failed = 0
+    for c in charts:
+        try:
+            data = chart_request(c, day)
+            inputs_key, tz, d, greens = daily_inputs_key(data)
+            phase = phase_label(day_phase(greens, datetime.now(tz)))
+            rows.append((c["id"], d, inputs_key, phase, assemble_daily(data)))
+        except Exception:
+            failed += 1  # bad birth data / tz: left to the live path
+    return rows, failed
+
+
+def store_rows(rows: List[Row]) -> None:
+    from ..models import DailyPayload
+    with transaction.atomic():
+        for chart_id, d, inputs_key, phase, payload in rows:
+            DailyPayload.objects.update_or_create(
+                chart_id=chart_id, day=d,
+                defaults={"inputs_key": inputs_key, "phase": phase, "payload": payload},
+            )
+
+
+def chart_chunks(chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Charts as values() dicts, chunk_size at a time (keyset pagination on id)."""
+    from ..models import Chart
+    last = 0
+    while True:
+        chunk = list(Chart.objects.filter(id__gt=last).order_by("id").values(*_CHART_FIELDS)[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]["id"]
+
+
+def prune_before(day: date) -> int:
+    from ..models import DailyPayload
+    deleted, _ = DailyPayload.objects.filter(day__lt=day).delete()
+    return deleted
+
+
+def precompute_daily(
+    day: Optional[date] = None,
+    chunk_size: int = 200,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int, int, float], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Precompute and store every chart's daily payload. workers defaults to the
+    CPU count; workers <= 1 runs in-process. progress(chunk_no, stored,
+    failed, seconds) is called as each chunk is written.
+    """
+    workers = workers or os.cpu_count() or 1
+    t0 = time.perf_counter()
+    totals = {"charts": 0, "stored": 0, "failed": 0, "chunks": 0}
+
+    def _done(result: Tuple[List[Row], int], seconds: float) -> None:
+        rows, failed = result
+        store_rows(rows)
+        totals["chunks"] += 1
+        totals["stored"] += len(rows)
+        totals["failed"] += failed
+        totals["charts"] += len(rows) + failed
+        if progress:
+            progress(totals["chunks"], len(rows), failed, seconds)
+
+    run_pool(compute_chunk, ((chunk, day) for chunk in chart_chunks(chunk_size)), workers, _done)
+
+    totals["seconds"] = round(time.perf_counter() - t0, 2)
+    return totals
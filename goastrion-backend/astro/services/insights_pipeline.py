@@ -4,9 +4,12 @@ from typing import Any, Dict, List, Set, Tuple
 from datetime import datetime
 
 from ..utils.config import load_config
-from ..utils.time import parse_client_iso_to_aware_utc, aware_utc_to_naive
-from ..ephem.swiss import compute_all_planets, get_sign_name, deg_to_sign_index
-from ..utils.astro import assign_planets_to_houses, sign_lord_for
+from ..utils.cache import fingerprint
+from ..utils.time import parse_client_iso_to_aware_utc
+from ..ephem.swiss import get_sign_name, deg_to_sign_index
+from ..utils.astro import sign_lord_for
+from .natal import NatalContext
+from .natal_store import load_natal, natal_section
 from ..domain.aspects import compute_aspects
 from ..domain.rules import evaluate_domains_v11, evaluate_skills_v11
 
@@ -40,13 +43,10 @@ def _parse_and_validate(data: Dict[str, Any]) -> Tuple[datetime, float, float, f
     return dt_aw_utc, lat, lon, float(data.get("tz_offset_hours", 0.0))
 
 
-def _compute_chart(dt_aw_utc: datetime, lat: float, lon: float):
-    dt_naive_utc = aware_utc_to_naive(dt_aw_utc)
-    lagna_deg, positions = compute_all_planets(
-        dt_naive_utc, lat, lon, tz_offset_hours=0.0, ayanamsa="lahiri"
-    )
+def _compute_chart(natal: NatalContext):
+    lagna_deg, positions = natal.asc, dict(natal.positions)
     lagna_sign = get_sign_name(lagna_deg)
-    bins = assign_planets_to_houses(lagna_deg, positions)  # {1:[..], ...}
+    bins = {h: list(v) for h, v in natal.houses.items()}  # {1:[..], ...}; copy, rules may mutate
     asc_sign_idx = deg_to_sign_index(lagna_deg)
     chart_lords: Dict[int, str] = {}
     for h in range(1, 13):
@@ -88,13 +88,33 @@ def run_insights(payload: Dict[str, Any]) -> Dict[str, Any]:
     # 2) input
     dt_aw_utc, lat, lon, tz_off = _parse_and_validate(payload)
 
-    # 3) chart primitives
-    lagna_deg, lagna_sign, bins, chart_lords, planets_deg, positions = _compute_chart(dt_aw_utc, lat, lon)
+    # 3) natal chart + insights: computed once per birth/config, then served from the natal store
+    natal = load_natal(dt_aw_utc, lat, lon)
+    body = natal_section(
+        natal, "insights", fingerprint([aspect_cfg, domain_rules]),
+        lambda: _insights_body(natal, aspect_cfg, domain_rules),
+    )
 
-    # 4) aspects (deterministic natal)
+    # 4) final envelope
+    return {
+        "input": {
+            "datetime": payload.get("datetime"),
+            "lat": lat,
+            "lon": lon,
+            "tz_offset_hours": tz_off,
+        },
+        **body,
+    }
+
+
+def _insights_body(natal: NatalContext, aspect_cfg: Dict[str, Any], domain_rules: Dict[str, Any]) -> Dict[str, Any]:
+    # chart primitives
+    lagna_deg, lagna_sign, bins, chart_lords, planets_deg, positions = _compute_chart(natal)
+
+    # aspects (deterministic natal)
     aspects = compute_aspects(planets_deg, aspect_cfg)
 
-    # 5) domains & skills
+    # domains & skills
     domain_result = evaluate_domains_v11(
         domain_rules_json=domain_rules,
         aspect_cfg=aspect_cfg,
@@ -111,7 +131,7 @@ def run_insights(payload: Dict[str, Any]) -> Dict[str, Any]:
         aspects=aspects,
     )
 
-    # 6) excellence booster (+ gentle curve) — pass ALL FOUR args
+    # excellence booster (+ gentle curve) — pass ALL FOUR args
     apply_excellence(
         domains_list=domains_list,
         skills_list=skills_list,
@@ -119,7 +139,7 @@ def run_insights(payload: Dict[str, Any]) -> Dict[str, Any]:
         aspect_cfg=aspect_cfg,
     )
 
-    # 7) assemble context for FE debugging
+    # assemble context for FE debugging
     context = {
         "lagna_deg": lagna_deg,
         "lagna_sign": lagna_sign,
@@ -129,14 +149,7 @@ def run_insights(payload: Dict[str, Any]) -> Dict[str, Any]:
         "aspects": _serialize_aspects(aspects),
     }
 
-    # 8) final envelope
     return {
-        "input": {
-            "datetime": payload.get("datetime"),
-            "lat": lat,
-            "lon": lon,
-            "tz_offset_hours": tz_off,
-        },
         "config": {
             "aspectVersion": str(aspect_cfg.get("version")),
             "domainVersion": str(domain_rules.get("version")),
@@ -0,0 +1,153 @@
+# astro/services/natal.py
+"""
+Request-scoped natal context.
+
+A birth chart is a pure function of (instant, place, ayanamsa), yet one request
+used to ask Swiss for it several times: angles, planets, the summary, the dasha
+Moon and a debug Moon. NatalContext does a single ephemeris pass and hands the
+same numbers to every consumer; derived pieces (houses, dasha timeline) are
+computed on first use.
+
+to_payload()/from_payload() give a JSON form for the persistent natal store
+(services/natal_store.py); fingerprint identifies the birth across requests.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..ephem.swiss import compute_all_planets_batch, julday_utc
+from ..dasha.vimshottari import (
+    DashaTimeline, LazyAntardashas, Period, compute_vimshottari_full, _nakshatra_index_and_fraction,
+)
+from ..utils.astro import assign_planets_to_houses
+from ..utils.cache import fingerprint as _fingerprint
+
+# Bump when anything feeding the natal payload changes (ephemeris, houses, dasha rules)
+ENGINE_VERSION = "1"
+
+
+@dataclass(frozen=True)
+class NatalContext:
+    """Sidereal natal chart for one birth instant (UTC) and place."""
+    dt_aw: datetime                  # aware UTC
+    lat: float
+    lon: float
+    ayanamsa: str
+    jd: float
+    asc: float
+    mc: Optional[float]              # None when Swiss is unavailable
+    positions: Dict[str, float]      # {planet: deg}, compute_all_planets() order
+    speeds: Dict[str, float]         # {planet: deg/day}
+
+    @classmethod
+    def build(cls, dt_utc: datetime, lat: float, lon: float, ayanamsa: str = "lahiri") -> "NatalContext":
+        """dt_utc may be aware (any zone) or naive UTC."""
+        if dt_utc.tzinfo is None:
+            dt_aw = dt_utc.replace(tzinfo=timezone.utc)
+        else:
+            dt_aw = dt_utc.astimezone(timezone.utc)
+        jd = julday_utc(dt_aw.replace(tzinfo=None))
+        batch = compute_all_planets_batch([jd], float(lat), float(lon), ayanamsa=ayanamsa)
+        mc = float(batch.mc[0]) if batch.mc is not None else None
+        speeds = {name: float(v) for name, v in zip(batch.positions(0), batch.speed[0])}
+        return cls(
+            dt_aw=dt_aw, lat=float(lat), lon=float(lon), ayanamsa=ayanamsa, jd=jd,
+            asc=float(batch.asc[0]), mc=mc, positions=batch.positions(0), speeds=speeds,
+        )
+
+    @property
+    def dt_naive(self) -> datetime:
+        return self.dt_aw.replace(tzinfo=None)
+
+    @property
+    def moon(self) -> float:
+        return self.positions["Moon"]
+
+    def angles(self) -> Dict[str, float]:
+        """Same shape as compute_angles(): Asc, plus MC when available."""
+        out = {"Asc": self.asc}
+        if self.mc is not None:
+            out["MC"] = self.mc
+        return out
+
+    def points(self) -> Dict[str, float]:
+        """Asc/MC + planets, the natal_points mapping used by transit scoring."""
+        pts = self.angles()
+        pts.update(self.positions)
+        return pts
+
+    def nakshatra(self) -> Tuple[int, float]:
+        """(index 0..26, fraction elapsed 0..1) of the natal Moon."""
+        return _nakshatra_index_and_fraction(self.moon)
+
+    @cached_property
+    def houses(self) -> Dict[int, list]:
+        return assign_planets_to_houses(self.asc, self.positions)
+
+    @cached_property
+    def dasha(self) -> DashaTimeline:
+        """Full Vimshottari timeline (120y); reuses our Moon when it is Lahiri."""
+        moon = self.moon if self.ayanamsa == "lahiri" else None
+        return compute_vimshottari_full(self.dt_aw, self.lat, self.lon, 0.0, horizon_years=120.0, moon_lon=moon)
+
+    # -------------------------
+    # Persistence helpers
+    # -------------------------
+    @cached_property
+    def fingerprint(self) -> str:
+        return natal_fingerprint(self.dt_aw, self.lat, self.lon, self.ayanamsa)
+
+    def to_payload(self) -> Dict[str, Any]:
+        tl = self.dasha
+        return {
+            "engine": ENGINE_VERSION,
+            "datetime": self.dt_aw.isoformat(),
+            "lat": self.lat, "lon": self.lon, "ayanamsa": self.ayanamsa, "jd": self.jd,
+            "asc": self.asc, "mc": self.mc,
+            "positions": self.positions, "speeds": self.speeds,
+            "houses": {str(h): list(v) for h, v in self.houses.items()},
+            "vimshottari": [
+                [_period_row(md), [_period_row(ad) for ad in tl.antardashas_of(i)]]
+                for i, md in enumerate(tl.mahadashas)
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, data: Dict[str, Any]) -> "NatalContext":
+        natal = cls(
+            dt_aw=datetime.fromisoformat(data["datetime"]),
+            lat=float(data["lat"]), lon=float(data["lon"]), ayanamsa=data["ayanamsa"],
+            jd=float(data["jd"]), asc=float(data["asc"]),
+            mc=float(data["mc"]) if data.get("mc") is not None else None,
+            positions={k: float(v) for k, v in data["positions"].items()},
+            speeds={k: float(v) for k, v in data["speeds"].items()},
+        )
+        # seed the lazy pieces so nothing is recomputed
+        rows = data["vimshottari"]
+        mds: List[Period] = [_period_from_row(md_row) for md_row, _ in rows]
+        ads = [[_period_from_row(r) for r in ad_rows] for _, ad_rows in rows]
+        natal.__dict__["dasha"] = DashaTimeline(mahadashas=mds, antardashas=LazyAntardashas(mds, seeded=ads))
+        natal.__dict__["houses"] = {int(h): list(v) for h, v in data["houses"].items()}
+        return natal
+
+
+def natal_fingerprint(dt_utc: datetime, lat: float, lon: float, ayanamsa: str = "lahiri") -> str:
+    """Birth instant (UTC) + lat/lon rounded to 4 dp (~11 m) + ayanamsa + engine version."""
+    if dt_utc.tzinfo is not None:
+        dt_utc = dt_utc.astimezone(timezone.utc).replace(tzinfo=None)
+    return _fingerprint({
+        "dt": dt_utc.isoformat(), "lat": round(float(lat), 4), "lon": round(float(lon), 4),
+        "ayanamsa": (ayanamsa or "").lower(), "engine": ENGINE_VERSION,
+    })
+
+
+def _period_row(p: Period) -> list:
+    return [p.lord, p.start.isoformat(), p.end.isoformat(), p.years]
+
+
+def _period_from_row(row: list) -> Period:
+    lord, start, end, years = row
+    return Period(lord=lord, start=datetime.fromisoformat(start), end=datetime.fromisoformat(end), years=float(years))
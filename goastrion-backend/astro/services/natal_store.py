@@ -0,0 +1,117 @@
+# astro/services/natal_store.py
+"""
+Persistent natal store.
+
+Returning users send the same birth data to /chart, /insights, /shubhdin,
+/saturn/overview and /daily again and again. We keep the natal computation in
+NatalRecord (one row per birth fingerprint, see NatalContext.fingerprint) with
+a small in-process LRU in front of it, so a repeat visit is a lookup:
+
+  payload = NatalContext.to_payload()            # positions, angles, houses, dasha
+          + {"sections": {name: {"version", "data"}}}   # e.g. run_insights output
+
+The DB is an optimisation only: any DB error falls back to computing in memory.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.cache import BoundedCache
+from .natal import ENGINE_VERSION, NatalContext, natal_fingerprint
+
+_NATAL_CACHE = BoundedCache("natal.contexts", maxsize=512, ttl=3600)
+_SECTION_CACHE = BoundedCache("natal.sections", maxsize=512, ttl=3600)
+_MISSING = object()
+
+
+def _fetch(fp: str):
+    from ..models import NatalRecord
+    try:
+        return NatalRecord.objects.filter(fingerprint=fp).first()
+    except Exception:
+        return None  # no DB / table not migrated yet
+
+
+def _persist(natal: NatalContext, sections: Optional[Dict[str, Any]] = None, replace: bool = False):
+    """
+    Create (or with replace=True, overwrite) the row for this birth and merge in
+    sections; returns it, or None if the DB is unavailable.
+    """
+    from ..models import NatalRecord
+    try:
+        rec = None if replace else NatalRecord.objects.filter(fingerprint=natal.fingerprint).first()
+        if rec is None:
+            payload = natal.to_payload()
+            payload["sections"] = dict(sections or {})
+            rec, _ = NatalRecord.objects.update_or_create(
+                fingerprint=natal.fingerprint,
+                defaults={
+                    "engine_version": ENGINE_VERSION,
+                    "birth_datetime": natal.dt_aw,
+                    "latitude": natal.lat, "longitude": natal.lon,
+                    "ayanamsa": natal.ayanamsa,
+                    "payload": payload,
+                },
+            )
+        elif sections:
+            rec.payload.setdefault("sections", {}).update(sections)
+            rec.save(update_fields=["payload", "updated_at"])
+        return rec
+    except Exception:
+        return None
+
+
+def load_natal(dt_utc: datetime, lat: float, lon: float, ayanamsa: str = "lahiri") -> NatalContext:
+    """NatalContext for this birth: memory → NatalRecord → fresh computation (then stored)."""
+    fp = natal_fingerprint(dt_utc, lat, lon, ayanamsa)
+    natal = _NATAL_CACHE.get(fp)
+    if natal is not None:
+        return natal
+
+    rec = _fetch(fp)
+    if rec is not None:
+        try:
+            natal = NatalContext.from_payload(rec.payload)
+        except Exception:
+            natal = None  # malformed payload → recompute and overwrite below
+    if natal is None:
+        natal = NatalContext.build(dt_utc, lat, lon, ayanamsa=ayanamsa)
+        _persist(natal, replace=rec is not None)
+    _NATAL_CACHE.set(fp, natal)
+    return natal
+
+
+def natal_section(natal: NatalContext, name: str, version: str, factory: Callable[[], Any]) -> Any:
+    """
+    A derived, JSON-able result stored next to the natal payload (e.g. insights).
+    version should change whenever the inputs besides the birth do (config files).
+    Values come back JSON-normalised, whether fresh or cached.
+    """
+    key = (natal.fingerprint, name, version)
+    data = _SECTION_CACHE.get(key, _MISSING)
+    if data is not _MISSING:
+        return data
+
+    rec = _fetch(natal.fingerprint)
+    entry = ((rec.payload or {}).get("sections") or {}).get(name) if rec is not None else None
+    if isinstance(entry, dict) and entry.get("version") == version:
+        data = entry.get("data")
+    else:
+        data = json.loads(json.dumps(factory(), default=str))
+        _persist(natal, {name: {"version": version, "data": data}})
+    _SECTION_CACHE.set(key, data)
+    return data
+
+
+def natal_record(dt_utc: datetime, lat: float, lon: float, ayanamsa: str = "lahiri"):
+    """The NatalRecord row for this birth (created if needed), for linking saved charts."""
+    natal = load_natal(dt_utc, lat, lon, ayanamsa)
+    return _fetch(natal.fingerprint) or _persist(natal)
+
+
+def reset_natal_cache() -> None:
+    """Drop the in-process layer (tests, or after bumping ENGINE_VERSION)."""
+    _NATAL_CACHE.clear()
+    _SECTION_CACHE.clear()
@@ -0,0 +1,586 @@
+# astro/services/shubhdin_engine.py
+"""
+ShubhDin engine: best windows/dates per life goal over the next months.
+
+Pure entry point run(ShubhDinInput) → the /shubhdin/run JSON payload, usable
+from the API view, batch precompute jobs and benchmarks alike.
+
+Pipeline:
+  1) natal points + Vimshottari lords (natal store)
+  2) one goal-independent pass over H_MAX days (transits at 09:00 local,
+     transit→natal aspects, dasha lords, combust flag)
+  3) Saturn context (saturn_overview) → per-day masks and tags
+  4) per goal: dasha × Saturn multipliers as array transforms, normalise,
+     pick windows according to its GoalSpec
+
+Goals are data (GoalSpec) registered in GOALS; register_goal() adds more.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from ..dasha.vimshottari import DASHA_ORDER
+from ..domain.aspect_kernel import best_aspect, hit_rows, separation, sequential_sum
+from ..domain.saturn_watch import saturn_overview
+from ..ephem.swiss import GRAHA_INDEX, julday_utc
+from ..ephem.table import transit_positions_batch
+from ..shubhdin_helpers import (
+    best_window,
+    dates_in_range,
+    dedupe_windows,
+    duration_days,
+    grow_window,
+    non_overlapping_top_windows,
+)
+from ..utils.config import load_config
+from .natal import NatalContext
+from .natal_store import load_natal
+
+
+# ---------------------- input / goal specs ---------------------- #
+
+@dataclass(frozen=True)
+class ShubhDinInput:
+    """Validated request: aware UTC birth instant, place and sweep options."""
+    dt_aw: datetime
+    lat: float
+    lon: float
+    tz_str: str = "Asia/Kolkata"
+    horizon_months: int = 12                 # clamped to 1..24
+    goals: Optional[Sequence[str]] = None    # None → every registered goal
+    business_type: str = "other"
+    today: Optional[date] = None             # None → today in tz_str (set it for reproducible runs)
+
+
+@dataclass(frozen=True)
+class GoalSpec:
+    """
+    How one goal turns scored days into windows.
+      picker        : "best" (single best span) or "top" (k non-overlapping spans)
+      span          : window length in days, or a callable(inp) → days
+      clamp_span    : shrink span to the horizon instead of giving up
+      min_horizon   : minimum sweep length in days (capped at 24 months)
+      cautions      : which day flags become "no big transactions" dates
+      cautions_t    : fixed caution lines shown first
+      explain       : callable(inp, best_day | None) → explain_t list
+    """
+    key: str
+    picker: str
+    span: Any
+    cutoff: float
+    patience: int
+    limit: int
+    explain: Callable[["ShubhDinInput", Optional[Dict[str, Any]]], List[Dict[str, Any]]]
+    k: int = 1
+    clamp_span: bool = False
+    min_horizon: Optional[int] = None
+    cautions: Tuple[str, ...] = ()
+    cautions_t: Tuple[Dict[str, Any], ...] = ()
+    confidence: str = "medium"
+    dasha_support: frozenset = field(default_factory=frozenset)
+    dasha_contra: frozenset = field(default_factory=frozenset)
+    sade_sati_penalty: float = 0.98
+
+    def span_for(self, inp: ShubhDinInput) -> int:
+        return int(self.span(inp) if callable(self.span) else self.span)
+
+    def horizon_days(self, horizon_months: int) -> int:
+        h = horizon_months * 30
+        if self.min_horizon is not None:
+            h = min(24 * 30, max(h, self.min_horizon))
+        return h
+
+
+GOALS: Dict[str, GoalSpec] = {}
+
+
+def register_goal(spec: GoalSpec) -> GoalSpec:
+    """Add (or replace) a goal; results come out in registration order."""
+    GOALS[spec.key] = spec
+    return spec
+
+
+class ShubhDinError(Exception):
+    pass
+
+
+# ---------------------- i18n helpers ---------------------- #
+
+def _t(key: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {"key": key, "args": (args or {})}
+
+
+def _headline_t(windows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    spans = [
+        {"start": w["start"], "end": w["end"], "days": int(w.get("duration_days") or 0)}
+        for w in (windows or [])
+    ]
+    return {"key": "sd.headline.best_windows", "args": {"spans": spans}}
+
+
+def _aspect_tag_t(p1: str, name: str, p2: str) -> Dict[str, Any]:
+    return {"key": "sd.aspect.tag", "args": {"p1": p1, "name": name, "p2": p2}}
+
+
+def _dasha_tag_t(kind: str, lord: str) -> Dict[str, Any]:
+    k = "sd.dasha.md" if kind == "MD" else "sd.dasha.ad"
+    return {"key": k, "args": {"lord": lord}}
+
+
+def _no_big_txn_t(dates_iso: List[str], more: int = 0) -> Dict[str, Any]:
+    obj = {"key": "sd.caution.no_big_txn", "args": {"dates": dates_iso}}
+    if more:
+        obj["args"]["more"] = more
+    return obj
+
+
+def _with_date(key: str) -> Callable[[ShubhDinInput, Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """explain_t builder: the day-specific line only when a best day exists."""
+    return lambda inp, best: [_t(key, {"date": best["date"]})] if best else []
+
+
+# ---------------------- goal registry ---------------------- #
+
+_BUSINESS_SPAN = {
+    "tech": 45, "ecom": 40, "retail": 28, "services": 40,
+    "manufacturing": 60, "real_estate": 50, "other": 40
+}
+
+register_goal(GoalSpec(
+    key="promotion", picker="best", span=7, cutoff=60.0, patience=3, limit=1,
+    cautions=("station",),
+    cautions_t=(_t("sd.caution.rahukaal", {"start": "16:30", "end": "17:15"}),),
+    explain=lambda inp, best: [_t("sd.explain.career_houses")] + _with_date("sd.explain.leverage_date")(inp, best),
+    dasha_support=frozenset({"Sun","Saturn","Mercury","Jupiter"}), dasha_contra=frozenset({"Rahu","Ketu"}),
+    sade_sati_penalty=0.96,
+))
+register_goal(GoalSpec(
+    key="job_change", picker="top", span=7, k=2, cutoff=60.0, patience=3, limit=2,
+    cautions=("station",), cautions_t=(_t("sd.caution.watch_combust"),),
+    explain=lambda inp, best: [_t("sd.explain.jobchange_core")],
+    dasha_support=frozenset({"Mercury","Jupiter","Mars","Sun"}), dasha_contra=frozenset({"Rahu","Ketu"}),
+    sade_sati_penalty=0.96,
+))
+register_goal(GoalSpec(
+    key="startup", picker="best", span=45, clamp_span=True, cutoff=62.0, patience=4, limit=1,
+    explain=lambda inp, best: [_t("sd.explain.startup_green")] + _with_date("sd.explain.incop_near")(inp, best),
+    dasha_support=frozenset({"Jupiter","Mercury","Sun","Venus"}), dasha_contra=frozenset({"Saturn","Rahu","Ketu"}),
+))
+register_goal(GoalSpec(
+    key="property", picker="top", span=3, k=3, cutoff=60.0, patience=2, limit=3,
+    cautions=("station",), cautions_t=(_t("sd.caution.skip_rahukaal_gulika"),), confidence="high",
+    explain=lambda inp, best: [_t("sd.explain.property_core")],
+    dasha_support=frozenset({"Venus","Saturn","Jupiter","Moon"}), dasha_contra=frozenset({"Mars","Rahu","Ketu"}),
+))
+register_goal(GoalSpec(
+    key="marriage", picker="best", span=24, cutoff=60.0, patience=4, limit=1,
+    min_horizon=18 * 30,  # ensure ~≥18 months for marriage
+    cautions=("station",),
+    explain=lambda inp, best: [_t("sd.explain.marriage_core")] + _with_date("sd.explain.particularly_good")(inp, best),
+    dasha_support=frozenset({"Venus","Moon","Jupiter"}), dasha_contra=frozenset({"Saturn","Mars","Rahu","Ketu"}),
+    sade_sati_penalty=0.97,
+))
+register_goal(GoalSpec(
+    key="business_expand", picker="top", span=21, k=2, cutoff=62.0, patience=4, limit=2,
+    cautions=("combust", "station"),
+    explain=lambda inp, best: [_t("sd.explain.expand_core"), _t("sd.explain.use_spans_launches")],
+    dasha_support=frozenset({"Jupiter","Mercury","Venus","Sun"}), dasha_contra=frozenset({"Rahu","Ketu","Saturn"}),
+))
+register_goal(GoalSpec(
+    key="business_start", picker="top", k=2, clamp_span=True, cutoff=62.0, patience=4, limit=2,
+    span=lambda inp: _BUSINESS_SPAN.get(inp.business_type, 40),
+    cautions=("combust", "station"),
+    explain=lambda inp, best: (
+        [_t("sd.explain.start_core_typed", {"type": inp.business_type})]
+        + _with_date("sd.explain.incop_commence_near")(inp, best)
+    ),
+    dasha_support=frozenset({"Jupiter","Mercury","Venus","Sun"}), dasha_contra=frozenset({"Rahu","Ketu","Saturn"}),
+))
+register_goal(GoalSpec(
+    key="new_relationship", picker="top", span=10, k=2, cutoff=58.0, patience=4, limit=2,
+    explain=lambda inp, best: [_t("sd.explain.relationship_core"), _t("sd.explain.use_spans_social")],
+    dasha_support=frozenset({"Venus","Moon","Jupiter"}), dasha_contra=frozenset({"Saturn","Mars","Rahu","Ketu"}),
+    sade_sati_penalty=0.97,
+))
+
+
+# ---------------------- scoring ---------------------- #
+
+ASPECTS = [
+    ("Conjunction", 0.0,   4.0, 1.00),
+    ("Sextile",     60.0,  2.0, 0.85),
+    ("Square",      90.0,  2.0, 0.65),
+    ("Trine",       120.0, 3.0, 1.00),
+    ("Opposition",  180.0, 3.0, 0.85),
+]
+
+_TRANSITING = ("Sun","Moon","Mercury","Venus","Mars","Jupiter","Saturn","Rahu","Ketu")
+
+# ASPECTS as kernel arrays; Trine/Sextile hits become tags
+_ASPECT_NAMES = tuple(a[0] for a in ASPECTS)
+_ASPECT_ANGLE = np.array([a[1] for a in ASPECTS], dtype=float)
+_ASPECT_ORB = np.array([a[2] for a in ASPECTS], dtype=float)
+_ASPECT_BASE = np.array([a[3] for a in ASPECTS], dtype=float)
+_TAG_ASPECTS = np.array([k for k, a in enumerate(ASPECTS) if a[0] in ("Trine", "Sextile")])
+
+
+def normalize_scores_wide(daylist: List[Dict[str, Any]], raw_key: str = "raw", out_key: str = "score") -> None:
+    """
+    Wider, robust normalization:
+      p50 -> ~58, p90 -> ~90, p97 -> ~97; clamp [3, 99]
+    """
+    vals = [float(d.get(raw_key, 0.0)) for d in daylist]
+    if not vals:
+        return
+    sv = sorted(vals)
+    n = len(sv)
+
+    def pct(p: float) -> float:
+        if n == 1:
+            return sv[0]
+        idx = p * (n - 1)
+        lo = int(idx)
+        hi = min(lo + 1, n - 1)
+        frac = idx - lo
+        return sv[lo] * (1 - frac) + sv[hi] * frac
+
+    p50 = pct(0.50)
+    p90 = pct(0.90)
+    p97 = pct(0.97)
+
+    for d in daylist:
+        x = float(d.get(raw_key, 0.0))
+        if x <= p50:
+            denom = max(1e-6, (p50 - sv[0]))
+            z = (x - sv[0]) / denom if denom > 1e-9 else 0.0
+            s = 3 + 55 * max(0.0, min(1.0, z))
+        elif x <= p90:
+            denom = max(1e-6, (p90 - p50))
+            z = (x - p50) / denom
+            s = 58 + 30 * max(0.0, min(1.0, z))
+        else:
+            denom = (p97 - p90) if p97 > p90 else (sv[-1] - p90 + 1e-6)
+            z = (x - p90) / max(1e-6, denom)
+            s = 88 + 11 * max(0.0, min(1.0, z))
+        d[out_key] = round(max(3.0, min(99.0, s)), 2)
+
+
+@dataclass
+class _Sweep:
+    """Goal-independent per-day data for one request (index 0 = today)."""
+    today: date
+    day_iso: List[str]
+    base: List[Tuple[float, Dict[str, Any]]]
+    base_raw: np.ndarray
+    md_col: np.ndarray
+    ad_col: np.ndarray
+    sat_mask: Dict[str, np.ndarray]
+    sat_tags: List[List[str]]
+    station_days: set
+
+    def dasha_multipliers(self, spec: GoalSpec) -> np.ndarray:
+        # lord → column; index -1 (the extra slot) means "no lord"
+        sup = np.array([lord in spec.dasha_support for lord in DASHA_ORDER] + [False], dtype=bool)
+        con = np.array([lord in spec.dasha_contra for lord in DASHA_ORDER] + [False], dtype=bool)
+        m = np.ones(len(self.day_iso), dtype=float)
+        m = np.where(sup[self.md_col], m * 1.20, m)
+        m = np.where(sup[self.ad_col], m * 1.10, m)
+        m = np.where(con[self.md_col], m * 0.90, m)
+        m = np.where(con[self.ad_col], m * 0.95, m)
+        return m
+
+    def saturn_multipliers(self, spec: GoalSpec) -> np.ndarray:
+        mask = self.sat_mask
+        m = np.ones(len(self.day_iso), dtype=float)
+        m = np.where(mask["station"], m * 0.95, m)
+        m = np.where(mask["sade_sati"], m * spec.sade_sati_penalty, m)
+        m = np.where(mask["retro"], m * 0.98, m)
+        m = np.where(mask["ashtama"] | mask["kantaka"], m * 0.97, m)
+        m = np.where(mask["support"], m * 1.04, m)
+        m = np.where(mask["stress"], m * 0.96, m)
+        return m
+
+    def sweep_goal(self, spec: GoalSpec, days_count: int) -> List[Dict[str, Any]]:
+        raw = self.base_raw * self.dasha_multipliers(spec) * self.saturn_multipliers(spec)
+        out: List[Dict[str, Any]] = []
+        for i in range(min(days_count, len(self.day_iso))):
+            # per-goal copy: window pickers append MD/AD tags to the meta lists
+            meta = dict(self.base[i][1])
+            meta["tags"] = list(dict.fromkeys((meta.get("tags") or []) + self.sat_tags[i]))[:5]
+            meta["tags_t"] = list(meta.get("tags_t") or [])
+            out.append({"date": self.day_iso[i], "raw": float(raw[i]), "meta": meta})
+        normalize_scores_wide(out, raw_key="raw", out_key="score")
+        return out
+
+
+def _saturn_days(sat_ctx: Dict[str, Any], today: date, horizon: int) -> Dict[str, set]:
+    def _collect_windows(section: str) -> List[Tuple[str, str]]:
+        wins: List[Tuple[str, str]] = []
+        sec = sat_ctx.get(section)
+        if isinstance(sec, dict):
+            for w in (sec.get("windows") or []):
+                a = w.get("start"); b = w.get("end")
+                if a and b: wins.append((a, b))
+        return wins
+
+    def _collect_days_in_windows(wins: List[Tuple[str, str]]) -> set:
+        if not wins:
+            return set()
+        out: set = set()
+        cur = today
+        end = today + timedelta(days=horizon)
+        while cur <= end:
+            iso = cur.isoformat()
+            for a, b in wins:
+                if a <= iso <= b:
+                    out.add(iso); break
+            cur += timedelta(days=1)
+        return out
+
+    def _collect_station_days_from_ss() -> set:
+        out: set = set()
+        ss = (sat_ctx.get("sade_sati") or {})
+        for w in ss.get("windows", []):
+            for d in (w.get("stations") or []):
+                if isinstance(d, str): out.add(d)
+        return out
+
+    def _collect_hit_days(key: str) -> set:
+        out: set = set()
+        for it in (sat_ctx.get(key) or []):
+            d = it.get("date")
+            if isinstance(d, str): out.add(d)
+        return out
+
+    retro_wins = [(w.get("start"), w.get("end")) for w in (sat_ctx.get("retrograde") or []) if w.get("start") and w.get("end")]
+    return {
+        "station": _collect_station_days_from_ss(),
+        "sade_sati": _collect_days_in_windows(_collect_windows("sade_sati")),
+        "retro": _collect_days_in_windows(retro_wins),
+        "ashtama": _collect_days_in_windows(_collect_windows("ashtama")),
+        "kantaka": _collect_days_in_windows(_collect_windows("kantaka")),
+        "support": _collect_hit_days("support_hits"),
+        "stress": _collect_hit_days("stress_hits"),
+    }
+
+
+_SAT_TAG_LABELS = (
+    ("station", "Saturn Station"), ("sade_sati", "Sade Sati"), ("retro", "Saturn Retro"),
+    ("ashtama", "Ashtama (Saturn)"), ("kantaka", "Kantaka (Saturn)"),
+    ("support", "Saturn Support"), ("stress", "Saturn Stress"),
+)
+
+
+def _build_sweep(
+    inp: ShubhDinInput, natal: NatalContext, aspect_cfg: Dict[str, Any],
+    user_tz: ZoneInfo, today: date, horizon: int,
+) -> _Sweep:
+    natal_points = natal.points()
+    benefics = set(aspect_cfg.get("benefics", []))
+    malefics = set(aspect_cfg.get("malefics", []))
+
+    def local_date_to_naive_utc(d: date, hour_local: int = 9) -> datetime:
+        dt_local = datetime(d.year, d.month, d.day, hour_local, 0, 0, tzinfo=user_tz)
+        return dt_local.astimezone(timezone.utc).replace(tzinfo=None)
+
+    # Transit positions at 09:00 local for every day of the longest sweep, in one pass
+    days = [today + timedelta(days=i) for i in range(horizon)]
+    transit = transit_positions_batch(
+        [julday_utc(local_date_to_naive_utc(d, hour_local=9)) for d in days], ayanamsa="lahiri",
+    )
+    # MD/AD lord (DASHA_ORDER index, -1 = none) for every day of the sweep, in one pass
+    try:
+        lords = natal.dasha.index.lord_indices_on(days, depth=2)
+    except Exception:
+        lords = np.full((horizon, 2), -1, dtype=np.int64)
+
+    # Strongest aspect of every transiting planet to every natal point, all days at once: (T, P, N)
+    targets = list(natal_points)
+    tlon = np.asarray(transit.lon, dtype=float)[:, [GRAHA_INDEX[p] for p in _TRANSITING]]
+    sep = separation(tlon[:, :, None], np.array([float(natal_points[t]) for t in targets], dtype=float))
+    a_idx, a_strength = best_aspect(sep, _ASPECT_ANGLE, _ASPECT_ORB, _ASPECT_BASE)
+    weight = np.array([1.00 if p in benefics else 0.70 if p in malefics else 0.85 for p in _TRANSITING])
+    contrib = np.where(a_idx >= 0, a_strength * weight[None, :, None], 0.0)
+    raw_all = sequential_sum(contrib)
+    tag_rows = hit_rows(np.isin(a_idx, _TAG_ASPECTS) & (contrib >= 0.60))
+    combust_all = separation(transit.column("Sun"), transit.column("Mercury")) <= 8.0
+
+    def day_score_base(i: int, d: date) -> Tuple[float, Dict[str, Any]]:
+        tag_buf: List[str] = []
+        tag_t_buf: List[Dict[str, Any]] = []
+        for flat in tag_rows[i].tolist():
+            p_i, n_i = divmod(flat, len(targets))
+            p, tgt, a_name = _TRANSITING[p_i], targets[n_i], _ASPECT_NAMES[a_idx[i, p_i, n_i]]
+            tag_buf.append(f"{p} {a_name} -> {tgt}")
+            tag_t_buf.append(_aspect_tag_t(p, a_name, tgt))
+
+        md_i, ad_i = lords[i]
+        md_lord = DASHA_ORDER[md_i] if md_i >= 0 else None
+        ad_lord = DASHA_ORDER[ad_i] if ad_i >= 0 else None
+        meta = {
+            "tags": list(dict.fromkeys(tag_buf))[:4],
+            "tags_t": tag_t_buf[:4],
+            "hits": {"_source": "t->n local"},
+            "flags": {"combust": bool(combust_all[i])},
+            "dasha": {"md": md_lord, "ad": ad_lord}
+        }
+        return (float(raw_all[i]), meta)
+
+    def has_personal_benefic(tags: List[str]) -> bool:
+        return any((t.split(" ")[0] in {"Jupiter","Venus","Moon"}) for t in tags)
+
+    base = [day_score_base(i, d) for i, d in enumerate(days)]
+    # mild downweight if no personal benefic tag
+    base_raw = np.array(
+        [raw if has_personal_benefic(meta.get("tags", [])) else raw * 0.8 for raw, meta in base], dtype=float,
+    )
+    md_col, ad_col = lords[:, 0], lords[:, 1]
+
+    try:
+        sat_ctx = saturn_overview(
+            today_local=today,
+            horizon_days=horizon,
+            moon_natal_deg=float(natal.moon),
+            asc_natal_deg=float(natal_points.get("Asc")) if "Asc" in natal_points else None,
+            mc_natal_deg=float(natal_points.get("MC")) if "MC" in natal_points else None,
+            lat=inp.lat, lon=inp.lon, user_tz_str=inp.tz_str, ayanamsa="lahiri",
+        ) or {}
+    except Exception:
+        sat_ctx = {}
+
+    day_iso = [d.isoformat() for d in days]
+    sat_days = _saturn_days(sat_ctx, today, horizon)
+    sat_mask = {name: np.array([d in s for d in day_iso], dtype=bool) for name, s in sat_days.items()}
+    sat_tags = [[label for name, label in _SAT_TAG_LABELS if sat_mask[name][i]] for i in range(horizon)]
+
+    return _Sweep(
+        today=today, day_iso=day_iso, base=base, base_raw=base_raw, md_col=md_col, ad_col=ad_col,
+        sat_mask=sat_mask, sat_tags=sat_tags, station_days=sat_days["station"],
+    )
+
+
+# ---------------------- window picking ---------------------- #
+
+def best_day_within(days: List[Dict[str, Any]], start_iso: str, end_iso: str) -> Optional[Dict[str, Any]]:
+    slice_days = dates_in_range(days, start_iso, end_iso)
+    if not slice_days:
+        return None
+    bd = max(slice_days, key=lambda x: x["score"])
+    md = bd.get("meta", {}).get("dasha", {}).get("md")
+    ad = bd.get("meta", {}).get("dasha", {}).get("ad")
+    tags = bd.get("meta", {}).get("tags", [])
+    tags_t = bd.get("meta", {}).get("tags_t", [])
+    if md:
+        tags.append(f"MD:{md}")
+        tags_t.append(_dasha_tag_t("MD", md))
+    if ad:
+        tags.append(f"AD:{ad}")
+        tags_t.append(_dasha_tag_t("AD", ad))
+    return {
+        "date": bd["date"],
+        "score": bd["score"],
+        "tags": tags[:5],
+        "tags_t": tags_t[:5],
+    }
+
+
+def _pick_windows(spec: GoalSpec, inp: ShubhDinInput, days: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    span = spec.span_for(inp)
+    if spec.clamp_span:
+        span = min(span, len(days))
+    if span < 1:
+        return []
+
+    seeds: List[Tuple[int, int]] = []
+    if spec.picker == "best":
+        seed = best_window(days, span=span)
+        if seed:
+            seeds.append((seed["si"], seed["ei"]))
+    else:
+        seeds = [(w["si_orig"], w["ei_orig"]) for w in non_overlapping_top_windows(days, span=span, k=spec.k)]
+
+    wins: List[Dict[str, Any]] = []
+    for si, ei in seeds:
+        si, ei = grow_window(days, si, ei, cutoff=spec.cutoff, patience=spec.patience)
+        a_iso, b_iso = days[si]["date"], days[ei]["date"]
+        wins.append({"start": a_iso, "end": b_iso, "duration_days": duration_days(a_iso, b_iso)})
+    return dedupe_windows(wins, limit=spec.limit)
+
+
+def _goal_result(spec: GoalSpec, inp: ShubhDinInput, sweep: _Sweep, horizon_months: int) -> Dict[str, Any]:
+    days = sweep.sweep_goal(spec, spec.horizon_days(horizon_months))
+    wins = _pick_windows(spec, inp, days)
+
+    best_line: List[Dict[str, Any]] = []
+    if wins:
+        bd = best_day_within(days, wins[0]["start"], wins[0]["end"])
+        if bd: best_line = [bd]
+
+    caution_days: List[str] = []
+    cautions_t: List[Dict[str, Any]] = []
+    if spec.cautions or spec.cautions_t:
+        for w in wins:
+            for d in dates_in_range(days, w["start"], w["end"]):
+                if "combust" in spec.cautions and d.get("meta", {}).get("flags", {}).get("combust"):
+                    caution_days.append(d["date"])
+                if "station" in spec.cautions and d["date"] in sweep.station_days:
+                    caution_days.append(d["date"])
+        caution_days = sorted(set(caution_days))
+        shown, more = caution_days[:10], max(0, len(caution_days) - 10)
+        cautions_t = [dict(c) for c in spec.cautions_t]
+        if shown:
+            cautions_t.append(_no_big_txn_t(shown, more))
+
+    return {
+        "goal": spec.key,
+        "headline_t": _headline_t(wins),
+        "score": int(best_line[0]["score"]) if best_line else int(max((d["score"] for d in days), default=0)),
+        "confidence": spec.confidence if wins else "low",
+        "dates": best_line,
+        "windows": wins,
+        "explain_t": spec.explain(inp, best_line[0] if best_line else None),
+        "cautions_t": cautions_t,
+        "caution_days": caution_days,
+    }
+
+
+# ---------------------- entry point ---------------------- #
+
+def run(
+    inp: ShubhDinInput,
+    *,
+    aspect_cfg: Optional[Dict[str, Any]] = None,
+    natal: Optional[NatalContext] = None,
+) -> Dict[str, Any]:
+    """Compute the ShubhDin payload for one birth. No request/DRF objects involved."""
+    try:
+        user_tz = ZoneInfo(inp.tz_str)
+    except Exception:
+        user_tz = ZoneInfo("Asia/Kolkata")
+    hm = max(1, min(24, int(inp.horizon_months)))
+    if aspect_cfg is None:
+        aspect_cfg, _ = load_config()
+    if natal is None:
+        natal = load_natal(inp.dt_aw, inp.lat, inp.lon, ayanamsa="lahiri")
+
+    today = inp.today or datetime.now(user_tz).date()
+    # Saturn context and the base pass always span the longest goal horizon
+    horizon = max(spec.horizon_days(hm) for spec in GOALS.values())
+    sweep = _build_sweep(inp, natal, aspect_cfg, user_tz, today, horizon)
+
+    wanted = set(inp.goals) if inp.goals else set(GOALS)
+    results = [_goal_result(spec, inp, sweep, hm) for key, spec in GOALS.items() if key in wanted]
+
+    return {
+        "query_id": "qd_shubhdin_v1",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "tz": inp.tz_str,
+        "horizon_months": hm,
+        "confidence_overall": "medium",
+        "results": results,
+    }
@@ -1,8 +1,11 @@
 # astro/shubhdin_helpers.py
 from __future__ import annotations
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
 from typing import List, Dict, Tuple, Optional
 
+import numpy as np
+
 _MON3 = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
 
 def mon3(m: int) -> str:
@@ -45,18 +48,66 @@ def normalize_scores(daylist: List[Dict], raw_key: str = "raw", out_key: str = "
         s = 60 + 35 * max(-1.5, min(1.5, z))
         d[out_key] = round(max(5.0, min(98.0, s)), 2)
 
+# --- array-backed day scores ------------------------------------------------
+
+class DayScores:
+    """
+    Array view of a swept day list (chronological): dates, scores and prefix
+    sums, so any span total is prefix[i+span] - prefix[i] in O(1).
+    Scores on a 0.01 grid (what the normalizers emit) are summed as integer
+    hundredths, which keeps span totals exact. Spans tied with the best are
+    re-summed left to right, so the pick matches a plain scan with sum().
+    """
+    __slots__ = ("dates", "scores", "_vals", "_units", "_tol")
+
+    def __init__(self, days: List[Dict], score_key: str = "score"):
+        self.dates: List[str] = [d["date"] for d in days]
+        self._vals: List[float] = [d[score_key] for d in days]
+        self.scores = np.array(self._vals, dtype=float)
+        cents = np.rint(self.scores * 100.0)
+        if cents.size and np.all(np.abs(cents - self.scores * 100.0) < 1e-6):
+            self._units, self._tol = cents.astype(np.int64), 0
+        else:
+            self._units, self._tol = self.scores, 1e-9 * max(1.0, float(np.abs(self.scores).max(initial=0.0)))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def span_sums(self, span: int, idx: Optional[np.ndarray] = None) -> np.ndarray:
+        """Totals of every `span` consecutive entries (of the subset idx, if given), in grid units."""
+        vals = self._units if idx is None else self._units[idx]
+        if span <= 0 or vals.size < span:
+            return vals[:0]
+        prefix = np.concatenate(([0], np.cumsum(vals)))
+        return prefix[span:] - prefix[:-span]
+
+    def best_span(self, span: int, idx: Optional[np.ndarray] = None) -> Optional[Tuple[float, int]]:
+        """(total, first position) of the best span; earliest wins ties. Totals ≤ -1 never qualify."""
+        sums = self.span_sums(span, idx)
+        if sums.size == 0:
+            return None
+        top = sums.max()
+        best: Tuple[float, int] = (-1.0, -1)
+        for i in np.flatnonzero(sums >= top - self._tol).tolist():
+            pos = range(i, i + span) if idx is None else idx[i:i + span].tolist()
+            total = sum(self._vals[j] for j in pos)
+            if total > best[0]:
+                best = (total, i)
+        return best if best[1] >= 0 else None
+
+
+def _window_dict(days: List[Dict], total: float, si: int, span: int) -> Dict:
+    ei = si + span - 1
+    a = days[si]["date"]; b = days[ei]["date"]
+    return {"start": a, "end": b, "duration_days": span, "sum": round(total, 2), "si": si, "ei": ei}
+
 def best_window(days: List[Dict], span: int, score_key: str = "score") -> Dict | None:
     """Find best contiguous span using (normalized) score."""
-    if len(days) < span:
+    if span <= 0 or len(days) < span:
         return None
-    best: Tuple[float, int, int] = (-1.0, -1, -1)
-    for i in range(0, len(days) - (span - 1)):
-        s = sum(d[score_key] for d in days[i:i+span])
-        if s > best[0]:
-            best = (s, i, i + span - 1)
-    if best[1] < 0: return None
-    a = days[best[1]]["date"]; b = days[best[2]]["date"]
-    return {"start": a, "end": b, "duration_days": span, "sum": round(best[0], 2), "si": best[1], "ei": best[2]}
+    hit = DayScores(days, score_key).best_span(span)
+    if hit is None: return None
+    return _window_dict(days, hit[0], hit[1], span)
 
 def grow_window(days: List[Dict], si: int, ei: int, * ,
                 score_key: str = "score", cutoff: float = 55.0, patience: int = 5) -> Tuple[int, int]:
@@ -89,20 +140,27 @@ def grow_window(days: List[Dict], si: int, ei: int, * ,
     return si, ei
 
 def non_overlapping_top_windows(days: List[Dict], span: int, k: int = 3, score_key: str = "score") -> List[Dict]:
-    """Pick up to k non-overlapping best spans (no growth applied here)."""
+    """
+    Pick up to k non-overlapping best spans (no growth applied here).
+    Each pick is the best span over the days not yet used (the remaining days
+    taken as one sequence), then its days are marked used. One prefix-sum pass
+    per pick: O(k·n).
+    """
     picked: List[Dict] = []
-    used = [False] * len(days)
+    if span <= 0:
+        return picked
+    ds = DayScores(days, score_key)
+    used = np.zeros(len(days), dtype=bool)
     for _ in range(k):
-        rem = []
-        idx_map = []
-        for idx, d in enumerate(days):
-            if not used[idx]:
-                rem.append(d); idx_map.append(idx)
-        w = best_window(rem, span, score_key=score_key)
-        if not w: break
-        si = idx_map[w["si"]]; ei = idx_map[w["ei"]]
-        for t in range(si, ei + 1): used[t] = True
-        w2 = dict(w); w2["si_orig"] = si; w2["ei_orig"] = ei
+        idx_map = np.flatnonzero(~used)
+        hit = ds.best_span(span, idx_map)
+        if hit is None: break
+        total, i = hit
+        si = int(idx_map[i]); ei = int(idx_map[i + span - 1])
+        used[si:ei + 1] = True
+        rem_si, rem_ei = i, i + span - 1
+        w2 = {"start": days[si]["date"], "end": days[ei]["date"], "duration_days": span,
+              "sum": round(total, 2), "si": rem_si, "ei": rem_ei, "si_orig": si, "ei_orig": ei}
         picked.append(w2)
     return picked
 
@@ -131,8 +189,13 @@ def angle_diff(a: float, b: float) -> float:
     return min(d, 360.0 - d)
 
 def dates_in_range(days: list[dict], start_iso: str, end_iso: str) -> list[dict]:
-    """Filter entries from a swept day list within [start_iso, end_iso]."""
-    return [d for d in days if start_iso <= d["date"] <= end_iso]
+    """Entries of a swept (chronological) day list within [start_iso, end_iso]; bisect slice."""
+    lo = bisect_left(days, start_iso, key=_day_date)
+    hi = bisect_right(days, end_iso, lo=lo, key=_day_date)
+    return days[lo:hi]
+
+def _day_date(d: dict) -> str:
+    return d["date"]
 
 def fmt_date(d_iso: str) -> str:
     d = date.fromisoformat(d_iso)
@@ -165,7 +228,7 @@ def make_caution_line(dates: list[str]) -> str:
 
 def best_day_within(days: List[Dict], start_iso: str, end_iso: str) -> Optional[Dict]:
     """Return the max-scoring day object within [start_iso, end_iso], else None."""
-    slice_days = [d for d in days if start_iso <= d["date"] <= end_iso]
+    slice_days = dates_in_range(days, start_iso, end_iso)
     if not slice_days:
         return None
     bd = max(slice_days, key=lambda x: x["score"])
@@ -0,0 +1,14 @@
+from datetime import date, timedelta
+try:
+    from celery import shared_task
+except Exception:  # Celery not installed
+    shared_task = lambda *a, **k: (lambda f: f)
+
+from .services.daily_precompute import precompute_daily, prune_before
+
+# workers=1 in Celery (see utils.pool); the precompute_daily command runs the pool.
+@shared_task(name="astro.precompute_daily")
+def precompute_daily_payloads(workers: int = 1, chunk_size: int = 200, keep_days: int = 2):
+    totals = precompute_daily(chunk_size=chunk_size, workers=workers)
+    totals["pruned"] = prune_before(date.today() - timedelta(days=keep_days))
+    return totals
@@ -0,0 +1,51 @@
+# astro/tests/test_aspect_kernel.py
+import numpy as np
+
+from astro.domain.aspect_kernel import best_aspect, separation
+from astro.domain.aspects import compute_aspects
+from astro.services.shubhdin_engine import ASPECTS
+from astro.shubhdin_helpers import angle_diff
+from astro.utils.config import load_config
+
+
+def _scalar_aspect_hit(delta):
+    # the per-pair loop the ShubhDin sweep used before aspect_kernel
+    best = None
+    for name, ang, orb, base in ASPECTS:
+        diff = abs(delta - ang)
+        if diff <= orb or abs(diff - 360.0) <= orb:
+            taper = max(0.0, 1.0 - (min(diff, 360.0 - diff) / orb))
+            strength = base * (0.6 + 0.4 * taper)
+            if best is None or strength > best[1]:
+                best = (name, strength)
+    return best
+
+
+def test_best_aspect_matches_scalar_aspect_hit():
+    rng = np.random.default_rng(7)
+    a = np.concatenate([rng.uniform(-30, 400, 5000), np.arange(0, 360, 0.25)])
+    b = rng.uniform(0, 360, a.size)
+    idx, strength = best_aspect(
+        separation(a, b), *(np.array([r[k] for r in ASPECTS], dtype=float) for k in (1, 2, 3)),
+    )
+    for x, y, i, s in zip(a, b, idx, strength):
+        hit = _scalar_aspect_hit(angle_diff(float(x), float(y)))
+        assert (hit is None and i == -1) or hit == (ASPECTS[i][0], s)
+
+
+def test_compute_aspects_matches_pairwise_loop():
+    cfg, _ = load_config()
+    deg = {"Sun": 10.0, "Moon": 130.5, "Mars": 191.0, "Mercury": 13.0, "Jupiter": 250.0,
+           "Venus": 70.2, "Saturn": 371.0, "Rahu": 100.0, "Ketu": 280.0}
+    want = []
+    names = list(deg)
+    for i, p1 in enumerate(names):
+        for p2 in names[i + 1:]:
+            actual = angle_diff(deg[p1] % 360.0, deg[p2] % 360.0)
+            for r in cfg["aspects"]:
+                delta = angle_diff(actual, float(r["angle"]))
+                if delta <= float(r["orb"]):
+                    want.append((p1, p2, r["name"], actual, delta,
+                                 float(r["baseWeight"]) * max(0.0, 1.0 - delta / float(r["orb"]))))
+    got = [(h.p1, h.p2, h.name, h.exact, h.delta, h.score) for h in compute_aspects(deg, cfg)]
+    assert got == want and want
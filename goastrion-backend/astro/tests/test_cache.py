@@ -0,0 +1,27 @@
+# astro/tests/test_cache.py
+import time
+
+from astro.utils.cache import BoundedCache, cache_stats, fingerprint
+
+
+def test_bounded_cache_lru_ttl_and_stats():
+    c = BoundedCache("test.lru", maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1          # a is now most recent
+    c.set("c", 3)                   # evicts b
+    assert c.get("b") is None
+    assert c.get_or_set("c", lambda: 99) == 3
+    st = c.stats()
+    assert (st["hits"], st["misses"], st["evictions"], st["size"]) == (2, 1, 1, 2)
+    assert any(s["name"] == "test.lru" for s in cache_stats())
+
+    t = BoundedCache("test.ttl", maxsize=4, ttl=0.01)
+    t.set("k", "v")
+    time.sleep(0.02)
+    assert t.get("k") is None
+
+
+def test_fingerprint_ignores_order_and_float_noise():
+    assert fingerprint({"Sun": 10.0000001, "Moon": 2.0}, ndigits=6) == fingerprint({"Moon": 2.0, "Sun": 10.0}, ndigits=6)
+    assert fingerprint({"Sun": 10.0}) != fingerprint({"Sun": 11.0})
@@ -29,3 +29,24 @@ def test_chart_returns_vimshottari(client):
     dbg = data["meta"].get("vimshottari_debug", {})
     assert dbg.get("ayanamsa") == "lahiri"
     assert dbg.get("start_md_lord") == "Ketu"
+
+
+def test_chart_dasha_window_and_depth(client):
+    url = reverse("chart")
+    payload = {
+        "datetime": "1990-11-20T17:30:00Z", "lat": 22.30, "lon": 87.92,
+        "dasha": {"from": "2025-01-01", "to": "2025-03-31", "depth": 3},
+    }
+    resp = client.post(url, data=json.dumps(payload), content_type="application/json")
+    assert resp.status_code == 200, resp.content
+    v = resp.json()["meta"]["vimshottari"]
+
+    assert len(v["mahadashas"]) == 1
+    (ads,) = v["antardashas"].values()
+    assert ads and all(a["start"] < "2025-04-01" and a["end"] > "2025-01-01" for a in ads)
+    pds = [p for rows in v["pratyantardashas"].values() for p in rows]
+    assert pds[0]["start"] <= "2025-01-01" < pds[0]["end"] and pds[-1]["end"] > "2025-03-31"
+    assert "sookshmas" not in v
+
+    payload["dasha"] = {"depth": 9}
+    assert client.post(url, data=json.dumps(payload), content_type="application/json").status_code == 400
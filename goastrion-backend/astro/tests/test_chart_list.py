@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from astro.models import Chart
+
+
+@pytest.mark.django_db
+def test_chart_list_conditional_get(django_assert_num_queries):
+    user = get_user_model().objects.create_user(username="etag", password="x")
+    birth = dict(birth_datetime=datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc), latitude=22.3, longitude=87.92, timezone="Asia/Kolkata")
+    first = Chart.objects.create(user=user, name="a", **birth)
+    client = APIClient()
+    client.force_authenticate(user)
+    url = reverse("charts-list-create")
+
+    r = client.get(url)
+    assert r.status_code == 200 and r["ETag"].startswith('"') and r["Cache-Control"] == "private, no-cache"
+    with django_assert_num_queries(1):
+        again = client.get(url, HTTP_IF_NONE_MATCH=r["ETag"])
+    assert again.status_code == 304 and again.content == b"" and again["ETag"] == r["ETag"]
+
+    Chart.objects.create(user=user, name="b", **birth)
+    added = client.get(url, HTTP_IF_NONE_MATCH=r["ETag"])
+    assert added.status_code == 200 and len(added.json()) == 2
+    first.delete()
+    assert client.get(url, HTTP_IF_NONE_MATCH=added["ETag"]).status_code == 200
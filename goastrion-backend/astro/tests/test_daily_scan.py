@@ -0,0 +1,75 @@
+# astro/tests/test_daily_scan.py
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from astro.domain.transits import compute_transit_hits_batch
+from astro.services import daily_core as dc
+from astro.services.natal import NatalContext
+
+
+def _exact_score(hits):
+    bene = sum(h["score"] for h in hits["aspect"] if h["planet"] in dc.BENEFIC and h["aspect"] in dc._BENE_ASPECTS)
+    male = sum(h["score"] for h in hits["aspect"] if h["planet"] in dc.MALEFIC and h["aspect"] in dc._MALE_ASPECTS)
+    return bene - 0.9 * male
+
+
+def test_intraday_score_tracks_full_ephemeris():
+    cfg = dc._get_aspect_cfg(None)
+    pts = NatalContext.build(datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc), 22.30, 87.92).points()
+    start = datetime(2025, 3, 14, 0, 30)  # 06:00 IST
+    f = dc._IntradayScore(start, 900, pts, cfg)
+
+    mins = np.arange(0, 901, 7)
+    hits = compute_transit_hits_batch(
+        dts_naive_utc=[start + timedelta(minutes=int(m)) for m in mins], lat=0.0, lon=0.0,
+        natal_points=pts, aspect_cfg=cfg,
+    )
+    assert np.allclose(f(mins), [_exact_score(h) for h in hits], atol=0.01)
+
+    best, greens, cautions, _ = dc.sample_day_windows(ZoneInfo("Asia/Kolkata"), 22.30, 87.92, pts, cfg, date(2025, 3, 14))
+    for w in [best] + greens + cautions:
+        assert "06:00" <= w["start"] < w["end"] <= "21:00"
+
+
+def test_daily_payload_cached_per_locale(monkeypatch):
+    from django.core.cache import cache
+    from astro.services import daily_cache
+
+    cache.clear()
+    calls = []
+    real = daily_cache.assemble_daily
+    monkeypatch.setattr(daily_cache, "assemble_daily", lambda data: calls.append(1) or real(data))
+
+    data = {"birth": {"date": "1990-11-20", "time": "23:00", "lat": 22.30, "lon": 87.92},
+            "tz": "Asia/Kolkata", "for_date": "2030-01-15"}
+    first = daily_cache.daily_payload(data)
+    assert daily_cache.daily_payload(dict(data)) == first and len(calls) == 1
+    daily_cache.daily_payload(data, locale="hi")
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db
+def test_precomputed_daily_payload_is_served(monkeypatch):
+    from django.contrib.auth import get_user_model
+    from django.core.cache import cache
+    from astro.models import Chart, DailyPayload
+    from astro.services import daily_cache
+    from astro.services.daily_precompute import precompute_daily
+
+    user = get_user_model().objects.create_user(username="pre", password="x")
+    birth = datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc)
+    chart = Chart.objects.create(user=user, birth_datetime=birth, latitude=22.30, longitude=87.92, timezone="Asia/Kolkata")
+
+    totals = precompute_daily(day=date(2030, 1, 16), workers=1)
+    assert totals["stored"] == 1 and totals["failed"] == 0
+    row = DailyPayload.objects.get(chart=chart, day=date(2030, 1, 16))
+    assert row.phase == "0.0"
+
+    cache.clear()
+    monkeypatch.setattr(daily_cache, "assemble_daily", lambda data: pytest.fail("assembled live"))
+    data = {"datetime": birth.isoformat(), "lat": 22.30, "lon": 87.92, "tz": "Asia/Kolkata",
+            "persona": "manager", "for_date": "2030-01-16"}
+    assert daily_cache.daily_payload(data)["date"] == "2030-01-16"
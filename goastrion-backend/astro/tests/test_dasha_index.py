@@ -0,0 +1,38 @@
+# astro/tests/test_dasha_index.py
+from datetime import date, datetime, timedelta, timezone
+
+from astro.dasha.vimshottari import (
+    DASHA_ORDER, compute_pratyantardashas_for_antardasha, compute_vimshottari_full,
+)
+
+
+def _scan(tl, day):
+    for md in tl.mahadashas:
+        if md.start.date() <= day <= md.end.date():
+            key = f"{md.lord}@{md.start.replace(tzinfo=timezone.utc).isoformat()}"
+            for ad in tl.antardashas.get(key, []):
+                if ad.start.date() <= day <= ad.end.date():
+                    for pd in compute_pratyantardashas_for_antardasha(ad):
+                        if pd.start.date() <= day <= pd.end.date():
+                            return md, ad, pd
+                    return md, ad, None
+            return md, None, None
+    return None, None, None
+
+
+def test_index_matches_linear_scan():
+    birth = datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc)
+    tl = compute_vimshottari_full(birth, 22.30, 87.92, 0.0, horizon_years=120.0)
+    days = [date(1990, 11, 19) + timedelta(days=i) for i in range(0, 44000, 7)]
+    # every MD/AD boundary day too (those go to the earlier period)
+    days += sorted({ad.end.date() for ads in tl.antardashas.values() for ad in ads})
+
+    lords = tl.index.lord_indices_on(days, depth=3)
+    for day, row in zip(days, lords):
+        want = _scan(tl, day)
+        assert tl.on(day) == want
+        assert [DASHA_ORDER[i] if i >= 0 else None for i in row] == [p.lord if p else None for p in want]
+
+    md, ad, pd = tl.at(birth + timedelta(days=9000))
+    assert md.start <= ad.start <= pd.start <= birth + timedelta(days=9000) < pd.end <= ad.end <= md.end
+    assert tl.at(birth - timedelta(seconds=1)) == (None, None, None)
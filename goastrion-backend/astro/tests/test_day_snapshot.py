@@ -0,0 +1,36 @@
+# astro/tests/test_day_snapshot.py
+from datetime import date, datetime
+
+import numpy as np
+
+from astro.ephem import day_snapshot as ds
+from astro.ephem.swiss import julday_utc
+from astro.ephem.table import transit_positions_batch
+
+
+def _arc(a, b):
+    d = np.abs(a - b) % 360.0
+    return np.minimum(d, 360.0 - d)
+
+
+def test_snapshot_matches_ephemeris(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOASTRION_DAY_SNAPSHOT_DIR", str(tmp_path))
+    ds.reset_day_snapshots()
+
+    # on the quarter-hour grid (IST 12:00) and off it (Nepal +05:45 → 00:15, 23:59 spans two days)
+    dts = [datetime(2025, 3, 14, 6, 30), datetime(2025, 3, 14, 0, 15), datetime(2025, 3, 14, 23, 59),
+           datetime(2025, 3, 15, 7, 7, 30)]
+    jds = [julday_utc(dt) for dt in dts]
+    snap = ds.snapshot_positions(jds)
+    ref = transit_positions_batch(jds)
+
+    assert np.array_equal(snap.lon[0], ref.lon[0])
+    assert _arc(snap.lon, ref.lon).max() < 1e-5
+    assert (tmp_path / "day_lahiri_20250314.npy").is_file()
+    assert (tmp_path / "day_lahiri_20250315.npy").is_file()
+
+    # a fresh process (cache cleared) reads the shared file instead of Swiss
+    ds.reset_day_snapshots()
+    monkeypatch.setattr(ds, "_build", lambda day, ayan: (_ for _ in ()).throw(AssertionError("rebuilt")))
+    assert np.array_equal(ds.day_snapshot(date(2025, 3, 14)), np.load(tmp_path / "day_lahiri_20250314.npy"))
+    ds.reset_day_snapshots()
@@ -0,0 +1,35 @@
+# astro/tests/test_ephem_batch.py
+from datetime import datetime, timedelta
+
+from astro.ephem.swiss import compute_all_planets, compute_all_planets_batch, julday_utc
+
+
+def test_batch_matches_single_calls():
+    dts = [datetime(2025, 1, 1, 3, 30) + timedelta(days=i, minutes=37 * i) for i in range(40)]
+    batch = compute_all_planets_batch([julday_utc(d) for d in dts], 22.30, 87.92, ayanamsa="lahiri")
+    assert len(batch) == len(dts)
+    for i, d in enumerate(dts):
+        asc, pos = compute_all_planets(d, 22.30, 87.92, 0.0, ayanamsa="lahiri")
+        assert batch.positions(i) == pos
+        assert batch.asc[i] == asc
+
+
+def test_batch_without_location_skips_angles():
+    batch = compute_all_planets_batch([julday_utc(datetime(2025, 6, 1, 12))], ayanamsa="lahiri")
+    assert batch.asc is None and batch.mc is None
+    # Ketu mirrors Rahu, Saturn moves slowly
+    assert abs(((batch.column("Ketu")[0] - batch.column("Rahu")[0]) % 360) - 180) < 1e-9
+    assert abs(batch.speed[0, 6]) < 0.2
+
+
+def test_ayanamsa_is_per_call_under_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    dt = datetime(1990, 5, 17, 6, 45)
+    expected = {name: compute_all_planets(dt, 12.97, 77.59, 0.0, ayanamsa=name)[1] for name in ("lahiri", "raman")}
+    assert expected["lahiri"]["Sun"] != expected["raman"]["Sun"]
+
+    names = ["lahiri", "raman"] * 200
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda n: (n, compute_all_planets(dt, 12.97, 77.59, 0.0, ayanamsa=n)[1]), names))
+    assert all(pos == expected[n] for n, pos in results)
@@ -0,0 +1,25 @@
+# astro/tests/test_ephem_table.py
+import numpy as np
+from django.core.management import call_command
+
+from astro.ephem import table
+from astro.ephem.swiss import compute_all_planets_batch
+
+
+def test_table_lookup_matches_swiss(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOASTRION_EPHEM_DIR", str(tmp_path))
+    call_command("build_ephemeris_table", start_year=2025, end_year=2025, step_minutes=360)
+    table.reset_tables()
+    try:
+        tbl = table.get_table("lahiri")
+        assert tbl is not None and tbl.n_rows > 1400
+
+        # mix of in-range instants and one outside (served by Swiss)
+        jds = np.concatenate([tbl.jd0 + np.linspace(0.1, 360.0, 50), [tbl.jd_end + 30.0]])
+        got = table.transit_positions_batch(jds, ayanamsa="lahiri")
+        ref = compute_all_planets_batch(jds, ayanamsa="lahiri")
+        err = np.abs((got.lon - ref.lon + 180.0) % 360.0 - 180.0)
+        assert err.max() < 1e-3
+        assert np.array_equal(got.lon[-1], ref.lon[-1])
+    finally:
+        table.reset_tables()
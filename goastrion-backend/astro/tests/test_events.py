@@ -0,0 +1,39 @@
+# astro/tests/test_events.py
+from datetime import datetime
+
+from astro.domain.events import NAKSHATRA_SPAN, PlanetEvents, scan_planet_events
+from astro.ephem.swiss import compute_body_batch, deg_to_sign_index, julday_utc
+
+
+def test_saturn_stations_ingresses_and_catalog_round_trip():
+    jd0, jd1 = julday_utc(datetime(2020, 1, 1)), julday_utc(datetime(2030, 1, 1))
+    ev = scan_planet_events("Saturn", jd0, jd1, "lahiri")
+
+    kinds = [k for _, k in ev.stations(jd0, jd1)]
+    assert len(kinds) >= 18
+    assert all(a != b for a, b in zip(kinds, kinds[1:]))
+    for a, b in ev.retro_intervals(jd0, jd1)[1:-1]:
+        assert 120 < b - a < 150  # Saturn retrograde lasts ~4.5 months
+
+    for jd, sign in ev.sign.changes:
+        before, after = compute_body_batch([jd - 0.01, jd + 0.01], "Saturn", "lahiri")[0]
+        assert deg_to_sign_index(after) == sign != deg_to_sign_index(before)
+
+    cat = PlanetEvents.from_json(ev.to_json("lahiri"))
+    mid = julday_utc(datetime(2025, 6, 1))
+    assert cat.sign.at(mid) == ev.sign.at(mid)
+    assert cat.retro_intervals(mid, mid + 400) == ev.retro_intervals(mid, mid + 400)
+
+
+def test_moon_nakshatras_and_mercury_combustion():
+    jd0 = julday_utc(datetime(2025, 1, 1))
+    moon = scan_planet_events("Moon", jd0, jd0 + 30, "lahiri")
+    assert 28 <= len(moon.nakshatra.changes) <= 31
+    for jd, idx in moon.nakshatra.changes:
+        lon = compute_body_batch([jd + 0.001], "Moon", "lahiri")[0][0]
+        assert int(lon // NAKSHATRA_SPAN) == idx
+
+    merc = scan_planet_events("Mercury", jd0, jd0 + 365, "lahiri")
+    wins = merc.combustion_windows(jd0, jd0 + 365)
+    assert 5 <= len(wins) <= 8  # ~3 superior + ~3 inferior conjunctions a year
+    assert all(b > a for a, b in wins)
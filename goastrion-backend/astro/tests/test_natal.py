@@ -0,0 +1,49 @@
+# astro/tests/test_natal.py
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from astro.dasha.vimshottari import compute_vimshottari_full
+from astro.ephem.swiss import compute_all_planets, compute_angles
+from astro.services.natal import NatalContext
+
+
+def test_natal_context_matches_separate_calls():
+    dt = datetime(1990, 11, 20, 12, 0)
+    natal = NatalContext.build(dt.replace(tzinfo=timezone.utc), 22.30, 87.92)
+
+    asc, pos = compute_all_planets(dt, 22.30, 87.92, 0.0, ayanamsa="lahiri")
+    assert natal.asc == asc and natal.positions == pos
+    assert natal.angles() == compute_angles(dt, 22.30, 87.92, ayanamsa="lahiri")
+    assert list(natal.points())[:2] == ["Asc", "MC"]
+
+    tl = compute_vimshottari_full(natal.dt_aw, 22.30, 87.92, 0.0, horizon_years=120.0)
+    assert natal.dasha == tl
+    assert natal.dasha is natal.dasha  # built once
+
+
+def test_payload_round_trip_keeps_dasha_and_houses():
+    natal = NatalContext.build(datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc), 22.30, 87.92)
+    clone = NatalContext.from_payload(json.loads(json.dumps(natal.to_payload())))
+    assert clone == natal and clone.fingerprint == natal.fingerprint
+    assert clone.dasha == natal.dasha and clone.houses == natal.houses
+
+
+@pytest.mark.django_db
+def test_natal_store_persists_record_and_sections():
+    from astro.models import NatalRecord
+    from astro.services.natal_store import load_natal, natal_section, reset_natal_cache
+
+    dt = datetime(1985, 3, 2, 4, 15, tzinfo=timezone.utc)
+    natal = load_natal(dt, 12.97, 77.59)
+    rec = NatalRecord.objects.get(fingerprint=natal.fingerprint)
+    assert rec.payload["positions"] == natal.positions
+
+    calls = []
+    assert natal_section(natal, "demo", "v1", lambda: calls.append(1) or {"x": (1, 2)}) == {"x": [1, 2]}
+    reset_natal_cache()
+    again = load_natal(dt, 12.97, 77.59)  # served from the row
+    assert again == natal
+    assert natal_section(again, "demo", "v1", lambda: calls.append(1)) == {"x": [1, 2]}
+    assert calls == [1]
@@ -0,0 +1,28 @@
+# astro/tests/test_shubhdin_engine.py
+from datetime import date, datetime, timezone
+
+from astro.services import shubhdin_engine
+from astro.services.shubhdin_engine import GOALS, ShubhDinInput
+
+
+def _run(**kw):
+    inp = ShubhDinInput(
+        dt_aw=datetime(1990, 11, 20, 17, 30, tzinfo=timezone.utc), lat=22.30, lon=87.92,
+        horizon_months=6, today=date(2025, 1, 1), **kw,
+    )
+    return shubhdin_engine.run(inp)
+
+
+def test_goal_subset_matches_full_run():
+    full = {r["goal"]: r for r in _run()["results"]}
+    assert list(full) == list(GOALS)
+
+    # goals come back in registry order, scored exactly as in the full run
+    part = _run(goals=["marriage", "promotion"])["results"]
+    assert [r["goal"] for r in part] == ["promotion", "marriage"]
+    assert part == [full["promotion"], full["marriage"]]
+
+    for r in part:
+        assert 0 <= r["score"] <= 99
+        for w in r["windows"]:
+            assert w["start"] <= w["end"] and w["duration_days"] >= 1
@@ -0,0 +1,86 @@
+# astro/tests/test_shubhdin_helpers.py
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from astro.shubhdin_helpers import DayScores, best_window, dates_in_range, non_overlapping_top_windows
+
+
+# plain O(n·span) scans: what the prefix-sum search must reproduce
+def _ref_best_window(days, span):
+    best = (-1.0, -1)
+    for i in range(0, len(days) - (span - 1)):
+        s = sum(d["score"] for d in days[i:i + span])
+        if s > best[0]:
+            best = (s, i)
+    if best[1] < 0:
+        return None
+    si, ei = best[1], best[1] + span - 1
+    return {"start": days[si]["date"], "end": days[ei]["date"], "duration_days": span,
+            "sum": round(best[0], 2), "si": si, "ei": ei}
+
+
+def _ref_top_windows(days, span, k):
+    picked, used = [], [False] * len(days)
+    for _ in range(k):
+        idx_map = [i for i in range(len(days)) if not used[i]]
+        w = _ref_best_window([days[i] for i in idx_map], span)
+        if not w:
+            break
+        si, ei = idx_map[w["si"]], idx_map[w["ei"]]
+        used[si:ei + 1] = [True] * (ei + 1 - si)
+        picked.append({**w, "si_orig": si, "ei_orig": ei})
+    return picked
+
+
+def _days(scores):
+    d0 = date(2025, 1, 1)
+    return [{"date": (d0 + timedelta(days=i)).isoformat(), "score": s} for i, s in enumerate(scores)]
+
+
+_CASES = {
+    "tied totals": [50.0, 60.0, 50.0, 60.0, 50.0, 60.0, 55.0, 55.0],
+    "off grid": [33.333, 66.667, 12.3456, 87.6544, 50.0005, 49.9995, 0.1, 0.2],
+    "0.1 + 0.2 ties": [0.1, 0.2, 0.3, 0.0, 0.2, 0.1, 0.3],
+    "all <= -1": [-5.0, -3.0, -1.0, -2.0],
+    "exactly -1": [-0.5, -0.5, -0.5, -0.5],
+    "just above -1": [-0.49, -0.5, -0.5, -0.49],
+}
+
+
+@pytest.mark.parametrize("name", list(_CASES))
+def test_window_search_matches_plain_scan(name):
+    days = _days(_CASES[name])
+    for span in range(1, len(days) + 2):      # includes span == len(days) and span > len(days)
+        assert best_window(days, span) == _ref_best_window(days, span), (name, span)
+        for k in (1, 2, 3):
+            assert non_overlapping_top_windows(days, span, k) == _ref_top_windows(days, span, k), (name, span, k)
+
+
+def test_window_search_random_grid_and_off_grid():
+    rng = np.random.default_rng(11)
+    for trial in range(300):
+        n = int(rng.integers(1, 25))
+        raw = rng.choice([40.0, 55.5, 60.25, 70.0, -2.0], n) if trial % 3 == 0 else rng.uniform(-3, 99, n)
+        scores = [float(x) if trial % 2 else round(float(x), 2) for x in raw]
+        days = _days(scores)
+        for span in (1, 2, 3, 5, n):
+            assert best_window(days, span) == _ref_best_window(days, span), (scores, span)
+            assert non_overlapping_top_windows(days, span, 3) == _ref_top_windows(days, span, 3), (scores, span)
+
+
+def test_span_sums_and_best_span():
+    days = _days([10.25, 20.5, 30.75, 40.0])
+    ds = DayScores(days)
+    assert ds.span_sums(2).tolist() == [3075, 5125, 7075]        # integer hundredths on the grid
+    assert ds.span_sums(5).size == 0 and ds.best_span(5) is None
+    assert ds.best_span(4) == (101.5, 0)
+    assert ds.best_span(2, np.array([0, 1, 3])) == (60.5, 1)      # over the subset 20.5, 40.0
+
+
+def test_dates_in_range_matches_filter():
+    days = _days([50.0] * 40)
+    for a, b in (("2025-01-05", "2025-01-09"), ("2024-12-01", "2025-01-03"), ("2025-02-08", "2025-03-01"),
+                 ("2025-01-10", "2025-01-10"), ("2025-01-12", "2025-01-11"), ("2025-01-05T", "2025-01-07")):
+        assert dates_in_range(days, a, b) == [d for d in days if a <= d["date"] <= b], (a, b)
@@ -0,0 +1,61 @@
+# astro/tests/test_solar.py
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+astral_sun = pytest.importorskip("astral.sun")
+from astral import LocationInfo
+
+from astro.utils import solar
+
+
+@pytest.mark.parametrize("lat,lon,tz", [
+    (19.076, 72.8777, "Asia/Kolkata"),
+    (-33.8688, 151.2093, "Australia/Sydney"),
+    (69.6492, 18.9553, "Europe/Oslo"),          # midnight sun / polar night
+    (1.8721, -157.4278, "Pacific/Kiritimati"),  # UTC+14: events land on the neighbouring UTC day
+])
+def test_solar_times_match_astral(lat, lon, tz):
+    zone = ZoneInfo(tz)
+    obs = LocationInfo("x", "", tz, lat, lon).observer
+    for k in range(0, 366, 5):
+        d = date(2025, 1, 1) + timedelta(days=k)
+        st = solar.solar_times(d, lat, lon, zone)
+        for got, fn in ((st.sunrise, astral_sun.sunrise), (st.noon, astral_sun.noon), (st.sunset, astral_sun.sunset)):
+            try:
+                want = fn(obs, d, zone)
+            except ValueError:
+                want = None
+            assert got == want, (d, fn.__name__)
+
+
+def test_solar_year_fills_lookups():
+    solar._YEARS.clear()
+    year = solar.solar_year(2028, 19.076, 72.8777, "Asia/Kolkata")
+    assert len(year) == 366 and len(solar._YEARS) == 1
+    assert solar.solar_times(date(2028, 2, 29), 19.07601, 72.87769, "Asia/Kolkata") == year[date(2028, 2, 29)]
+    assert len(solar._YEARS) == 1
+
+
+@pytest.mark.parametrize("lat,lon,tz", [
+    (61.2181, -149.9003, "America/Anchorage"),   # no civil dusk around the June solstice
+    (64.1466, -21.9426, "Atlantic/Reykjavik"),
+    (68.4, 53.3, "UTC"),                          # tz far from the meridian: sunrise after sunset
+    (19.076, 72.8777, "Asia/Kolkata"),
+])
+def test_panchang_sun_times_fall_back_like_astral_sun(lat, lon, tz):
+    from datetime import datetime
+    from astro.utils.panchang import _sun_times
+
+    zone = ZoneInfo(tz)
+    obs = LocationInfo("x", "", tz, lat, lon).observer
+    for k in range(0, 366, 4):
+        d = date(2026, 1, 1) + timedelta(days=k)
+        try:
+            s = astral_sun.sun(obs, d, tzinfo=zone)
+            want = (s["sunrise"], s["noon"], s["sunset"])
+        except ValueError:
+            want = tuple(datetime(d.year, d.month, d.day, h, tzinfo=zone) for h in (6, 12, 18))
+        assert _sun_times(d, lat, lon, zone) == want, d
+    assert solar.civil_twilight(date(2026, 6, 21), lat, lon, zone) == (lat < 60)
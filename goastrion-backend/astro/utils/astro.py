@@ -78,8 +78,12 @@ def geocode_place(place: str) -> Tuple[Optional[str], Optional[float], Optional[
     except Exception:
         return None, None, None
 
-def build_summary(dt_utc: datetime, lat: float, lon: float, tz_offset_hours: float=0.0) -> Dict[str, str]:
-    lagna, positions = compute_all_planets(dt_utc, lat, lon, tz_offset_hours)
+def build_summary(dt_utc: datetime, lat: float, lon: float, tz_offset_hours: float=0.0, natal=None) -> Dict[str, str]:
+    # natal: optional NatalContext already computed for this birth (skips Swiss)
+    if natal is not None:
+        lagna, positions = natal.asc, natal.positions
+    else:
+        lagna, positions = compute_all_planets(dt_utc, lat, lon, tz_offset_hours)
     sun_lon = positions["Sun"]; moon_lon = positions["Moon"]
     return {
         "lagna_sign": get_sign_name(lagna),
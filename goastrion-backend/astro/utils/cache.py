@@ -0,0 +1,112 @@
+# goastrion-backend/astro/utils/cache.py
+"""
+Small in-process caches with a size bound, optional TTL and hit/miss counters.
+
+Use these instead of module-level dicts: long-lived workers otherwise grow
+forever. Every cache registers itself by name so cache_stats() can report
+whether it pays off.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_MISSING = object()
+
+
+class BoundedCache:
+    """Thread-safe LRU cache with optional TTL (seconds)."""
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.name = name
+        self.maxsize = int(maxsize)
+        self.ttl = float(ttl) if ttl else None
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()   # key → (expires_at | None, value)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        _REGISTRY[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value or compute it (outside the lock) and store it."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name, "size": len(self._data), "maxsize": self.maxsize, "ttl": self.ttl,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+            }
+
+
+_REGISTRY: Dict[str, BoundedCache] = {}
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """Counters for every BoundedCache created in this process."""
+    return [c.stats() for c in list(_REGISTRY.values())]
+
+
+# -------------------------
+# Key helpers
+# -------------------------
+def fingerprint(obj: Any, ndigits: Optional[int] = None) -> str:
+    """
+    Stable short hash of a JSON-able object (dict order ignored). With ndigits,
+    floats are rounded first so tiny numeric noise maps to the same key.
+    """
+    if ndigits is not None:
+        obj = _round_floats(obj, ndigits)
+    raw = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _round_floats(obj: Any, ndigits: int) -> Any:
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, dict):
+        return {k: _round_floats(v, ndigits) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_round_floats(v, ndigits) for v in obj]
+    return obj
@@ -0,0 +1,46 @@
+# goastrion-backend/astro/utils/conditional.py
+"""
+Conditional GET for polled JSON endpoints.
+
+Views derive validators from what a body is made of (row timestamps and
+versions), ask not_modified() before serializing anything, and stamp() the
+full response with the same validators. Cache-Control: no-cache lets the
+browser keep the body but revalidate on every poll.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import fingerprint
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong (quoted) ETag over JSON-able parts."""
+    return quote_etag(fingerprint(list(parts)))
+
+
+def stamp(response: HttpResponseBase, etag: str, last_modified: Optional[datetime] = None,
+          cache_control: str = "no-cache") -> HttpResponseBase:
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    response["Cache-Control"] = cache_control
+    return response
+
+
+def not_modified(request, etag: str, last_modified: Optional[datetime] = None,
+                 cache_control: str = "no-cache") -> Optional[HttpResponseBase]:
+    """
+    304 when If-None-Match (or, without it, If-Modified-Since) still matches;
+    None when the full body has to be sent.
+    """
+    ts = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=ts)
+    if response is None:
+        return None
+    return stamp(response, etag, last_modified, cache_control)
@@ -5,13 +5,7 @@ from datetime import date, datetime, timedelta
 from typing import Dict, Tuple, Union, Optional
 from zoneinfo import ZoneInfo
 
-# Optional accurate sun times (recommended)
-try:
-    from astral import LocationInfo
-    from astral.sun import sun as astral_sun
-    _ASTRAL_OK = True
-except Exception:
-    _ASTRAL_OK = False
+from .solar import civil_twilight, solar_times
 
 
 def _tzobj(tz: Union[str, ZoneInfo]) -> ZoneInfo:
@@ -25,19 +19,16 @@ def _tzobj(tz: Union[str, ZoneInfo]) -> ZoneInfo:
 
 def _sun_times(day: date, lat: float, lon: float, tz: ZoneInfo) -> Tuple[datetime, datetime, datetime]:
     """
-    Returns (sunrise, solar_noon, sunset) in tz.
-    Falls back to 06:00/12:00/18:00 local if astral isn't available.
+    Returns (sunrise, solar_noon, sunset) in tz (memoized, see utils.solar).
+    Falls back to 06:00/12:00/18:00 local where the sun doesn't rise or set, or
+    never reaches civil twilight (high-latitude summer), as with astral's sun().
     """
-    if _ASTRAL_OK:
-        try:
-            loc = LocationInfo(
-                name="loc", region="", timezone=getattr(tz, "key", str(tz)),
-                latitude=float(lat), longitude=float(lon)
-            )
-            s = astral_sun(loc.observer, date=day, tzinfo=tz)
-            return s["sunrise"], s["noon"], s["sunset"]
-        except Exception:
-            pass
+    try:
+        sr, noon, ss = solar_times(day, lat, lon, tz)
+        if sr and ss and civil_twilight(day, lat, lon, tz):
+            return sr, noon, ss
+    except Exception:
+        pass
 
     # Fallback (coarse but robust)
     sr = datetime(day.year, day.month, day.day, 6, 0, 0, tzinfo=tz)
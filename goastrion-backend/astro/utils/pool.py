@@ -0,0 +1,56 @@
+# goastrion-backend/astro/utils/pool.py
+"""
+Process pool runner for the nightly precompute pipelines (astro daily
+payloads, trading bands).
+
+Workers are spawned, not forked, so none inherits the parent's DB connection,
+and run django.setup() first so they can import models. Results come back to
+the parent, which does all the writing. At most 2 * workers tasks are in
+flight, so a lazy task iterator (keyset-paginated chunks) is never drained
+into memory.
+
+Celery's prefork workers are daemonic and cannot start a pool: tasks pass
+workers=1, which runs everything in-process.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+import django
+
+
+def run_pool(
+    fn: Callable[..., Any],
+    tasks: Iterable[Tuple[Any, ...]],
+    workers: int,
+    done: Callable[[Any, float], None],
+) -> None:
+    """
+    fn(*args) for every args tuple in tasks (a picklable, module-level fn);
+    done(result, seconds since submit) is called in the parent as each one
+    finishes. workers <= 1 runs in-process, in order.
+    """
+    if workers <= 1:
+        for args in tasks:
+            started = time.perf_counter()
+            done(fn(*args), time.perf_counter() - started)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=django.setup) as pool:
+        pending: Dict[Any, float] = {}
+        tasks = iter(tasks)
+        while True:
+            for args in tasks:
+                pending[pool.submit(fn, *args)] = time.perf_counter()
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                started = pending.pop(fut)
+                done(fut.result(), time.perf_counter() - started)
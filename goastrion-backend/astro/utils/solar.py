@@ -0,0 +1,206 @@
+# goastrion-backend/astro/utils/solar.py
+"""
+Memoized sunrise / solar noon / sunset.
+
+Panchang dayparts (/daily) and the trading engine (horas, abhijit, rahu/yama/
+gulika) ask for the sun times of the same few places day after day. They are
+solved a whole year at a time per lat/lon cell (4 decimals, ~11 m, the same
+rounding as the transit-hit cache) and kept as UTC instants:
+
+  _YEARS[(lat cell, lon cell, year)] → (5, days + 2) µs since the epoch
+                                       rows sunrise / noon / sunset / civil dawn / dusk,
+                                       Dec 31 .. Jan 1
+
+so a lookup is an array index plus the conversion to the caller's time zone.
+
+The year pass is astral's NOAA algorithm (time_of_transit with the same
+refraction and two refinement steps, noon truncated to the second) vectorized
+with numpy. Sunrise/sunset that land on another local date are retried on the
+neighbouring day as astral does; None where the sun doesn't rise or set.
+civil_twilight() answers whether astral's sun() (which also solves dawn and
+dusk at 6° depression) would succeed: above ~60° in summer it raises there,
+and callers that used sun() keep their fallback for those days.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from math import radians, tan
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from .cache import BoundedCache
+
+CELLS_PER_DEG = 10_000
+
+_SUN_ZENITH = 90.0 + 32.0 / 120.0     # horizon + apparent solar radius
+_CIVIL_ZENITH = 96.0                  # astral Depression.CIVIL
+_US_PER_DAY = 86_400_000_000
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_JD_UNIX_EPOCH = 2440587.5
+_ORD_UNIX_EPOCH = date(1970, 1, 1).toordinal()
+
+_YEARS = BoundedCache("solar.years", maxsize=1024)
+
+
+class SolarTimes(NamedTuple):
+    sunrise: Optional[datetime]
+    noon: datetime
+    sunset: Optional[datetime]
+
+
+def _refraction_at_zenith(zenith: float) -> float:
+    elevation = 90.0 - zenith
+    if elevation >= 85.0:
+        return 0.0
+    te = tan(radians(elevation))
+    if elevation > 5.0:
+        corr = 58.1 / te - 0.07 / (te * te * te) + 0.000086 / (te * te * te * te * te)
+    elif elevation > -0.575:
+        corr = 1735.0 + elevation * (-518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711)))
+    else:
+        corr = -20.774 / te
+    return corr / 3600.0
+
+
+_ZENITH = _SUN_ZENITH + _refraction_at_zenith(_SUN_ZENITH)
+_TWILIGHT_ZENITH = _CIVIL_ZENITH + _refraction_at_zenith(_CIVIL_ZENITH)
+
+
+# ---- NOAA solar position (arrays of Julian centuries) ----
+def _obliquity(jc: np.ndarray) -> np.ndarray:
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    e0 = 23.0 + (26.0 + seconds / 60.0) / 60.0
+    return e0 + 0.00256 * np.cos(np.radians(125.04 - 1934.136 * jc))
+
+
+def _mean_long(jc: np.ndarray) -> np.ndarray:
+    return (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+
+
+def _mean_anomaly(jc: np.ndarray) -> np.ndarray:
+    return 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+
+
+def _eccentricity(jc: np.ndarray) -> np.ndarray:
+    return 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+
+def _declination(jc: np.ndarray) -> np.ndarray:
+    mrad = np.radians(_mean_anomaly(jc))
+    center = (np.sin(mrad) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+              + np.sin(mrad + mrad) * (0.019993 - 0.000101 * jc)
+              + np.sin(mrad + mrad + mrad) * 0.000289)
+    app_long = _mean_long(jc) + center - 0.00569 - 0.00478 * np.sin(np.radians(125.04 - 1934.136 * jc))
+    return np.degrees(np.arcsin(np.sin(np.radians(_obliquity(jc))) * np.sin(np.radians(app_long))))
+
+
+def _eq_of_time(jc: np.ndarray) -> np.ndarray:
+    """Minutes."""
+    l0 = np.radians(_mean_long(jc))
+    m = np.radians(_mean_anomaly(jc))
+    e = _eccentricity(jc)
+    y = np.tan(np.radians(_obliquity(jc)) / 2.0) ** 2
+    etime = (y * np.sin(2.0 * l0) - 2.0 * e * np.sin(m) + 4.0 * e * y * np.sin(m) * np.cos(2.0 * l0)
+             - 0.5 * y * y * np.sin(4.0 * l0) - 1.25 * e * e * np.sin(2.0 * m))
+    return np.degrees(etime) * 4.0
+
+
+def _transit_minutes(jd: np.ndarray, lat: float, lon: float, rising: bool, zenith: float = _ZENITH) -> np.ndarray:
+    """Minutes after each day's 00:00 UTC of sunrise (rising) or sunset; NaN if none."""
+    lat_rad = np.radians(min(89.8, max(-89.8, lat)))
+    adjustment = np.zeros_like(jd)
+    minutes = adjustment
+    for _ in range(2):
+        jc = (jd + adjustment - 2451545.0) / 36525.0
+        decl = np.radians(_declination(jc))
+        h = (np.cos(np.radians(zenith)) - np.sin(lat_rad) * np.sin(decl)) / (np.cos(lat_rad) * np.cos(decl))
+        with np.errstate(invalid="ignore"):
+            hour_angle = np.arccos(h)
+        if not rising:
+            hour_angle = -hour_angle
+        offset = (-lon - np.degrees(hour_angle)) * 4.0 - _eq_of_time(jc)
+        offset = np.where(offset < -720.0, offset + 1440.0, offset)
+        minutes = 720.0 + offset
+        adjustment = minutes / 1440.0
+    return minutes
+
+
+def _minutes_to_us(minutes: np.ndarray) -> np.ndarray:
+    """Whole microseconds, truncated like astral's minutes_to_timedelta (NaN stays NaN)."""
+    days = np.trunc(minutes / 1440.0)
+    secs = (minutes - days * 1440.0) * 60.0
+    whole = np.trunc(secs)
+    return (days * 86400.0 + whole) * 1e6 + np.trunc((secs - whole) * 1e6)
+
+
+def _noon_us(jd: np.ndarray, lon: float) -> np.ndarray:
+    hours = (720.0 - 4.0 * lon - _eq_of_time((jd - 2451545.0) / 36525.0)) / 60.0
+    h = np.trunc(hours)
+    m = np.trunc((hours - h) * 60.0)
+    s = np.trunc(((hours - h) * 60.0 - m) * 60.0)
+    return (h * 3600.0 + m * 60.0 + s) * 1e6
+
+
+def cell(lat: float, lon: float) -> Tuple[int, int]:
+    return int(round(float(lat) * CELLS_PER_DEG)), int(round(float(lon) * CELLS_PER_DEG))
+
+
+def _year_table(lat_cell: int, lon_cell: int, year: int) -> np.ndarray:
+    def build() -> np.ndarray:
+        lat, lon = lat_cell / CELLS_PER_DEG, lon_cell / CELLS_PER_DEG
+        first = date(year, 1, 1).toordinal() - _ORD_UNIX_EPOCH - 1
+        days = np.arange(first, date(year + 1, 1, 1).toordinal() - _ORD_UNIX_EPOCH + 1, dtype=float)
+        jd = _JD_UNIX_EPOCH + days
+        midnight = days * _US_PER_DAY
+        return np.stack([
+            midnight + _minutes_to_us(_transit_minutes(jd, lat, lon, rising=True)),
+            midnight + _noon_us(jd, lon),
+            midnight + _minutes_to_us(_transit_minutes(jd, lat, lon, rising=False)),
+            midnight + _minutes_to_us(_transit_minutes(jd, lat, lon, rising=True, zenith=_TWILIGHT_ZENITH)),
+            midnight + _minutes_to_us(_transit_minutes(jd, lat, lon, rising=False, zenith=_TWILIGHT_ZENITH)),
+        ])
+    return _YEARS.get_or_set((lat_cell, lon_cell, year), build)
+
+
+def _at(us: float, tz: ZoneInfo) -> Optional[datetime]:
+    if np.isnan(us):
+        return None
+    return (_UNIX_EPOCH + timedelta(microseconds=int(us))).astimezone(tz)
+
+
+def _event(row: np.ndarray, i: int, day: date, tz: ZoneInfo) -> Optional[datetime]:
+    dt = _at(row[i], tz)
+    if dt is None or dt.date() == day:
+        return dt
+    dt = _at(row[i + 1 if dt.date() < day else i - 1], tz)
+    return dt if dt is not None and dt.date() == day else None
+
+
+def _zone(tz: Union[str, ZoneInfo]) -> ZoneInfo:
+    return tz if isinstance(tz, ZoneInfo) else ZoneInfo(str(tz))
+
+
+def solar_times(day: date, lat: float, lon: float, tz: Union[str, ZoneInfo]) -> SolarTimes:
+    """Sunrise, solar noon and sunset of `day` in tz (sunrise/sunset None if the sun doesn't cross the horizon)."""
+    tz = _zone(tz)
+    tbl = _year_table(*cell(lat, lon), day.year)
+    i = day.timetuple().tm_yday            # row 0 is Dec 31 of the previous year
+    return SolarTimes(_event(tbl[0], i, day, tz), _at(tbl[1, i], tz), _event(tbl[2], i, day, tz))
+
+
+def civil_twilight(day: date, lat: float, lon: float, tz: Union[str, ZoneInfo]) -> bool:
+    """True if both civil dawn and dusk fall on `day` in tz (i.e. astral sun() would not raise)."""
+    tz = _zone(tz)
+    tbl = _year_table(*cell(lat, lon), day.year)
+    i = day.timetuple().tm_yday
+    return _event(tbl[3], i, day, tz) is not None and _event(tbl[4], i, day, tz) is not None
+
+
+def solar_year(year: int, lat: float, lon: float, tz: Union[str, ZoneInfo]) -> Dict[date, SolarTimes]:
+    """Every day of `year` at once (one vectorized pass, then shared with solar_times)."""
+    tz = _zone(tz)
+    d0 = date(year, 1, 1)
+    n = (date(year + 1, 1, 1) - d0).days
+    return {d: solar_times(d, lat, lon, tz) for d in (d0 + timedelta(days=k) for k in range(n))}
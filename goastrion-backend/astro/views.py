@@ -5,6 +5,8 @@ from django.db.models.functions import Round
 
 from .models import Chart
 from .serializers import ChartSerializer
+from .services.natal_store import natal_record
+from .utils.conditional import make_etag, not_modified, stamp
 
 # --- tiny helper + API error (kept here to avoid new files) ---
 class DuplicateChart(APIException):
@@ -25,6 +27,16 @@ class ChartListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         return Chart.objects.filter(user=self.request.user).order_by("-created_at")
 
+    def list(self, request, *args, **kwargs):
+        # Conditional GET: (id, created_at) of the user's charts decide whether the
+        # list changed, before any chart is loaded or serialized. No Last-Modified:
+        # deleting a chart does not move max(created_at).
+        stamps = [(pk, ts.isoformat()) for pk, ts in self.get_queryset().values_list("id", "created_at")]
+        etag = make_etag(request.user.pk, stamps)
+        cache_control = "private, no-cache"
+        return (not_modified(request, etag, cache_control=cache_control)
+                or stamp(super().list(request, *args, **kwargs), etag, cache_control=cache_control))
+
     def perform_create(self, serializer):
         user = self.request.user
         data = serializer.validated_data
@@ -52,8 +64,8 @@ class ChartListCreateView(generics.ListCreateAPIView):
             payload = ChartSerializer(existing).data
             raise DuplicateChart(detail={"message": "Duplicate chart", "existing": payload})
 
-        # save (force or no duplicate)
-        serializer.save(user=user, timezone=tz)
+        # save (force or no duplicate), linked to the precomputed natal record
+        serializer.save(user=user, timezone=tz, natal=natal_record(dt, data["latitude"], data["longitude"]))
 
 
 class ChartDeleteView(generics.DestroyAPIView):
@@ -95,6 +95,11 @@ CORS_ALLOW_CREDENTIALS = True
 GOASTRION_CONFIG_DIR = config("GOASTRION_CONFIG_DIR", default=str(BASE_DIR / "config"))
 os.environ.setdefault("GOASTRION_CONFIG_DIR", GOASTRION_CONFIG_DIR)
 
+# Generated ephemeris artefacts (transit tables, event catalogs). Built by
+# `manage.py build_ephemeris_table`; every worker memory-maps the same files.
+GOASTRION_EPHEM_DIR = config("GOASTRION_EPHEM_DIR", default=str(BASE_DIR / "data" / "ephem"))
+os.environ.setdefault("GOASTRION_EPHEM_DIR", GOASTRION_EPHEM_DIR)
+
 # ------------------------------------------------------------------------------
 # Applications
 # ------------------------------------------------------------------------------
@@ -260,6 +265,23 @@ CACHES = {
     }
 }
 
+# Trading response cache: shared by every worker when REDIS_URL is set (so a
+# deploy or a new worker starts warm), per-process otherwise.
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES["trading"] = {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "goastrion",
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient", "IGNORE_EXCEPTIONS": True},
+    }
+else:
+    CACHES["trading"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "goastrion-trading-cache",
+        "OPTIONS": {"MAX_ENTRIES": 5000},   # warm() stores ~(2 * assets + 6) keys per day
+    }
+
 # ------------------------------------------------------------------------------
 # Logging (human-readable in dev, tighter in prod)
 # ------------------------------------------------------------------------------
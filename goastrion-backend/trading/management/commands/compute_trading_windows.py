@@ -1,19 +1,38 @@
 
 from __future__ import annotations
-from datetime import date, timedelta
-from django.core.management.base import BaseCommand
-from trading.models import TradingAsset
-from trading.services.engine import compute_daily_bands
+import os
+import time
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from trading.services.precompute import precompute
+from trading.services.response_cache import shared_cache, warm
 
 class Command(BaseCommand):
     help = "Precompute trading daily bands for today + next N days (default 5)."
     def add_arguments(self, parser):
         parser.add_argument("--days", type=int, default=5)
+        parser.add_argument("--start", default=None, help="YYYY-MM-DD (default: today)")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes; 1 runs in-process")
+        parser.add_argument("--force", action="store_true", help="recompute rows whose inputs are unchanged")
+        parser.add_argument("--no-warm", action="store_true", help="skip re-warming the trading response cache")
     def handle(self, *args, **opts):
         days = int(opts.get("days") or 5)
-        today = date.today()
-        assets = TradingAsset.objects.filter(status="active").order_by("id")
-        for a in assets:
-            for i in range(days + 1):
-                compute_daily_bands(a, today + timedelta(days=i), force=True)
-        self.stdout.write(self.style.SUCCESS(f"Computed for {assets.count()} assets, {days+1} days."))
+        try:
+            start = date.fromisoformat(opts["start"]) if opts.get("start") else None
+        except ValueError:
+            raise CommandError("Invalid --start, expected YYYY-MM-DD.")
+        def progress(rows, total, seconds):
+            self.stdout.write(f"{rows}/{total} rows in {seconds:.1f}s")
+        r = precompute(days, start, workers=int(opts["workers"]), force=bool(opts["force"]), progress=progress)
+        self.stdout.write(self.style.SUCCESS(
+            f"Computed for {r['assets']} assets, {r['days']} days: {r['written']} written, {r['skipped']} unchanged "
+            f"in {r['seconds']:.1f}s ({r['rows_per_s'] or 0:.0f} rows/s, {r['workers']} worker(s))."
+        ))
+        if opts["no_warm"]:
+            return
+        if not shared_cache():
+            self.stdout.write("Response cache not warmed: CACHES[\"trading\"] is per-process (set REDIS_URL to share it).")
+            return
+        t0 = time.perf_counter()
+        n = warm(days, start)
+        self.stdout.write(self.style.SUCCESS(f"Warmed {n} response cache keys in {time.perf_counter() - t0:.1f}s."))
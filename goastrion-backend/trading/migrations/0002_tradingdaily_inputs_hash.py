@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 19:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tradingdaily',
+            name='inputs_hash',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+    ]
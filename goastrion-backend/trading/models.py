@@ -38,6 +38,7 @@ class TradingDaily(models.Model):
     session_end = models.CharField(max_length=5)
     bands = models.JSONField(default=list)
     engine_version = models.CharField(max_length=16, default="1.0.0")
+    inputs_hash = models.CharField(max_length=40, blank=True, default="")  # engine.inputs_hash at generation
     generated_at = models.DateTimeField(default=timezone.now)
     class Meta:
         unique_together = ("asset","date")
@@ -0,0 +1,42 @@
+"""
+Bulk band fetch for the read endpoints.
+
+All (asset, date) rows a request needs come from one TradingDaily query.
+Whatever the precompute has not stored yet is scored per date in one engine
+pass (engine.daily_rows) and upserted in one bulk write, so a view costs the
+same round-trips for 1 asset or 30.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+from ..models import TradingAsset, TradingDaily
+from .engine import daily_rows, store_rows
+
+BandKey = Tuple[str, date]  # (asset id, date)
+
+
+def get_daily_bands(assets: Sequence[TradingAsset], dates: Sequence[date]) -> Dict[BandKey, TradingDaily]:
+    """
+    {(asset id, date): TradingDaily} for every asset × date. Pass assets with
+    session_rules selected; rows missing from the table are computed and stored.
+    """
+    if not assets or not dates:
+        return {}
+    found = {
+        (r.asset_id, r.date): r
+        for r in TradingDaily.objects.filter(asset_id__in=[a.id for a in assets], date__in=list(dates))
+    }
+
+    missing: Dict[date, List[TradingAsset]] = defaultdict(list)
+    for d in dates:
+        for a in assets:
+            if (a.id, d) not in found:
+                missing[d].append(a)
+    if missing:
+        rows = [row for d, group in missing.items() for row in daily_rows(group, d)]
+        store_rows(rows)
+        found.update(((r.asset_id, r.date), r) for r in rows)
+    return found
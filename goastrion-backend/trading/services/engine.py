@@ -1,10 +1,14 @@
 
 from __future__ import annotations
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Sequence, Tuple
+
+import numpy as np
 from astral import LocationInfo
-from astral.sun import sun
 
+from astro.utils.cache import BoundedCache, fingerprint
+from astro.utils.solar import solar_times
 from ..constants import DAY_LORD, HORA_SEQUENCE, ASSET_AFFINITY, BIAS_THRESH_UP, BIAS_THRESH_DOWN
 from ..models import TradingAsset, TradingDaily
 from ..utils.sessions import get_session_for
@@ -28,9 +32,15 @@ def _split_day_eighths(sr: datetime, ss: datetime) -> List[tuple]:
         slots.append((a,b))
     return slots
 
+def _sun_rise_set(d0: date, loc: LocationInfo) -> Tuple[datetime, datetime]:
+    """Memoized sunrise/sunset (astro.utils.solar), shared by rahu/yama/gulika, abhijit and horas."""
+    st = solar_times(d0, loc.latitude, loc.longitude, loc.timezone)
+    if st.sunrise is None or st.sunset is None:
+        raise ValueError(f"No sunrise/sunset on {d0} at {loc.name}")
+    return st.sunrise, st.sunset
+
 def _compute_rahu_yama_gulika(d0: date, loc: LocationInfo):
-    sdict = sun(loc.observer, date=d0, tzinfo=loc.timezone)
-    sr = sdict["sunrise"]; ss = sdict["sunset"]
+    sr, ss = _sun_rise_set(d0, loc)
     slots = _split_day_eighths(sr, ss)
     wd = d0.weekday()  # Mon=0..Sun=6
     def fmt(a, b): return a.strftime("%H:%M"), b.strftime("%H:%M")
@@ -40,8 +50,7 @@ def _compute_rahu_yama_gulika(d0: date, loc: LocationInfo):
     return {"rahu": rahu, "yama": yama, "gulika": gulika}
 
 def _compute_abhijit(d0: date, loc: LocationInfo):
-    sdict = sun(loc.observer, date=d0, tzinfo=loc.timezone)
-    sr = sdict["sunrise"]; ss = sdict["sunset"]
+    sr, ss = _sun_rise_set(d0, loc)
     day_len = (ss - sr).total_seconds()
     mid = sr + timedelta(seconds=day_len/2)
     dur = day_len/15.0  # ~1/15th of daytime
@@ -50,8 +59,7 @@ def _compute_abhijit(d0: date, loc: LocationInfo):
     return a, b
 
 def _compute_horas(d0: date, loc: LocationInfo):
-    sdict = sun(loc.observer, date=d0, tzinfo=loc.timezone)
-    sr = sdict["sunrise"]; ss = sdict["sunset"]
+    sr, ss = _sun_rise_set(d0, loc)
     day_len = (ss - sr).total_seconds()
     seg = day_len / 12.0
     lord = DAY_LORD[d0.weekday()]
@@ -88,106 +96,147 @@ def _affinity_for_asset(asset: TradingAsset):
         return ASSET_AFFINITY["BTC"]
     return ASSET_AFFINITY["INDEX"]
 
-def _score_slot(asset: TradingAsset, hora_ruler: str, in_abhijit: bool, in_rahu: bool, in_yama: bool, in_gulika: bool):
-    reasons: List[str] = []
-    s = 0
-    vol = "med"
-    aff = _affinity_for_asset(asset)
-    hora_w = aff.get(hora_ruler, 0)
-    if hora_w:
-        s += hora_w
-        reasons.append(f"{hora_ruler.upper()}_HORA")
-    if in_abhijit:
-        s += 10
-        reasons.append("ABHIJIT_MUHURAT")
-        vol = "high"
-    caution = False
-    if in_rahu:
-        s -= 10
-        reasons.append("RAHU_KAAL")
-        vol = "high"; caution = True
-    if in_yama:
-        s -= 6; reasons.append("YAMAGANDA")
-    if in_gulika:
-        s -= 6; reasons.append("GULIKA_KAAL")
-    return s, reasons, caution, vol
-
-def _decide_bias(signed_score: int) -> str:
-    if signed_score >= BIAS_THRESH_UP: return "up"
-    if signed_score <= BIAS_THRESH_DOWN: return "down"
-    return "choppy"
-
-def compute_daily_bands(asset: TradingAsset, d: date, *, force: bool = False) -> TradingDaily:
-    existing = TradingDaily.objects.filter(asset=asset, date=d).first()
-    if existing and not force:
-        return existing
-    session = get_session_for(asset, d)
-    loc = MUMBAI
-    abh_a, abh_b = _compute_abhijit(d, loc)
-    ryf = _compute_rahu_yama_gulika(d, loc)
-    rah_a, rah_b = ryf["rahu"]
-    yam_a, yam_b = ryf["yama"]
-    gul_a, gul_b = ryf["gulika"]
-    horas = _compute_horas(d, loc)
-
+# ---- date-level feature grid (shared by every asset) ----
+# Per minute of the day: the hora ruler (one-hot over HORA_SEQUENCE; "Sun" outside
+# the horas) and the abhijit / rahu / yama / gulika flags. An asset's slot scores
+# are then one matrix product with its ASSET_AFFINITY row + the muhurta weights.
+MUHURTA_WEIGHTS = (10, -10, -6, -6)
+MUHURTA_REASONS = ("ABHIJIT_MUHURAT", "RAHU_KAAL", "YAMAGANDA", "GULIKA_KAAL")
+_BIAS = ("up", "down", "choppy")
+_DAY_MINUTES = 24 * 60
+_DAY_FEATURES = BoundedCache("trading.day_features", maxsize=512)
+
+@dataclass(frozen=True)
+class DayFeatures:
+    ruler: np.ndarray   # (1440,) index into HORA_SEQUENCE
+    flags: np.ndarray   # (1440, 4) bool: abhijit, rahu, yama, gulika
+    matrix: np.ndarray  # (1440, 7 + 4) one-hot ruler + flags
+
+def _build_day_features(d0: date, loc: LocationInfo) -> DayFeatures:
+    abh = _compute_abhijit(d0, loc)
+    ryg = _compute_rahu_yama_gulika(d0, loc)
+    ruler = np.full(_DAY_MINUTES, HORA_SEQUENCE.index("Sun"), dtype=np.int64)
+    for ha, hb, r in reversed(_compute_horas(d0, loc)):  # first matching hora wins
+        ruler[_hm_to_minutes(ha):_hm_to_minutes(hb)] = HORA_SEQUENCE.index(r)
+    flags = np.zeros((_DAY_MINUTES, len(MUHURTA_WEIGHTS)), dtype=bool)
+    for k, (a, b) in enumerate((abh, ryg["rahu"], ryg["yama"], ryg["gulika"])):
+        flags[_hm_to_minutes(a):_hm_to_minutes(b), k] = True
+    matrix = np.concatenate([np.eye(len(HORA_SEQUENCE), dtype=np.int64)[ruler], flags.astype(np.int64)], axis=1)
+    return DayFeatures(ruler=ruler, flags=flags, matrix=matrix)
+
+def day_features(d0: date, loc: LocationInfo = MUMBAI) -> DayFeatures:
+    return _DAY_FEATURES.get_or_set((d0, loc.name, loc.latitude, loc.longitude),
+                                    lambda: _build_day_features(d0, loc))
+
+def affinity_matrix(assets: Sequence[TradingAsset]) -> np.ndarray:
+    """(A, 7 + 4) slot-feature weights: hora ruler affinities, then MUHURTA_WEIGHTS."""
+    rows = []
+    for a in assets:
+        aff = _affinity_for_asset(a)
+        rows.append([aff.get(r, 0) for r in HORA_SEQUENCE] + list(MUHURTA_WEIGHTS))
+    return np.array(rows, dtype=np.int64).reshape(len(rows), len(HORA_SEQUENCE) + len(MUHURTA_WEIGHTS))
+
+def _slot_reasons(ruler: int, flags: np.ndarray, hora_w: np.ndarray) -> List[str]:
+    reasons = [f"{HORA_SEQUENCE[ruler].upper()}_HORA"] if hora_w[ruler] else []
+    reasons += [MUHURTA_REASONS[k] for k in np.flatnonzero(flags)]
+    return reasons[:2]
+
+def _session_minutes(session) -> Tuple[int, int]:
     start_m = _hm_to_minutes(session.start)
     end_m = _hm_to_minutes(session.end)
     if start_m >= end_m:
         start_m, end_m = 9*60+15, 15*60+30
+    return start_m, end_m
+
+def _bands(feats: DayFeatures, scores: np.ndarray, weights: np.ndarray, start_m: int, end_m: int) -> List[Dict[str, Any]]:
+    """5-minute slots of one asset, run-length merged on (bias, caution, volatility)."""
+    t = np.arange(start_m, end_m, 5)
+    s = scores[t]
+    flags = feats.flags[t]
+    abh, rah = flags[:, 0], flags[:, 1]
+    high = abh | rah
+    bias = np.where(s >= BIAS_THRESH_UP, 0, np.where(s <= BIAS_THRESH_DOWN, 1, 2))
+    conf = np.clip(50 + np.abs(s)*2 + np.where(abh, 10, 0), 0, 100)
+
+    key = bias*4 + rah*2 + high
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    ends = np.r_[starts[1:], len(t)]
+    peak = np.maximum.reduceat(conf, starts)
+    # reasons only change where the ruler or a flag does
+    ruler = feats.ruler[t]
+    code = ruler*16 + flags @ np.array([8, 4, 2, 1])
+    changes = np.flatnonzero(np.r_[True, code[1:] != code[:-1]])
 
-    def in_range(a: str, b: str, t: int) -> bool:
-        return _hm_to_minutes(a) <= t < _hm_to_minutes(b)
-
-    slots: List[Dict[str, Any]] = []
-    t = start_m
-    while t < end_m:
-        hora_ruler = "Sun"
-        for ha, hb, r in horas:
-            if in_range(ha, hb, t):
-                hora_ruler = r; break
-        in_abh = in_range(abh_a, abh_b, t)
-        in_rah = in_range(rah_a, rah_b, t)
-        in_yam = in_range(yam_a, yam_b, t)
-        in_gul = in_range(gul_a, gul_b, t)
-        s, reasons, caution, vol = _score_slot(asset, hora_ruler, in_abh, in_rah, in_yam, in_gul)
-        bias = _decide_bias(s)
-        conf = max(0, min(100, 50 + abs(s)*2 + (10 if in_abh else 0)))
-        slots.append({
-            "start": _minutes_to_hm(t),
-            "end": _minutes_to_hm(min(t+5, end_m)),
-            "bias": bias,
-            "confidence": conf,
-            "volatility": vol,
+    merged: List[Dict[str, Any]] = []
+    for i0, i1, c in zip(starts, ends, peak):
+        reasons: List[str] = []
+        lo, hi = np.searchsorted(changes, i0, side="right"), np.searchsorted(changes, i1)
+        for p in [i0, *changes[lo:hi]]:
+            for r in _slot_reasons(ruler[p], flags[p], weights):
+                if r not in reasons: reasons.append(r)
+            if len(reasons) >= 2: break
+        merged.append({
+            "start": _minutes_to_hm(int(t[i0])),
+            "end": _minutes_to_hm(min(int(t[i1-1]) + 5, end_m)),
+            "bias": _BIAS[bias[i0]],
+            "confidence": int(c),
+            "volatility": "high" if high[i0] else "med",
             "reasons": reasons[:2],
-            "caution": caution,
+            "caution": bool(rah[i0]),
         })
-        t += 5
+    return merged
+
+def score_assets(assets: Sequence[TradingAsset], d: date) -> Dict[str, Tuple[Any, List[Dict[str, Any]]]]:
+    """{asset id: (session, merged bands)} for one date; all assets scored in one matrix product."""
+    if not assets:
+        return {}
+    feats = day_features(d)
+    weights = affinity_matrix(assets)
+    scores = feats.matrix @ weights.T                      # (1440, A)
+    out = {}
+    for j, asset in enumerate(assets):
+        session = get_session_for(asset, d)
+        out[asset.id] = (session, _bands(feats, scores[:, j], weights[j], *_session_minutes(session)))
+    return out
+
+def inputs_hash(asset: TradingAsset, d: date, session, loc: LocationInfo = MUMBAI) -> str:
+    """Everything an asset-day's bands depend on besides ENGINE_VERSION (see TradingDaily.inputs_hash)."""
+    return fingerprint([d.isoformat(), loc.latitude, loc.longitude, loc.timezone,
+                        asset.tz, session.start, session.end, _affinity_for_asset(asset)])
+
+def _row(asset: TradingAsset, d: date, session, merged: List[Dict[str, Any]]) -> TradingDaily:
+    return TradingDaily(
+        asset=asset, date=d,
+        tz=asset.tz,
+        session_start=session.start,
+        session_end=session.end,
+        bands=merged,
+        engine_version=ENGINE_VERSION,
+        inputs_hash=inputs_hash(asset, d, session),
+    )
 
-    merged: List[Dict[str, Any]] = []
-    cur = None
-    for b in slots:
-        if not cur:
-            cur = dict(b); continue
-        same_bias = b["bias"] == cur["bias"] and b.get("caution") == cur.get("caution") and b.get("volatility") == cur.get("volatility")
-        if same_bias:
-            cur["end"] = b["end"]
-            cur["confidence"] = max(cur["confidence"], b["confidence"])
-            rset = []
-            for r in cur.get("reasons", []) + b.get("reasons", []):
-                if r not in rset: rset.append(r)
-            cur["reasons"] = rset[:2]
-        else:
-            merged.append(cur); cur = dict(b)
-    if cur: merged.append(cur)
+_UPSERT_FIELDS = ["tz", "session_start", "session_end", "bands", "engine_version", "inputs_hash", "generated_at"]
+
+def store_rows(rows: Sequence[TradingDaily], batch_size: int = 500) -> int:
+    """Insert-or-update rows on (asset, date) in batches; returns the number written."""
+    TradingDaily.objects.bulk_create(
+        rows, batch_size=batch_size,
+        update_conflicts=True, unique_fields=["asset", "date"], update_fields=_UPSERT_FIELDS,
+    )
+    return len(rows)
+
+def daily_rows(assets: Sequence[TradingAsset], d: date) -> List[TradingDaily]:
+    """Unsaved TradingDaily rows for all assets on one date."""
+    scored = score_assets(assets, d)
+    return [_row(a, d, *scored[a.id]) for a in assets]
 
+def compute_daily_bands(asset: TradingAsset, d: date, *, force: bool = False) -> TradingDaily:
+    existing = TradingDaily.objects.filter(asset=asset, date=d).first()
+    if existing and not force:
+        return existing
+    row = daily_rows([asset], d)[0]
     td, _ = TradingDaily.objects.update_or_create(
         asset=asset, date=d,
-        defaults=dict(
-            tz=asset.tz,
-            session_start=session.start,
-            session_end=session.end,
-            bands=merged,
-            engine_version=ENGINE_VERSION,
-        )
+        defaults={f: getattr(row, f) for f in _UPSERT_FIELDS},
     )
     return td
@@ -0,0 +1,182 @@
+"""
+Response bodies of the trading endpoints, built from primitive params so the
+response cache can rebuild them off the request path (background refresh,
+precompute warm-up). Views only parse the request and pick one of these.
+
+Each builder returns a Page: the body plus its conditional-GET validators,
+derived from the TradingDaily rows it was built from (asset, date,
+engine_version, generated_at), so the ETag always describes the exact body
+it is cached and served with.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from astro.utils.conditional import make_etag
+from ..models import TradingAsset, TradingDaily
+from .bands import get_daily_bands
+from .engine import ENGINE_VERSION
+from .selector import pick_big_move_windows, extract_directional_windows
+
+
+# ----------------------------- scoring helpers -----------------------------
+
+
+VOL_BONUS = {"low": 0, "med": 5, "high": 10}
+
+
+def _window_score(w: dict) -> int:
+    """
+    Composite score: confidence + peak_score + volatility bonus - caution - uncertain penalty.
+    """
+    conf = int(w.get("confidence") or 0)
+    peak = int(w.get("peak_score") or 0)
+    vol = (w.get("volatility") or "").lower()
+    vol_bonus = VOL_BONUS.get(vol, 0)
+    caution_penalty = -10 if w.get("caution") else 0
+    label = (w.get("label") or "")
+    dir_penalty = 0 if ("Up" in label or "Down" in label) else -4
+    return conf + peak + vol_bonus + caution_penalty + dir_penalty
+
+
+SCOPE_TO_KINDS = {
+    "all": None,
+    "indices": ("index",),
+    "sectors": ("sector",),
+    "commodities": ("commodity",),
+    "crypto": ("crypto",),
+}
+
+
+def get_asset(asset_id: str) -> Optional[TradingAsset]:
+    try:
+        return TradingAsset.objects.select_related("session_rules").get(pk=asset_id)
+    except TradingAsset.DoesNotExist:
+        return None
+
+
+# --------------------------------- pages -----------------------------------
+
+class Page(NamedTuple):
+    body: Dict[str, Any]
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def _page(body: Dict[str, Any], rows: Iterable[TradingDaily]) -> Page:
+    rows = list(rows)
+    stamps = sorted((r.asset_id, r.date.isoformat(), r.engine_version, r.generated_at.isoformat()) for r in rows)
+    return Page(body, make_etag(stamps), max((r.generated_at for r in rows), default=None))
+
+
+def intraday_page(asset: TradingAsset, d: date) -> Page:
+    daily = get_daily_bands([asset], [d])[(asset.id, d)]
+    windows = pick_big_move_windows(daily.bands) or []
+
+    return _page(dict(
+        asset=asset.id,
+        tz=asset.tz,
+        session={"start": daily.session_start, "end": daily.session_end},
+        windows=windows,
+        engine_version=daily.engine_version or ENGINE_VERSION,
+    ), [daily])
+
+
+def sectors_page(d: date) -> Page:
+    sectors = list(
+        TradingAsset.objects.filter(kind="sector", status="active").select_related("session_rules").order_by("id")
+    )
+    bands = get_daily_bands(sectors, [d])
+
+    out = []
+    for asset in sectors:
+        daily = bands[(asset.id, d)]
+        up = extract_directional_windows(daily.bands, direction="up", limit=3)
+        down = extract_directional_windows(daily.bands, direction="down", limit=3)
+        out.append({"asset": asset.id, "up": up, "down": down})
+
+    return _page({"date": d.isoformat(), "tz": "Asia/Kolkata", "sectors": out}, bands.values())
+
+
+def week_dates(asset: TradingAsset, start: date) -> List[date]:
+    """5 weekdays from start (7 days for crypto)."""
+    dates = []
+    cur = start
+    target = 7 if asset.kind == "crypto" else 5
+
+    while len(dates) < target:
+        # Skip weekends for non-crypto
+        if asset.kind == "crypto" or cur.weekday() < 5:
+            dates.append(cur)
+        cur += timedelta(days=1)
+    return dates
+
+
+def week_page(asset: TradingAsset, start: date) -> Page:
+    dates = week_dates(asset, start)
+    bands = get_daily_bands([asset], dates)
+    days = []
+    best = None  # {"date": "...", "score": int, "window": {...}}
+
+    for cur in dates:
+        windows = pick_big_move_windows(bands[(asset.id, cur)].bands) or []
+        days.append({"date": cur.isoformat(), "windows": windows})
+
+        if windows:
+            topw = max(windows, key=_window_score)
+            sc = _window_score(topw)
+            cand = {"date": cur.isoformat(), "score": sc, "window": topw}
+            if (best is None) or (sc > best["score"]):
+                best = cand
+
+    return _page({
+        "asset": asset.id,
+        "tz": asset.tz,
+        "best_day": best,
+        "days": days,
+    }, bands.values())
+
+
+def day_summary_page(day: date, scope: str) -> Page:
+    """Full ranking for the scope; the view applies ?limit= to "ranked"."""
+    kind_filter = SCOPE_TO_KINDS.get(scope)
+    assets_qs = TradingAsset.objects.filter(status="active").select_related("session_rules")
+    if kind_filter:
+        assets_qs = assets_qs.filter(kind__in=kind_filter)
+    assets = list(assets_qs)
+    bands = get_daily_bands(assets, [day])
+
+    ranked = []
+    for asset in assets:
+        daily = bands[(asset.id, day)]
+        windows = pick_big_move_windows(daily.bands) or []
+        if not windows:
+            continue
+
+        topw = max(windows, key=_window_score)
+        sc = _window_score(topw)
+
+        ranked.append({
+            "asset": asset.id,  # string PK like "NIFTY_50"
+            "score": sc,
+            "start": topw.get("start"),
+            "end": topw.get("end"),
+            "label": topw.get("label"),
+            "confidence": topw.get("confidence"),
+            "volatility": topw.get("volatility"),
+            "reasons": topw.get("reasons") or [],
+            "caution": bool(topw.get("caution")),
+            "peak_score": topw.get("peak_score"),
+        })
+
+    ranked.sort(key=lambda x: x["score"], reverse=True)
+    top_asset = ranked[0] if ranked else None
+
+    return _page({
+        "date": day.isoformat(),
+        "tz": "Asia/Kolkata",
+        "scope": scope,
+        "top_asset": top_asset,
+        "ranked": ranked,
+    }, bands.values())
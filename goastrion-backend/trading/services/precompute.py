@@ -0,0 +1,104 @@
+"""
+Bulk trading precompute.
+
+  1. one query for the (inputs_hash, engine_version) of every existing row in the horizon
+  2. asset-days whose hash and version are unchanged are skipped (unless force)
+  3. the remaining dates are sharded across a process pool (astro.utils.pool);
+     each worker scores all pending assets of a date in one engine pass
+  4. the parent upserts each shard with bulk_create(update_conflicts=True)
+"""
+from __future__ import annotations
+
+import os
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from astro.utils.pool import run_pool
+from ..models import TradingAsset, TradingDaily
+from ..utils.sessions import get_session_for
+from .engine import ENGINE_VERSION, daily_rows, inputs_hash, store_rows
+
+Shard = List[Tuple[date, List[str]]]  # (date, asset ids to compute)
+
+
+def _score_shard(assets: Sequence[TradingAsset], shard: Shard) -> List[Tuple]:
+    """Plain tuples (asset_id, date, tz, session_start, session_end, bands, inputs_hash)."""
+    by_id = {a.id: a for a in assets}
+    out = []
+    for d, ids in shard:
+        for r in daily_rows([by_id[i] for i in ids], d):
+            out.append((r.asset_id, r.date, r.tz, r.session_start, r.session_end, r.bands, r.inputs_hash))
+    return out
+
+
+def _rows(tuples: List[Tuple]) -> List[TradingDaily]:
+    return [
+        TradingDaily(asset_id=a, date=d, tz=tz, session_start=s0, session_end=s1, bands=b,
+                     engine_version=ENGINE_VERSION, inputs_hash=h)
+        for a, d, tz, s0, s1, b, h in tuples
+    ]
+
+
+def pending_work(assets: Sequence[TradingAsset], dates: Sequence[date], force: bool = False) -> Tuple[Shard, int]:
+    """(date → asset ids whose stored row is missing or stale, #skipped)."""
+    current: Dict[Tuple[str, date], Tuple[str, str]] = {}
+    if not force and dates:
+        qs = TradingDaily.objects.filter(
+            asset_id__in=[a.id for a in assets], date__gte=min(dates), date__lte=max(dates),
+        ).values_list("asset_id", "date", "inputs_hash", "engine_version")
+        current = {(a, d): (h, v) for a, d, h, v in qs}
+
+    work: Shard = []
+    skipped = 0
+    for d in dates:
+        ids = []
+        for a in assets:
+            if current.get((a.id, d)) == (inputs_hash(a, d, get_session_for(a, d)), ENGINE_VERSION):
+                skipped += 1
+            else:
+                ids.append(a.id)
+        if ids:
+            work.append((d, ids))
+    return work, skipped
+
+
+def precompute(
+    days: int = 5,
+    start: Optional[date] = None,
+    *,
+    workers: Optional[int] = None,
+    shard_days: int = 7,
+    batch_size: int = 500,
+    force: bool = False,
+    progress: Optional[Callable[[int, int, float], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Bands for every active asset, start (default today) .. start + days. workers
+    defaults to the CPU count, 1 runs in-process. progress(rows, total, seconds)
+    is called after each shard is written.
+    """
+    t0 = time.perf_counter()
+    start = start or date.today()
+    dates = [start + timedelta(days=i) for i in range(days + 1)]
+    assets = list(TradingAsset.objects.filter(status="active").select_related("session_rules").order_by("id"))
+    work, skipped = pending_work(assets, dates, force=force)
+    shards = [work[i:i + shard_days] for i in range(0, len(work), shard_days)]
+    total = sum(len(ids) for _, ids in work)
+
+    written = 0
+    def _write(tuples: List[Tuple], _seconds: float) -> None:
+        nonlocal written
+        written += store_rows(_rows(tuples), batch_size=batch_size)
+        if progress:
+            progress(written, total, time.perf_counter() - t0)
+
+    workers = min(workers or os.cpu_count() or 1, len(shards) or 1)
+    run_pool(_score_shard, ((assets, shard) for shard in shards), workers, _write)
+
+    seconds = time.perf_counter() - t0
+    return {
+        "assets": len(assets), "days": len(dates), "written": written, "skipped": skipped,
+        "workers": workers, "seconds": round(seconds, 2),
+        "rows_per_s": round(written / seconds, 1) if seconds > 0 else None,
+    }
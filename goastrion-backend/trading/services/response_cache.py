@@ -0,0 +1,135 @@
+"""
+Stale-while-revalidate cache for the trading endpoints.
+
+Entries live in the "trading" cache (Redis when REDIS_URL is set, so every
+worker and every deploy shares them) under
+
+  trading:resp:v1:<ENGINE_VERSION>:<endpoint>:<fingerprint(params)>
+
+as (fresh_until, Page), the body with its ETag/Last-Modified. A fresh hit is returned as is. A stale one (kept
+up to STALE_SECONDS) is still returned, and one background thread per key,
+claimed with cache.add, rebuilds it. Only a cold key is built on the request
+path. A new ENGINE_VERSION changes every key, so bands from the previous
+engine are never served.
+
+warm() builds every key the web client asks for over the precompute horizon;
+the precompute task/command calls it after writing the bands, so new days
+(midnight rollover) start warm. It does nothing unless the cache is shared:
+a per-process LocMem filled by a command or task is never read by a web worker.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+
+from astro.utils.cache import fingerprint
+from ..models import TradingAsset
+from .engine import ENGINE_VERSION
+from .payloads import SCOPE_TO_KINDS, Page, day_summary_page, intraday_page, sectors_page, week_page
+
+CACHE_ALIAS = "trading"
+FRESH_SECONDS = {"intraday": 5 * 60, "sectors": 10 * 60, "week": 10 * 60, "day_summary": 5 * 60}
+STALE_SECONDS = 7 * 24 * 3600     # outlives the precompute horizon
+REFRESH_LOCK_SECONDS = 60
+_KEY_PREFIX = "trading:resp:v1:"
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def response_key(endpoint: str, params: Dict[str, Any]) -> str:
+    return f"{_KEY_PREFIX}{ENGINE_VERSION}:{endpoint}:{fingerprint(params)}"
+
+
+def _get(key: str) -> Any:
+    try:
+        return caches[CACHE_ALIAS].get(key)
+    except Exception:
+        return None
+
+
+def _store(key: str, endpoint: str, page: Page) -> Page:
+    try:
+        caches[CACHE_ALIAS].set(key, (time.time() + FRESH_SECONDS[endpoint], page), STALE_SECONDS)
+    except Exception:
+        pass
+    return page
+
+
+def _refresh(key: str, endpoint: str, build: Callable[[], Page]) -> None:
+    try:
+        _store(key, endpoint, build())
+    except Exception:
+        pass  # keep serving the stale entry; the next stale hit retries
+    finally:
+        try:
+            caches[CACHE_ALIAS].delete(f"{key}:refreshing")
+        except Exception:
+            pass
+
+
+def _refresh_in_thread(key: str, endpoint: str, build: Callable[[], Page]) -> None:
+    try:
+        _refresh(key, endpoint, build)
+    finally:
+        connection.close()  # the thread's own connection; nobody else closes it
+
+
+def _submit(key: str, endpoint: str, build: Callable[[], Page]) -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trading-swr")
+    _EXECUTOR.submit(_refresh_in_thread, key, endpoint, build)
+
+
+def cached_page(endpoint: str, params: Dict[str, Any], build: Callable[[], Page]) -> Page:
+    """Page for endpoint + (normalized) params: cached, stale while refreshing, or built now."""
+    key = response_key(endpoint, params)
+    entry = _get(key)
+    if entry is None:
+        return _store(key, endpoint, build())
+
+    fresh_until, page = entry
+    if fresh_until < time.time():
+        try:
+            claimed = caches[CACHE_ALIAS].add(f"{key}:refreshing", 1, REFRESH_LOCK_SECONDS)
+        except Exception:
+            claimed = False
+        if claimed:
+            _submit(key, endpoint, build)
+    return page
+
+
+def shared_cache() -> bool:
+    """Whether other processes read what this one stores (not a per-process LocMem)."""
+    return not isinstance(caches[CACHE_ALIAS], LocMemCache)
+
+
+def warm(days: int = 5, start: Optional[date] = None) -> int:
+    """
+    Build and store every endpoint/params the web client uses for start ..
+    start + days; returns #keys (0 without a shared cache, see shared_cache).
+    """
+    if not shared_cache():
+        return 0
+    start = start or date.today()
+    assets = list(TradingAsset.objects.filter(status="active").select_related("session_rules").order_by("id"))
+    n = 0
+    for d in (start + timedelta(days=i) for i in range(days + 1)):
+        iso = d.isoformat()
+        _store(response_key("sectors", {"date": iso}), "sectors", sectors_page(d))
+        for scope in SCOPE_TO_KINDS:
+            _store(response_key("day_summary", {"date": iso, "scope": scope}), "day_summary", day_summary_page(d, scope))
+        for a in assets:
+            _store(response_key("intraday", {"asset": a.id, "date": iso}), "intraday", intraday_page(a, d))
+            _store(response_key("week", {"asset": a.id, "start": iso}), "week", week_page(a, d))
+        n += 1 + len(SCOPE_TO_KINDS) + 2 * len(assets)
+    return n
@@ -1,17 +1,17 @@
 
-from datetime import date, timedelta
 try:
     from celery import shared_task
 except Exception:  # Celery not installed
     shared_task = lambda *a, **k: (lambda f: f)
 
-from .models import TradingAsset
-from .services.engine import compute_daily_bands
+from .services import precompute as pipeline
+from .services import response_cache
 
+# workers=1 in Celery (see astro.utils.pool); compute_trading_windows runs the pool.
+# The response cache is re-warmed from the fresh rows so no page request builds
+# (only when it is shared; warm() is a no-op on a per-process LocMem).
 @shared_task(name="trading.precompute")
-def precompute(days: int = 5):
-    today = date.today()
-    assets = TradingAsset.objects.filter(status="active").order_by("id")
-    for a in assets:
-        for i in range(days + 1):
-            compute_daily_bands(a, today + timedelta(days=i), force=True)
+def precompute(days: int = 5, workers: int = 1, force: bool = False):
+    stats = pipeline.precompute(days, workers=workers, force=force)
+    stats["warmed"] = response_cache.warm(days)
+    return stats
@@ -0,0 +1,21 @@
+import pytest
+from datetime import date
+from trading.models import SessionRules, TradingAsset, TradingDaily
+from trading.services.bands import get_daily_bands
+from trading.services.engine import score_assets
+
+@pytest.mark.django_db
+def test_get_daily_bands_one_query_and_bulk_fill(django_assert_num_queries):
+    nse = SessionRules.objects.create(name="NSE", tz_str="Asia/Kolkata", open_1="09:15", close_1="15:30")
+    for sid in ("NIFTY_BANK", "NIFTY_IT", "NIFTY_AUTO"):
+        TradingAsset.objects.create(id=sid, name=sid, kind="sector", session_rules=nse)
+    assets = list(TradingAsset.objects.select_related("session_rules").order_by("id"))
+    dates = [date(2025, 3, 3), date(2025, 3, 4)]
+
+    with django_assert_num_queries(2):      # select + one bulk upsert
+        first = get_daily_bands(assets, dates)
+    assert len(first) == 6 and TradingDaily.objects.count() == 6
+    with django_assert_num_queries(1):
+        again = get_daily_bands(assets, dates)
+    it = again[("NIFTY_IT", dates[1])]
+    assert it.bands == first[("NIFTY_IT", dates[1])].bands == score_assets([assets[2]], dates[1])["NIFTY_IT"][1]
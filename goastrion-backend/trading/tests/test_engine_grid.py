@@ -0,0 +1,51 @@
+import pytest
+from datetime import date, timedelta
+from trading.models import SessionRules, TradingAsset
+from trading.services import engine as e
+
+def _slot_by_slot(asset, d):
+    """The per-slot walk the grid replaces: HH:MM ranges, one slot at a time, merged pairwise."""
+    abh = e._compute_abhijit(d, e.MUMBAI)
+    ryg = e._compute_rahu_yama_gulika(d, e.MUMBAI)
+    horas = e._compute_horas(d, e.MUMBAI)
+    start_m, end_m = e._session_minutes(e.get_session_for(asset, d))
+    aff = e._affinity_for_asset(asset)
+    def inr(ab, t): return e._hm_to_minutes(ab[0]) <= t < e._hm_to_minutes(ab[1])
+    slots = []
+    for t in range(start_m, end_m, 5):
+        ruler = next((r for ha, hb, r in horas if inr((ha, hb), t)), "Sun")
+        flags = [inr(abh, t), inr(ryg["rahu"], t), inr(ryg["yama"], t), inr(ryg["gulika"], t)]
+        s = aff.get(ruler, 0) + sum(w for w, f in zip(e.MUHURTA_WEIGHTS, flags) if f)
+        reasons = ([f"{ruler.upper()}_HORA"] if aff.get(ruler, 0) else []) + [r for r, f in zip(e.MUHURTA_REASONS, flags) if f]
+        bias = "up" if s >= e.BIAS_THRESH_UP else "down" if s <= e.BIAS_THRESH_DOWN else "choppy"
+        slots.append({"start": e._minutes_to_hm(t), "end": e._minutes_to_hm(min(t + 5, end_m)), "bias": bias,
+                      "confidence": max(0, min(100, 50 + abs(s)*2 + (10 if flags[0] else 0))),
+                      "volatility": "high" if flags[0] or flags[1] else "med", "reasons": reasons[:2], "caution": flags[1]})
+    merged = []
+    for b in slots:
+        cur = merged[-1] if merged else None
+        if cur and (cur["bias"], cur["caution"], cur["volatility"]) == (b["bias"], b["caution"], b["volatility"]):
+            cur["end"] = b["end"]
+            cur["confidence"] = max(cur["confidence"], b["confidence"])
+            cur["reasons"] = list(dict.fromkeys(cur["reasons"] + b["reasons"]))[:2]
+        else:
+            merged.append(dict(b))
+    return merged
+
+@pytest.mark.django_db
+def test_grid_scoring_matches_slot_walk():
+    nse = SessionRules.objects.create(name="NSE", tz_str="Asia/Kolkata", open_1="09:15", close_1="15:30")
+    mcx = SessionRules.objects.create(name="MCX", tz_str="Asia/Kolkata", open_1="09:07", close_1="23:30")
+    assets = [
+        TradingAsset.objects.create(id="NIFTY_50", name="NIFTY 50", kind="index", session_rules=nse),
+        TradingAsset.objects.create(id="NIFTY_IT", name="NIFTY IT", kind="sector", session_rules=nse),
+        TradingAsset.objects.create(id="MCX_CRUDE", name="Crude", kind="commodity", session_rules=mcx),
+        TradingAsset.objects.create(id="BTCUSD", name="Bitcoin", kind="crypto", session_rules=mcx),
+    ]
+    for k in range(0, 21, 3):
+        d = date(2025, 1, 2) + timedelta(days=k)
+        scored = e.score_assets(assets, d)
+        for a in assets:
+            assert scored[a.id][1] == _slot_by_slot(a, d), (a.id, d)
+
+    assert e.compute_daily_bands(assets[0], date(2025, 1, 3)).bands == e.score_assets(assets[:1], date(2025, 1, 3))["NIFTY_50"][1]
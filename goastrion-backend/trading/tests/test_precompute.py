@@ -0,0 +1,27 @@
+import pytest
+from datetime import date
+from trading.models import SessionRules, TradingAsset, TradingDaily
+from trading.services.engine import score_assets
+from trading.services.precompute import precompute
+
+@pytest.mark.django_db
+def test_precompute_is_idempotent_and_tracks_inputs():
+    nse = SessionRules.objects.create(name="NSE", tz_str="Asia/Kolkata", open_1="09:15", close_1="15:30")
+    mcx = SessionRules.objects.create(name="MCX", tz_str="Asia/Kolkata", open_1="09:00", close_1="23:30")
+    TradingAsset.objects.create(id="NIFTY_50", name="NIFTY 50", kind="index", session_rules=nse)
+    TradingAsset.objects.create(id="NIFTY_BANK", name="NIFTY BANK", kind="sector", session_rules=nse)
+    gold = TradingAsset.objects.create(id="MCX_GOLD", name="Gold", kind="commodity", session_rules=mcx)
+    start = date(2025, 3, 3)
+
+    r = precompute(2, start, workers=1)
+    assert (r["written"], r["skipped"]) == (9, 0)
+    row = TradingDaily.objects.get(asset=gold, date=start)
+    assert row.bands == score_assets([gold], start)["MCX_GOLD"][1] and row.inputs_hash
+
+    assert (precompute(2, start, workers=1)["written"]) == 0
+    mcx.close_1 = "23:55"; mcx.save()
+    r = precompute(2, start, workers=1)
+    assert (r["written"], r["skipped"]) == (3, 6)
+    assert TradingDaily.objects.get(asset=gold, date=start).session_end == "23:55"
+    assert precompute(2, start, workers=1, force=True)["written"] == 9
+    assert TradingDaily.objects.count() == 9
@@ -0,0 +1,63 @@
+import pytest
+from datetime import date
+from django.core.cache import caches
+from django.test import Client
+from django.utils import timezone
+from trading.models import SessionRules, TradingAsset, TradingDaily
+from trading.services import response_cache as rc
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    caches[rc.CACHE_ALIAS].clear(); yield; caches[rc.CACHE_ALIAS].clear()
+
+def test_stale_entry_served_while_refreshing(monkeypatch):
+    refreshes = []
+    monkeypatch.setattr(rc, "_submit", lambda *a: (refreshes.append(a[0]), rc._refresh(*a)))
+    assert rc.cached_page("sectors", {"date": "2025-03-03"}, lambda: {"v": 1}) == {"v": 1}
+    assert rc.cached_page("sectors", {"date": "2025-03-03"}, lambda: {"v": 2}) == {"v": 1}   # fresh
+    assert not refreshes
+
+    monkeypatch.setitem(rc.FRESH_SECONDS, "sectors", -1)
+    rc._store(rc.response_key("sectors", {"date": "2025-03-03"}), "sectors", {"v": 0})   # already stale
+    assert rc.cached_page("sectors", {"date": "2025-03-03"}, lambda: {"v": 3}) == {"v": 0}   # stale + refresh
+    assert len(refreshes) == 1
+    assert rc._get(refreshes[0])[1] == {"v": 3}
+
+@pytest.mark.django_db
+def test_warm_fills_what_the_views_ask_for(monkeypatch, django_assert_num_queries):
+    nse = SessionRules.objects.create(name="NSE", tz_str="Asia/Kolkata", open_1="09:15", close_1="15:30")
+    TradingAsset.objects.create(id="NIFTY_50", name="NIFTY 50", kind="index", session_rules=nse)
+    TradingAsset.objects.create(id="NIFTY_BANK", name="NIFTY BANK", kind="sector", session_rules=nse)
+    assert rc.warm(1, date(2025, 3, 3)) == 0 and rc._get(rc.response_key("sectors", {"date": "2025-03-03"})) is None
+    monkeypatch.setattr(rc, "shared_cache", lambda: True)
+    assert rc.warm(1, date(2025, 3, 3)) == 2 * (1 + 5 + 4)
+
+    monkeypatch.setattr(rc, "_store", lambda *a: pytest.fail("built on the request path"))
+    c = Client(HTTP_HOST="localhost")
+    with django_assert_num_queries(0):
+        r = c.get("/api/trading/day-summary/?date=2025-03-04&scope=all&limit=1")
+    assert r.status_code == 200 and len(r.json()["ranked"]) <= 1
+    assert c.get("/api/trading/sectors/?date=2025-03-03").json()["sectors"][0]["asset"] == "NIFTY_BANK"
+    assert c.get("/api/trading/week/?asset=NIFTY_50&start=2025-03-04").status_code == 200
+
+@pytest.mark.django_db
+def test_trading_conditional_get():
+    nse = SessionRules.objects.create(name="NSE", tz_str="Asia/Kolkata", open_1="09:15", close_1="15:30")
+    TradingAsset.objects.create(id="NIFTY_BANK", name="NIFTY BANK", kind="sector", session_rules=nse)
+    c = Client(HTTP_HOST="localhost")
+    for url in ("/api/trading/intraday-top/?asset=NIFTY_BANK&date=2025-03-03",
+                "/api/trading/week/?asset=NIFTY_BANK&start=2025-03-03",
+                "/api/trading/sectors/?date=2025-03-03"):
+        r = c.get(url)
+        assert r.status_code == 200 and r["ETag"] and r["Last-Modified"] and r["Cache-Control"] == "no-cache"
+        hit = c.get(url, HTTP_IF_NONE_MATCH=r["ETag"])
+        assert hit.status_code == 304 and hit.content == b"" and hit["ETag"] == r["ETag"]
+        assert c.get(url, HTTP_IF_MODIFIED_SINCE=r["Last-Modified"]).status_code == 304
+        assert c.get(url, HTTP_IF_NONE_MATCH='"other"', HTTP_IF_MODIFIED_SINCE=r["Last-Modified"]).status_code == 200
+
+    url = "/api/trading/day-summary/?date=2025-03-03&scope=all&limit="
+    assert c.get(url + "1")["ETag"] != c.get(url + "2")["ETag"]
+
+    caches[rc.CACHE_ALIAS].clear()
+    TradingDaily.objects.filter(date=date(2025, 3, 3)).update(generated_at=timezone.now())
+    assert c.get("/api/trading/sectors/?date=2025-03-03", HTTP_IF_NONE_MATCH=r["ETag"]).status_code == 200
@@ -1,43 +1,24 @@
 # goastrion-backend/trading/views.py
 from __future__ import annotations
 
-from datetime import date as date_cls, datetime, timedelta
+from datetime import date as date_cls, datetime
 from typing import Optional
 
 from django.utils import timezone
 from django.utils.dateparse import parse_date
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.throttling import ScopedRateThrottle
 
-from .models import TradingAsset, TradingDaily
-from .services.engine import compute_daily_bands, ENGINE_VERSION
-from .services.selector import pick_big_move_windows, extract_directional_windows
+from astro.utils.conditional import make_etag, not_modified, stamp
+from .models import TradingAsset
+from .services.payloads import Page, day_summary_page, get_asset, intraday_page, sectors_page, week_page
+from .services.response_cache import cached_page
 
 
-# ----------------------------- scoring helpers -----------------------------
-
-
-VOL_BONUS = {"low": 0, "med": 5, "high": 10}
-
-
-def _window_score(w: dict) -> int:
-    """
-    Composite score: confidence + peak_score + volatility bonus - caution - uncertain penalty.
-    """
-    conf = int(w.get("confidence") or 0)
-    peak = int(w.get("peak_score") or 0)
-    vol = (w.get("volatility") or "").lower()
-    vol_bonus = VOL_BONUS.get(vol, 0)
-    caution_penalty = -10 if w.get("caution") else 0
-    label = (w.get("label") or "")
-    dir_penalty = 0 if ("Up" in label or "Down" in label) else -4
-    return conf + peak + vol_bonus + caution_penalty + dir_penalty
-
+# --------------------------------- helpers ---------------------------------
 
 def _parse_date(s: Optional[str]) -> date_cls:
     """
@@ -55,25 +36,21 @@ def _parse_date(s: Optional[str]) -> date_cls:
 
 
 def _get_asset_or_400(request) -> Optional[TradingAsset]:
-    aid = request.GET.get("asset") or "NIFTY_50"
-    try:
-        return TradingAsset.objects.get(pk=aid)
-    except TradingAsset.DoesNotExist:
-        return None
+    return get_asset(request.GET.get("asset") or "NIFTY_50")
+
+
+def _respond(request, page: Page):
+    """304 if the client's copy is current (no body is rendered), else the page with its validators."""
+    return not_modified(request, page.etag, page.last_modified) or stamp(Response(page.body), page.etag, page.last_modified)
 
 
-SCOPE_TO_KINDS = {
-    "all": None,
-    "indices": ("index",),
-    "sectors": ("sector",),
-    "commodities": ("commodity",),
-    "crypto": ("crypto",),
-}
 
 
 # --------------------------------- views -----------------------------------
+# Bodies come from the stale-while-revalidate cache (services.response_cache),
+# keyed by endpoint + normalized params + ENGINE_VERSION, and answer
+# If-None-Match / If-Modified-Since with 304.
 
-@method_decorator(cache_page(60 * 5), name="dispatch")
 class IntradayTopView(APIView):
     """
     GET /api/trading/intraday-top/?asset=:ID&date=YYYY-MM-DD
@@ -88,20 +65,10 @@ class IntradayTopView(APIView):
             return Response({"error": "Unknown asset"}, status=400)
 
         d = _parse_date(request.GET.get("date"))
-        daily = TradingDaily.objects.filter(asset=asset, date=d).first() or compute_daily_bands(asset, d)
-        windows = pick_big_move_windows(daily.bands) or []
+        params = {"asset": asset.id, "date": d.isoformat()}
+        return _respond(request, cached_page("intraday", params, lambda: intraday_page(asset, d)))
 
-        payload = dict(
-            asset=asset.id,
-            tz=asset.tz,
-            session={"start": daily.session_start, "end": daily.session_end},
-            windows=windows,
-            engine_version=daily.engine_version or ENGINE_VERSION,
-        )
-        return Response(payload)
 
-
-@method_decorator(cache_page(60 * 10), name="dispatch")
 class SectorsTodayView(APIView):
     """
     GET /api/trading/sectors/?date=YYYY-MM-DD
@@ -112,19 +79,9 @@ class SectorsTodayView(APIView):
 
     def get(self, request):
         d = _parse_date(request.GET.get("date"))
-        sectors = TradingAsset.objects.filter(kind="sector", status="active").order_by("id")
-
-        out = []
-        for asset in sectors:
-            daily = TradingDaily.objects.filter(asset=asset, date=d).first() or compute_daily_bands(asset, d)
-            up = extract_directional_windows(daily.bands, direction="up", limit=3)
-            down = extract_directional_windows(daily.bands, direction="down", limit=3)
-            out.append({"asset": asset.id, "up": up, "down": down})
-
-        return Response({"date": d.isoformat(), "tz": "Asia/Kolkata", "sectors": out})
+        return _respond(request, cached_page("sectors", {"date": d.isoformat()}, lambda: sectors_page(d)))
 
 
-@method_decorator(cache_page(60 * 10), name="dispatch")
 class WeekView(APIView):
     """
     GET /api/trading/week/?asset=:ID&start=YYYY-MM-DD
@@ -140,40 +97,10 @@ class WeekView(APIView):
             return Response({"error": "Unknown asset"}, status=400)
 
         start_d = _parse_date(request.GET.get("start"))
-        days = []
-        cur = start_d
-        target = 7 if asset.kind == "crypto" else 5
-
-        best = None  # {"date": "...", "score": int, "window": {...}}
-
-        while len(days) < target:
-            # Skip weekends for non-crypto
-            if asset.kind != "crypto" and cur.weekday() >= 5:
-                cur += timedelta(days=1)
-                continue
-
-            daily = TradingDaily.objects.filter(asset=asset, date=cur).first() or compute_daily_bands(asset, cur)
-            windows = pick_big_move_windows(daily.bands) or []
-            days.append({"date": cur.isoformat(), "windows": windows})
-
-            if windows:
-                topw = max(windows, key=_window_score)
-                sc = _window_score(topw)
-                cand = {"date": cur.isoformat(), "score": sc, "window": topw}
-                if (best is None) or (sc > best["score"]):
-                    best = cand
-
-            cur += timedelta(days=1)
-
-        return Response({
-            "asset": asset.id,
-            "tz": asset.tz,
-            "best_day": best,
-            "days": days,
-        })
+        params = {"asset": asset.id, "start": start_d.isoformat()}
+        return _respond(request, cached_page("week", params, lambda: week_page(asset, start_d)))
 
 
-@method_decorator(cache_page(60 * 5), name="dispatch")
 class DaySummaryView(APIView):
     """
     GET /api/trading/day-summary/?date=YYYY-MM-DD&scope=all|indices|sectors|commodities|crypto&limit=5
@@ -191,41 +118,7 @@ class DaySummaryView(APIView):
         except ValueError:
             limit = 5
 
-        kind_filter = SCOPE_TO_KINDS.get(scope)
-        assets_qs = TradingAsset.objects.filter(status="active")
-        if kind_filter:
-            assets_qs = assets_qs.filter(kind__in=kind_filter)
-
-        ranked = []
-        for asset in assets_qs:
-            daily = TradingDaily.objects.filter(asset=asset, date=day).first() or compute_daily_bands(asset, day)
-            windows = pick_big_move_windows(daily.bands) or []
-            if not windows:
-                continue
-
-            topw = max(windows, key=_window_score)
-            sc = _window_score(topw)
-
-            ranked.append({
-                "asset": asset.id,  # string PK like "NIFTY_50"
-                "score": sc,
-                "start": topw.get("start"),
-                "end": topw.get("end"),
-                "label": topw.get("label"),
-                "confidence": topw.get("confidence"),
-                "volatility": topw.get("volatility"),
-                "reasons": topw.get("reasons") or [],
-                "caution": bool(topw.get("caution")),
-                "peak_score": topw.get("peak_score"),
-            })
-
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-        top_asset = ranked[0] if ranked else None
-
-        return Response({
-            "date": day.isoformat(),
-            "tz": "Asia/Kolkata",
-            "scope": scope,
-            "top_asset": top_asset,
-            "ranked": ranked[:limit],
-        })
+        params = {"date": day.isoformat(), "scope": scope}
+        page = cached_page("day_summary", params, lambda: day_summary_page(day, scope))
+        body = {**page.body, "ranked": page.body["ranked"][:limit]}
+        return _respond(request, page._replace(body=body, etag=make_etag(page.etag, limit)))